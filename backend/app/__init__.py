@@ -10,6 +10,8 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 
 from app.exceptions import ConfigurationException
+from app.utils import sqlite_functions  # registers SQLite aggregates on import
+from app.utils.read_replica import ReplicaRoutingSession
 
 # Try to import optional extensions, but don't fail if they're not installed
 try:
@@ -41,7 +43,7 @@ except ImportError:
     swagger_available = False
 
 # Initialize core extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": ReplicaRoutingSession})
 
 # Initialize optional extensions
 if migrate_available:
@@ -68,6 +70,7 @@ def _setup_middleware(app):
     """
     from app.middleware import validation
     from app.middleware.audit import setup_audit_middleware
+    from app.middleware.authorization import setup_authorization_middleware
     from app.middleware.metrics import setup_metrics_middleware
     from app.middleware.request_id import setup_request_id_middleware
     from app.middleware.tenant import setup_tenant_context
@@ -77,6 +80,7 @@ def _setup_middleware(app):
     setup_request_id_middleware(app)
     setup_metrics_middleware(app)
     setup_audit_middleware(app)
+    setup_authorization_middleware(app)
 
     # Set up tenant context middleware for multi-tenancy
     @app.before_request
@@ -212,6 +216,8 @@ def create_app(config_name=None):
         load_config_object,
     )
     from app.refactor_helpers import configure_debug_mode, setup_logging_level
+    from app.utils.json_provider import init_json_provider
+    from app.utils.url_converters import init_url_converters
 
     # Create Flask app with static folder for React build
     app = Flask(__name__, static_folder='../dist', static_url_path='')
@@ -235,6 +241,12 @@ def create_app(config_name=None):
     # Set up logging levels
     setup_logging_level(app, app.logger)
 
+    # Serialize JSON responses with orjson when available
+    init_json_provider(app)
+
+    # Register URL converters before any blueprint adds its rules
+    init_url_converters(app)
+
     # Initialize core extensions (db, migrate, jwt)
     initialize_core_extensions(app)
 
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from datetime import timedelta
 from typing import Any
 
 from config import config
@@ -75,6 +76,12 @@ def initialize_core_extensions(app: Any) -> None:
     if jwt:
         jwt.init_app(app)
 
+    # /auth/refresh reports the access token lifetime; it is fixed for the
+    # app's lifetime, so convert it once here instead of on every request
+    access_expires = app.config.get("JWT_ACCESS_TOKEN_EXPIRES")
+    if isinstance(access_expires, timedelta):
+        app.config["JWT_ACCESS_TOKEN_EXPIRES_SECONDS"] = access_expires.total_seconds()
+
 
 def configure_cors(app: Any) -> None:
     """Configure CORS if available.
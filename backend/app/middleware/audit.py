@@ -4,21 +4,30 @@ This middleware provides comprehensive audit logging for security-critical opera
 including authentication, authorization, and data modification events.
 """
 
+import atexit
+import logging
+import queue
 import re
 from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from flask import has_request_context, request
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
-from app.middleware.request_id import RequestIDManager
-from app.models import User
+from app.middleware.request_id import RequestIDFilter, RequestIDManager
 from app.utils.secure_logger import SecureLogger
 
 logger = SecureLogger.get_secure_logger(__name__)
 
+# Bound on audit records waiting for the background writer
+AUDIT_QUEUE_MAXSIZE = 10000
+
+_audit_queue_handler: QueueHandler | None = None
+_audit_queue_listener: QueueListener | None = None
+
 # Sensitive fields that should be redacted in audit logs
 SENSITIVE_FIELDS = {
     "password",
@@ -187,6 +196,14 @@ class AuditSeverity(Enum):
     CRITICAL = "critical"
 
 
+_SEVERITY_LOG_LEVELS = {
+    AuditSeverity.INFO: logging.INFO,
+    AuditSeverity.WARNING: logging.WARNING,
+    AuditSeverity.ERROR: logging.ERROR,
+    AuditSeverity.CRITICAL: logging.CRITICAL,
+}
+
+
 class AuditLogger:
     """Centralized audit logging functionality."""
 
@@ -220,6 +237,11 @@ class AuditLogger:
             user_agent: Client user agent
 
         """
+        # Skip building (and redacting) the record when it would be discarded,
+        # e.g. INFO-level permission grants under LOG_LEVEL=WARNING
+        if not logger.isEnabledFor(_SEVERITY_LOG_LEVELS[severity]):
+            return
+
         try:
             # Get request context information
             request_id = (
@@ -241,7 +263,11 @@ class AuditLogger:
                     verify_jwt_in_request(optional=True)
                     current_user_id_str = get_jwt_identity()
                     if current_user_id_str:
-                        user = User.query.get(int(current_user_id_str))
+                        from app.middleware.authorization import (  # noqa: PLC0415 - authorization imports this module
+                            load_auth_user,
+                        )
+
+                        user = load_auth_user(int(current_user_id_str))
                         if user:
                             user_id = user.id
                             username = user.username
@@ -394,7 +420,11 @@ def audit_operation(
                     verify_jwt_in_request(optional=True)
                     current_user_id_str = get_jwt_identity()
                     if current_user_id_str:
-                        user = User.query.get(int(current_user_id_str))
+                        from app.middleware.authorization import (  # noqa: PLC0415 - authorization imports this module
+                            load_auth_user,
+                        )
+
+                        user = load_auth_user(int(current_user_id_str))
                         if user:
                             user_id = user.id
                             username = user.username
@@ -469,6 +499,61 @@ def audit_operation(
     return decorator
 
 
+class _RootLoggerHandler(logging.Handler):
+    """Pass records on to whatever handlers the root logger has now."""
+
+    def emit(self, record):
+        logging.getLogger().handle(record)
+
+
+class _AuditQueueHandler(QueueHandler):
+    """Queue audit records without blocking; write inline when the queue is full."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Never drop audit events: fall back to a synchronous write
+            logging.getLogger().handle(record)
+
+
+def enable_async_audit_logging():
+    """Write audit records from a background thread instead of the request path.
+
+    Records are formatted and stamped with the request ID in the request
+    thread, then handed to the root logger's handlers by a QueueListener.
+    """
+    global _audit_queue_handler, _audit_queue_listener
+    if _audit_queue_listener is not None:
+        return
+
+    audit_queue = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    _audit_queue_handler = _AuditQueueHandler(audit_queue)
+    _audit_queue_handler.addFilter(RequestIDFilter())
+    _audit_queue_listener = QueueListener(audit_queue, _RootLoggerHandler())
+
+    audit_logger = logger.logger
+    audit_logger.addHandler(_audit_queue_handler)
+    audit_logger.propagate = False
+    _audit_queue_listener.start()
+
+
+def disable_async_audit_logging():
+    """Flush queued audit records and go back to writing them inline."""
+    global _audit_queue_handler, _audit_queue_listener
+    if _audit_queue_listener is None:
+        return
+
+    audit_logger = logger.logger
+    audit_logger.removeHandler(_audit_queue_handler)
+    audit_logger.propagate = True
+    _audit_queue_listener.stop()
+    _audit_queue_handler = _audit_queue_listener = None
+
+
+atexit.register(disable_async_audit_logging)
+
+
 def setup_audit_middleware(app):
     """Set up audit logging middleware for the Flask app."""
     # Define endpoints/paths to exclude from audit logging
@@ -482,6 +567,9 @@ def setup_audit_middleware(app):
         "/swaggerui",
     ]
 
+    if app.config.get("AUDIT_ASYNC_LOGGING"):
+        enable_async_audit_logging()
+
     @app.before_request
     def audit_api_access():
         """Log API access for auditing."""
@@ -4,16 +4,40 @@ This module provides decorators for checking user permissions and roles.
 It separates authorization (what users can do) from authentication (who they are).
 """
 
+import json
 from functools import wraps
+from threading import RLock
+from typing import NamedTuple
 
-from flask import current_app, request
+from cachetools import TTLCache
+from flask import current_app, g, request
 from flask_jwt_extended import verify_jwt_in_request
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload
 
 from app.middleware.audit import audit_permission_check
-from app.models import User
+from app.models import PermissionEnum, Role, User, db
 from app.utils.error_handler import SecurityAwareErrorHandler
 from app.utils.helpers import get_current_user_id
 
+# Authorization snapshots are cached per user id for a short time so bursts of
+# API calls do not reload the user, role and permissions on every request.
+AUTH_USER_CACHE_TTL_SECONDS = 30.0
+_auth_user_cache = TTLCache(maxsize=4096, ttl=AUTH_USER_CACHE_TTL_SECONDS)
+_auth_user_cache_lock = RLock()
+
+
+class _AuthUser(NamedTuple):
+    """Authorization-relevant snapshot of a User row."""
+
+    id: int
+    username: str
+    is_active: bool
+    has_role: bool
+    role_name: str | None
+    has_direct_permissions: bool
+    permissions: frozenset
+
 
 def _ensure_user_has_role(user):
     """Ensure user has a valid role assigned.
@@ -42,6 +66,151 @@ def _ensure_user_has_role(user):
     return True
 
 
+def _permission_name(permission):
+    """Normalize a permission string or PermissionEnum to its string value."""
+    if isinstance(permission, PermissionEnum):
+        return permission.value
+    return permission
+
+
+def _candidate_permission_names(user):
+    """Names ``user.has_permission`` could grant.
+
+    Role permissions are always ``PermissionEnum`` values, but direct user
+    permissions are free-form strings, so those are added as stored.
+    """
+    names = {p.value for p in PermissionEnum}
+    direct = user.permissions
+    if isinstance(direct, str):
+        # Some databases hand the JSON column back as text
+        try:
+            direct = json.loads(direct)
+        except ValueError:
+            direct = None
+    if isinstance(direct, list):
+        names.update(p for p in direct if isinstance(p, str))
+    return names
+
+
+def _snapshot_user(user):
+    """Build the cached authorization snapshot for ``user``."""
+    has_role = bool(user.is_active) and _ensure_user_has_role(user)
+    return _AuthUser(
+        id=user.id,
+        username=user.username,
+        is_active=user.is_active,
+        has_role=has_role,
+        role_name=user.role.name.value if has_role else None,
+        has_direct_permissions=bool(user.permissions),
+        permissions=(
+            frozenset(
+                name
+                for name in _candidate_permission_names(user)
+                if user.has_permission(name)
+            )
+            if has_role
+            else frozenset()
+        ),
+    )
+
+
+def load_auth_user(user_id):
+    """Fetch ``user_id`` with its role and the role's permissions preloaded.
+
+    Permission checks walk ``user.role.permissions``; joining both into the
+    user lookup returns user, role and permissions in a single round trip
+    instead of two extra lazy loads per request. The loaded user is memoized
+    on ``g`` so the tenant middleware, decorators and the view share one
+    lookup; it is dropped when the request is torn down.
+    """
+    cached = g.get("_auth_user")
+    if cached is not None and str(cached.id) == str(user_id):
+        return cached
+
+    user = db.session.get(
+        User,
+        user_id,
+        options=[joinedload(User.role).joinedload(Role.permissions)],
+    )
+    if user is not None:
+        g._auth_user = user
+    return user
+
+
+def setup_authorization_middleware(app):
+    """Register the teardown that clears the per-request user memos."""
+
+    @app.teardown_request
+    def clear_auth_user(exc):
+        g.pop("_auth_user", None)
+        g.pop("_auth_snapshot", None)
+
+
+def _get_auth_user(user_id):
+    """Return the authorization snapshot for ``user_id`` or None if not found.
+
+    Snapshots are served from a process-local TTL cache when
+    ``AUTH_USER_CACHE_ENABLED`` is set; changes to users or roles made through
+    the ORM evict them immediately, anything else within the TTL. Within a
+    request the snapshot is also kept on ``g``, so stacked permission and role
+    checks reuse its precomputed permission set.
+    """
+    snapshot = g.get("_auth_snapshot")
+    if snapshot is not None and str(snapshot.id) == str(user_id):
+        return snapshot
+
+    use_cache = current_app.config.get("AUTH_USER_CACHE_ENABLED", True)
+    if use_cache:
+        with _auth_user_cache_lock:
+            cached = _auth_user_cache.get(user_id)
+        if cached is not None:
+            g._auth_snapshot = cached
+            return cached
+
+    user = load_auth_user(user_id)
+    if not user:
+        return None
+
+    snapshot = _snapshot_user(user)
+    if use_cache:
+        with _auth_user_cache_lock:
+            _auth_user_cache[user_id] = snapshot
+    g._auth_snapshot = snapshot
+    return snapshot
+
+
+def invalidate_auth_cache(user_id=None):
+    """Evict one user's cached authorization snapshot, or all of them."""
+    with _auth_user_cache_lock:
+        if user_id is None:
+            _auth_user_cache.clear()
+        else:
+            # Identities arrive from the JWT as int or str depending on caller
+            _auth_user_cache.pop(user_id, None)
+            _auth_user_cache.pop(str(user_id), None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_updated_user(mapper, connection, target):
+    invalidate_auth_cache(target.id)
+
+
+@event.listens_for(Role, "after_update")
+@event.listens_for(Role, "after_delete")
+def _evict_role_members(mapper, connection, target):
+    invalidate_auth_cache()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _evict_on_bulk_user_change(orm_execute_state):
+    # Query.update()/delete() (e.g. batch activation) bypass mapper events
+    if (
+        orm_execute_state.is_update or orm_execute_state.is_delete
+    ) and orm_execute_state.bind_mapper is User.__mapper__:
+        invalidate_auth_cache()
+
+
 def permission_required(permission):
     """Decorator to check if user has required permission.
 
@@ -83,8 +252,8 @@ def permission_required(permission):
                     401,
                 )
 
-            # Retrieve user from database
-            user = User.query.get(user_id)
+            # Retrieve user (cached authorization snapshot)
+            user = _get_auth_user(user_id)
 
             if not user or not user.is_active:
                 # Audit failed permission check - user not found/inactive
@@ -108,7 +277,7 @@ def permission_required(permission):
             if user.username == "emergency_admin" and user.is_active:
                 # Validate that emergency_admin has permissions configured
                 # This prevents security issues if user exists but isn't properly set up
-                if not user.permissions:
+                if not user.has_direct_permissions:
                     current_app.logger.warning(
                         f"Emergency admin bypass denied: {user.username} has no permissions configured",
                         extra={
@@ -136,13 +305,13 @@ def permission_required(permission):
                         resource=request.endpoint if request else None,
                         details={
                             "bypass": "emergency_admin",
-                            "user_role": user.role.name.value if user.role else "N/A",
+                            "user_role": user.role_name or "N/A",
                         },
                     )
                     return f(*args, **kwargs)
 
             # Ensure user has a valid role
-            if not _ensure_user_has_role(user):
+            if not user.has_role:
                 audit_permission_check(
                     permission=permission,
                     granted=False,
@@ -158,7 +327,7 @@ def permission_required(permission):
                 )
 
             # Check if user has the required permission
-            if not user.has_permission(permission):
+            if _permission_name(permission) not in user.permissions:
                 # Audit denied permission
                 audit_permission_check(
                     permission=permission,
@@ -168,7 +337,7 @@ def permission_required(permission):
                     resource=request.endpoint if request else None,
                     details={
                         "reason": "Insufficient permissions",
-                        "user_role": user.role.name.value,
+                        "user_role": user.role_name,
                     },
                 )
                 return SecurityAwareErrorHandler.handle_service_error(
@@ -185,7 +354,7 @@ def permission_required(permission):
                 user_id=user.id,
                 username=user.username,
                 resource=request.endpoint if request else None,
-                details={"user_role": user.role.name.value},
+                details={"user_role": user.role_name},
             )
 
             return f(*args, **kwargs)
@@ -213,6 +382,9 @@ def role_required(*roles):
             pass
 
     """
+    # Built once when the decorator is applied, not on every request
+    allowed_roles = frozenset(roles)
+    role_permission = f"role:{','.join(roles)}"
 
     def decorator(f):
         @wraps(f)
@@ -225,7 +397,7 @@ def role_required(*roles):
             if not success or user_id is None:
                 # Audit failed role check
                 audit_permission_check(
-                    permission=f"role:{','.join(roles)}",
+                    permission=role_permission,
                     granted=False,
                     details={"reason": "Invalid token format"},
                 )
@@ -236,13 +408,13 @@ def role_required(*roles):
                     401,
                 )
 
-            # Retrieve user from database
-            user = User.query.get(user_id)
+            # Retrieve user (cached authorization snapshot)
+            user = _get_auth_user(user_id)
 
             if not user or not user.is_active:
                 # Audit failed role check - user not found/inactive
                 audit_permission_check(
-                    permission=f"role:{','.join(roles)}",
+                    permission=role_permission,
                     granted=False,
                     user_id=user_id,
                     username=user.username if user else None,
@@ -261,7 +433,7 @@ def role_required(*roles):
             if user.username == "emergency_admin" and user.is_active:
                 # Validate that emergency_admin has permissions configured
                 # This prevents security issues if user exists but isn't properly set up
-                if not user.permissions:
+                if not user.has_direct_permissions:
                     current_app.logger.warning(
                         f"Emergency admin role bypass denied: {user.username} has no permissions configured",
                         extra={
@@ -282,22 +454,22 @@ def role_required(*roles):
                     )
                     # Audit successful role check with bypass note
                     audit_permission_check(
-                        permission=f"role:{','.join(roles)}",
+                        permission=role_permission,
                         granted=True,
                         user_id=user.id,
                         username=user.username,
                         resource=request.endpoint if request else None,
                         details={
                             "bypass": "emergency_admin",
-                            "user_role": user.role.name.value if user.role else "N/A",
+                            "user_role": user.role_name or "N/A",
                         },
                     )
                     return f(*args, **kwargs)
 
             # Ensure user has a valid role
-            if not _ensure_user_has_role(user):
+            if not user.has_role:
                 audit_permission_check(
-                    permission=f"role:{','.join(roles)}",
+                    permission=role_permission,
                     granted=False,
                     user_id=user.id,
                     username=user.username,
@@ -311,17 +483,17 @@ def role_required(*roles):
                 )
 
             # Check if user has one of the required roles
-            if user.role.name.value not in roles:
+            if user.role_name not in allowed_roles:
                 # Audit denied role check
                 audit_permission_check(
-                    permission=f"role:{','.join(roles)}",
+                    permission=role_permission,
                     granted=False,
                     user_id=user.id,
                     username=user.username,
                     resource=request.endpoint if request else None,
                     details={
                         "reason": "Insufficient role permissions",
-                        "user_role": user.role.name.value,
+                        "user_role": user.role_name,
                         "required_roles": list(roles),
                     },
                 )
@@ -334,12 +506,12 @@ def role_required(*roles):
 
             # Audit successful role check
             audit_permission_check(
-                permission=f"role:{','.join(roles)}",
+                permission=role_permission,
                 granted=True,
                 user_id=user.id,
                 username=user.username,
                 resource=request.endpoint if request else None,
-                details={"user_role": user.role.name.value},
+                details={"user_role": user.role_name},
             )
 
             return f(*args, **kwargs)
@@ -10,6 +10,24 @@ from typing import ClassVar
 import redis
 from flask import current_app, g, jsonify, request
 
+# Sliding-window check in a single atomic round trip: trim entries older than
+# the window, count the rest and record this request only if it is allowed.
+# Returns {allowed (1/0), requests in the window before this one}.
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('EXPIRE', key, window + 1)
+    return {1, count}
+end
+return {0, count}
+"""
+
 
 class RateLimiter:
     """Redis-based rate limiter with sliding window algorithm."""
@@ -17,6 +35,10 @@ class RateLimiter:
     def __init__(self, redis_client: redis.Redis | None = None):
         self.redis_client = redis_client
         self._in_memory_cache = {}  # Fallback when Redis unavailable
+        # Script objects call EVALSHA and reload the script on NOSCRIPT
+        self._sliding_window = (
+            redis_client.register_script(SLIDING_WINDOW_LUA) if redis_client else None
+        )
 
     def _get_client_key(self, identifier: str) -> str:
         """Generate Redis key for rate limiting."""
@@ -91,28 +113,20 @@ class RateLimiter:
         window_seconds: int,
         current_time: float,
     ) -> tuple[bool, dict]:
-        """Check rate limit using Redis sliding window."""
+        """Check rate limit using an atomic Redis sliding window script."""
         key = self._get_client_key(identifier)
-        pipe = self.redis_client.pipeline()
-
-        # Remove old entries and count current requests
-        window_start = current_time - window_seconds
-        pipe.zremrangebyscore(key, 0, window_start)
-        pipe.zcard(key)
-        pipe.zadd(key, {str(current_time): current_time})
-        pipe.expire(key, window_seconds + 1)
-
-        results = pipe.execute()
-        current_count = results[1] + 1  # +1 for the request we just added
-
-        is_allowed = current_count <= limit
+        # Unique member so concurrent requests with equal timestamps all count
+        member = f"{current_time}:{uuid.uuid4().hex}"
+        allowed, previous_count = self._sliding_window(
+            keys=[key],
+            args=[current_time, window_seconds, limit, member],
+        )
+
+        current_count = int(previous_count) + 1  # +1 for this request
+        is_allowed = bool(allowed)
         remaining = max(0, limit - current_count)
         reset_time = int(current_time + window_seconds)
 
-        if not is_allowed:
-            # Remove the request we added since it's not allowed
-            self.redis_client.zrem(key, str(current_time))
-
         return is_allowed, {
             "limit": limit,
             "remaining": remaining,
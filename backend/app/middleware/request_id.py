@@ -86,6 +86,10 @@ class RequestIDFilter(logging.Filter):
     def filter(self, record):
         """Add request ID to log record."""
         request_id = RequestIDManager.get_request_id()
+        if request_id is None:
+            # Records written from another thread (e.g. the audit queue) keep
+            # the ID stamped on them in the request thread
+            request_id = getattr(record, "request_id", None)
         record.request_id = request_id or "no-request-context"
 
         # Also add it to the extra data for structured logging
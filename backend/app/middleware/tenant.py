@@ -14,7 +14,7 @@ from flask import g, request
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 from sqlalchemy import inspect
 
-from app.models import User
+from app.middleware.authorization import load_auth_user
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +75,8 @@ def setup_tenant_context():
         if not user_id:
             return
 
-        # Get user from database
-        user = User.query.get(user_id)
+        # Get user from database (shared with the authorization decorators)
+        user = load_auth_user(user_id)
         if not user:
             return
 
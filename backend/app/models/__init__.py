@@ -1,8 +1,12 @@
 """Database models for ThermaCore SCADA system."""
 
+import secrets
+from contextlib import suppress
 from datetime import datetime, timezone
 from enum import Enum as PyEnum
+from functools import lru_cache
 
+from flask import current_app, has_app_context
 from sqlalchemy import (
     Boolean,
     Column,
@@ -10,10 +14,12 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship, validates
@@ -21,6 +27,64 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 from app import db
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    argon2_available = True
+except ImportError:  # pragma: no cover - argon2-cffi is listed in requirements.txt
+    PasswordHasher = None
+    argon2_available = False
+
+_ARGON2_PREFIX = "$argon2"
+# RFC 9106 low-memory profile; overridden by the ARGON2_* config values
+_ARGON2_DEFAULTS = {
+    "ARGON2_TIME_COST": 3,
+    "ARGON2_MEMORY_COST": 64 * 1024,
+    "ARGON2_PARALLELISM": 4,
+}
+
+
+@lru_cache(maxsize=8)
+def _argon2_hasher(time_cost, memory_cost, parallelism):
+    return PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+    )
+
+
+def _password_hasher():
+    """Return the Argon2id hasher for the current app's cost settings."""
+    config = current_app.config if has_app_context() else {}
+    return _argon2_hasher(
+        *(config.get(key, default) for key, default in _ARGON2_DEFAULTS.items()),
+    )
+
+
+@lru_cache(maxsize=8)
+def _dummy_password_hash(hasher):
+    if hasher is None:
+        return generate_password_hash(secrets.token_urlsafe(16), method="pbkdf2:sha256")
+    return hasher.hash(secrets.token_urlsafe(16))
+
+
+def check_dummy_password(password):
+    """Verify ``password`` against a throwaway hash and return False.
+
+    Called when a login names an unknown user so the failure costs as much
+    as a wrong password for a real account, keeping response timing from
+    revealing which usernames exist.
+    """
+    if not argon2_available:
+        check_password_hash(_dummy_password_hash(None), password)
+        return False
+
+    hasher = _password_hasher()
+    with suppress(VerificationError, InvalidHashError):
+        hasher.verify(_dummy_password_hash(hasher), password)
+    return False
+
 
 def utc_now():
     """Get current UTC time as timezone-aware datetime.
@@ -297,18 +361,44 @@ class User(db.Model):
         return f"<User {self.username}>"
 
     def set_password(self, password):
-        """Create hashed password using pbkdf2:sha256 (typically 100+ character hash).
+        """Create hashed password using Argon2id (pbkdf2:sha256 without argon2-cffi).
 
-        IMPORTANT: This application ONLY uses pbkdf2:sha256 for password hashing.
-        This method must ALWAYS be used for setting passwords to ensure consistency.
-        Direct assignment to password_hash is NOT recommended and should only be
-        used in tests with the same hashing method.
+        IMPORTANT: This method must ALWAYS be used for setting passwords to ensure
+        consistency. Direct assignment to password_hash is NOT recommended and
+        should only be used in tests.
         """
-        self.password_hash = generate_password_hash(password, method="pbkdf2:sha256")
+        if argon2_available:
+            self.password_hash = _password_hasher().hash(password)
+        else:
+            self.password_hash = generate_password_hash(
+                password,
+                method="pbkdf2:sha256",
+            )
 
     def check_password(self, password):
-        """Check password against hash."""
-        return check_password_hash(self.password_hash, password)
+        """Check password against hash.
+
+        Legacy pbkdf2:sha256 hashes are still accepted and are upgraded to
+        Argon2id on the next successful check, as are Argon2 hashes created
+        with outdated parameters. The caller is responsible for committing.
+        """
+        if self.password_hash and self.password_hash.startswith(_ARGON2_PREFIX):
+            if not argon2_available:
+                return False
+            hasher = _password_hasher()
+            try:
+                hasher.verify(self.password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+            if hasher.check_needs_rehash(self.password_hash):
+                self.set_password(password)
+            return True
+
+        if not check_password_hash(self.password_hash, password):
+            return False
+        if argon2_available:
+            self.set_password(password)
+        return True
 
     def can_login(self):
         """Check if user can login.
@@ -481,6 +571,16 @@ class Sensor(db.Model):
     """Sensor model for unit sensors."""
 
     __tablename__ = "sensors"
+    __table_args__ = (
+        # Unit -> sensors lookups, optionally by type; covers the joined
+        # columns so PostgreSQL can use an index-only scan (migration 012)
+        Index(
+            "idx_sensors_unit_type_covering",
+            "unit_id",
+            "sensor_type",
+            postgresql_include=["id", "name", "unit_of_measurement"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     unit_id = Column(String(50), ForeignKey("units.id"), nullable=False)
@@ -519,6 +619,15 @@ class SensorReading(db.Model):
     """Sensor reading model for time-series data."""
 
     __tablename__ = "sensor_readings"
+    __table_args__ = (
+        # Per-sensor time range scans, covering value (migration 012)
+        Index(
+            "idx_sensor_readings_sensor_ts_covering",
+            "sensor_id",
+            text("timestamp DESC"),
+            postgresql_include=["value"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     sensor_id = Column(Integer, ForeignKey("sensors.id"), nullable=False)
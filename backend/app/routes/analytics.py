@@ -1,10 +1,13 @@
 """Advanced analytics routes for Phase 3 SCADA integration."""
 
+import hashlib
 from datetime import timedelta
+from threading import RLock
 
-from flask import Blueprint, jsonify
+from cachetools import TTLCache
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import jwt_required
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, case, exists, func, or_, select, text, true
 from webargs.flaskparser import use_args
 
 from app.middleware.authorization import permission_required
@@ -16,6 +19,8 @@ from app.models import (
     utc_now,
 )
 from app.utils.error_handler import SecurityAwareErrorHandler
+from app.utils.helpers import epoch_millis
+from app.utils.read_replica import use_read_replica
 from app.utils.schemas import (
     AlertPatternsQuerySchema,
     PerformanceQuerySchema,
@@ -25,10 +30,135 @@ from app.utils.schemas import (
 # Create analytics blueprint
 analytics_bp = Blueprint("analytics", __name__)
 
+# The dashboard aggregates span 24h/7d windows, so a short-lived shared copy is
+# fine; clients revalidate against the ETag and get a 304 when nothing changed.
+DASHBOARD_CACHE_TTL_SECONDS = 30.0
+_dashboard_cache = TTLCache(maxsize=1, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+_dashboard_cache_lock = RLock()
+
+# Rows fetched per round trip when streaming trend readings
+TRENDS_FETCH_BATCH_SIZE = 10_000
+
+
+def clear_analytics_cache():
+    """Drop cached analytics responses (used by tests and admin tooling)."""
+    with _dashboard_cache_lock:
+        _dashboard_cache.clear()
+
+
+def _compute_dashboard_summary():
+    """Run the dashboard aggregate queries and build the summary dict."""
+    # Get time ranges
+    now = utc_now()
+    last_24h = now - timedelta(hours=24)
+    last_week = now - timedelta(days=7)
+    previous_week = last_week - timedelta(days=7)
+
+    # Every metric comes from one statement: each single-row aggregate
+    # subquery is cross-joined, so the dashboard costs one round trip.
+    unit_stats = (
+        select(
+            func.count().label("total_units"),
+            func.count(case((Unit.status == "online", 1))).label("active_units"),
+        )
+        .select_from(Unit)
+        .subquery()
+    )
+    sensor_stats = (
+        select(func.count().label("total_sensors")).select_from(Sensor).subquery()
+    )
+    # Recent readings and week-over-week trend from a single 14-day scan
+    reading_stats = (
+        select(
+            func.count(case((SensorReading.timestamp >= last_24h, 1))).label(
+                "recent_readings",
+            ),
+            func.count(case((SensorReading.timestamp >= last_week, 1))).label(
+                "current_week_readings",
+            ),
+            func.count(case((SensorReading.timestamp < last_week, 1))).label(
+                "previous_week_readings",
+            ),
+        )
+        .where(SensorReading.timestamp >= previous_week)
+        .subquery()
+    )
+    # Performance metrics: avg and max temperature in a single aggregate
+    temperature_stats = (
+        select(
+            func.avg(SensorReading.value).label("avg_temperature"),
+            func.max(SensorReading.value).label("max_temperature"),
+        )
+        .join(Sensor)
+        .where(
+            and_(
+                SensorReading.timestamp >= last_24h,
+                Sensor.sensor_type == "temperature",
+            ),
+        )
+        .subquery()
+    )
+
+    # Explicit ON TRUE joins state the cross join, so SQLAlchemy does not warn
+    # about a cartesian product between unrelated FROM clauses
+    stats = db.session.execute(
+        select(unit_stats, sensor_stats, reading_stats, temperature_stats).select_from(
+            unit_stats.join(sensor_stats, true())
+            .join(reading_stats, true())
+            .join(temperature_stats, true()),
+        ),
+    ).one()
+    total_units = stats.total_units
+    active_units = stats.active_units
+    total_sensors = stats.total_sensors
+    recent_readings = stats.recent_readings
+    current_week_readings = stats.current_week_readings
+    previous_week_readings = stats.previous_week_readings
+    avg_temperature = stats.avg_temperature or 0
+    max_temperature = stats.max_temperature or 0
+
+    summary = {
+        "overview": {
+            "total_units": total_units,
+            "active_units": active_units,
+            "total_sensors": total_sensors,
+            "recent_readings": recent_readings,
+            "uptime_percentage": (
+                (active_units / total_units * 100) if total_units > 0 else 0
+            ),
+        },
+        "trends": {
+            "current_week_readings": current_week_readings,
+            "previous_week_readings": previous_week_readings,
+            "trend_percentage": (
+                (current_week_readings - previous_week_readings)
+                / previous_week_readings
+                * 100
+                if previous_week_readings > 0
+                else 0
+            ),
+        },
+        "performance": {
+            "avg_temperature_24h": round(float(avg_temperature), 2),
+            "max_temperature_24h": round(float(max_temperature), 2),
+            "data_quality_score": (
+                min(
+                    100,
+                    (recent_readings / (active_units * 24)) * 100,
+                )
+                if active_units > 0
+                else 0
+            ),
+        },
+    }
+
+    return summary
+
 
 @analytics_bp.route("/analytics/dashboard/summary", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@use_read_replica
 def get_dashboard_summary():
     """Get comprehensive dashboard summary with analytics.
 
@@ -51,109 +181,21 @@ def get_dashboard_summary():
               type: object
     """
     try:
-        # Get time ranges
-        now = utc_now()
-        last_24h = now - timedelta(hours=24)
-        last_week = now - timedelta(days=7)
-        now - timedelta(days=30)
-
-        # Overview metrics
-        total_units = db.session.query(func.count(Unit.id)).scalar()
-        active_units = (
-            db.session.query(func.count(Unit.id))
-            .filter(Unit.status == "online")
-            .scalar()
-        )
-        total_sensors = db.session.query(func.count(Sensor.id)).scalar()
-
-        # Recent readings count
-        recent_readings = (
-            db.session.query(func.count(SensorReading.id))
-            .filter(SensorReading.timestamp >= last_24h)
-            .scalar()
-        )
-
-        # Trend analysis
-        current_week_readings = (
-            db.session.query(func.count(SensorReading.id))
-            .filter(SensorReading.timestamp >= last_week)
-            .scalar()
-        )
-
-        previous_week_readings = (
-            db.session.query(func.count(SensorReading.id))
-            .filter(
-                and_(
-                    SensorReading.timestamp >= (last_week - timedelta(days=7)),
-                    SensorReading.timestamp < last_week,
-                ),
-            )
-            .scalar()
-        )
-
-        # Performance metrics
-        avg_temperature = (
-            db.session.query(func.avg(SensorReading.value))
-            .filter(
-                and_(
-                    SensorReading.timestamp >= last_24h,
-                    Sensor.sensor_type == "temperature",
-                ),
-            )
-            .join(Sensor)
-            .scalar()
-            or 0
-        )
-
-        max_temperature = (
-            db.session.query(func.max(SensorReading.value))
-            .filter(
-                and_(
-                    SensorReading.timestamp >= last_24h,
-                    Sensor.sensor_type == "temperature",
-                ),
-            )
-            .join(Sensor)
-            .scalar()
-            or 0
-        )
-
-        summary = {
-            "overview": {
-                "total_units": total_units,
-                "active_units": active_units,
-                "total_sensors": total_sensors,
-                "recent_readings": recent_readings,
-                "uptime_percentage": (
-                    (active_units / total_units * 100) if total_units > 0 else 0
-                ),
-            },
-            "trends": {
-                "current_week_readings": current_week_readings,
-                "previous_week_readings": previous_week_readings,
-                "trend_percentage": (
-                    (current_week_readings - previous_week_readings)
-                    / previous_week_readings
-                    * 100
-                    if previous_week_readings > 0
-                    else 0
-                ),
-            },
-            "performance": {
-                "avg_temperature_24h": round(float(avg_temperature), 2),
-                "max_temperature_24h": round(float(max_temperature), 2),
-                "data_quality_score": (
-                    min(
-                        100,
-                        (recent_readings / (active_units * 24)) * 100,
-                    )
-                    if active_units > 0
-                    else 0
-                ),
-            },
-        }
-
-        return jsonify(summary)
+        with _dashboard_cache_lock:
+            cached = _dashboard_cache.get("summary")
+        if cached is None:
+            body = jsonify(_compute_dashboard_summary()).get_data()
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            cached = (body, etag)
+            with _dashboard_cache_lock:
+                _dashboard_cache["summary"] = cached
+
+        body, etag = cached
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = int(DASHBOARD_CACHE_TTL_SECONDS)
+        return response.make_conditional(request)
 
     except Exception as e:
         return SecurityAwareErrorHandler.handle_error(
@@ -165,7 +207,8 @@ def get_dashboard_summary():
 @analytics_bp.route("/analytics/trends/<unit_id>", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(TrendsQuerySchema, location="query")
+@use_args(TrendsQuerySchema(), location="query")
+@use_read_replica
 def get_unit_trends(args, unit_id):
     """Get trend analysis for a specific unit.
 
@@ -192,17 +235,15 @@ def get_unit_trends(args, unit_id):
         type: string
     responses:
       200:
-        description: Unit trend analysis
+        description: >-
+          Unit trend analysis; each sensor type carries parallel
+          ``timestamps`` (epoch milliseconds, UTC) and ``values`` arrays
+          plus ``statistics``
       404:
         description: Unit not found
 
     """
     try:
-        # Validate unit exists
-        unit = Unit.query.get(unit_id)
-        if not unit:
-            return jsonify({"error": "Unit not found"}), 404
-
         # Extract validated parameters
         days = args["days"]
         sensor_type = args.get("sensor_type")
@@ -211,8 +252,11 @@ def get_unit_trends(args, unit_id):
         now = utc_now()
         start_time = now - timedelta(days=days)
 
-        # Build query
-        query = (
+        filters = [Sensor.unit_id == unit_id, SensorReading.timestamp >= start_time]
+        if sensor_type:
+            filters.append(Sensor.sensor_type == sensor_type)
+
+        readings = (
             db.session.query(
                 SensorReading.timestamp,
                 SensorReading.value,
@@ -220,17 +264,14 @@ def get_unit_trends(args, unit_id):
                 Sensor.name,
             )
             .join(Sensor)
-            .filter(
-                and_(Sensor.unit_id == unit_id, SensorReading.timestamp >= start_time),
-            )
+            .filter(*filters)
+            .order_by(SensorReading.timestamp)
+            # Stream rows in batches (server-side cursor where supported)
+            # rather than materialising the whole window at once
+            .yield_per(TRENDS_FETCH_BATCH_SIZE)
         )
 
-        if sensor_type:
-            query = query.filter(Sensor.sensor_type == sensor_type)
-
-        readings = query.order_by(SensorReading.timestamp).all()
-
-        # Group by sensor type
+        # Group by sensor type into columnar arrays (epoch-millisecond timestamps)
         trends = {}
         for reading in readings:
             sensor_key = reading.sensor_type
@@ -238,25 +279,44 @@ def get_unit_trends(args, unit_id):
                 trends[sensor_key] = {
                     "name": reading.name,
                     "type": reading.sensor_type,
-                    "data": [],
+                    "timestamps": [],
+                    "values": [],
                 }
 
-            trends[sensor_key]["data"].append(
-                {
-                    "timestamp": reading.timestamp.isoformat(),
-                    "value": float(reading.value),
-                },
+            trend = trends[sensor_key]
+            trend["timestamps"].append(epoch_millis(reading.timestamp))
+            trend["values"].append(float(reading.value))
+
+        # Only an empty result needs the unit existence check for the 404
+        if not trends:
+            unit_exists = db.session.scalar(
+                select(exists().where(Unit.id == unit_id)),
             )
+            if not unit_exists:
+                return jsonify({"error": "Unit not found"}), 404
+            return jsonify({"unit_id": unit_id, "period_days": days, "trends": {}})
 
-        # Calculate statistics for each sensor type
-        for sensor_key in trends:
-            values = [d["value"] for d in trends[sensor_key]["data"]]
-            if values:
-                trends[sensor_key]["statistics"] = {
-                    "min": min(values),
-                    "max": max(values),
-                    "avg": sum(values) / len(values),
-                    "count": len(values),
+        # Per-sensor-type statistics are aggregated by the database
+        statistics = (
+            db.session.query(
+                Sensor.sensor_type,
+                func.min(SensorReading.value).label("min"),
+                func.max(SensorReading.value).label("max"),
+                func.avg(SensorReading.value).label("avg"),
+                func.count().label("count"),
+            )
+            .join(Sensor)
+            .filter(*filters)
+            .group_by(Sensor.sensor_type)
+            .all()
+        )
+        for stats in statistics:
+            if stats.sensor_type in trends:
+                trends[stats.sensor_type]["statistics"] = {
+                    "min": float(stats.min),
+                    "max": float(stats.max),
+                    "avg": float(stats.avg),
+                    "count": stats.count,
                 }
 
         return jsonify({"unit_id": unit_id, "period_days": days, "trends": trends})
@@ -265,10 +325,75 @@ def get_unit_trends(args, unit_id):
         return SecurityAwareErrorHandler.handle_error(e, "Failed to get unit trends")
 
 
+def _scored_units_subquery(hours, start_time):
+    """Per-unit reading stats with the performance score computed in SQL.
+
+    Units start at 100 and lose 50 with no readings (20 with fewer than one
+    reading per hour), 30 when offline and 10 under maintenance.
+    """
+    # COUNT(column) on purpose: the outer join yields one NULL row for units
+    # without readings, which COUNT(*) would count
+    reading_count = func.count(SensorReading.id)
+    performance_score = (
+        100
+        - case((reading_count == 0, 50), (reading_count < hours, 20), else_=0)
+        - case(
+            (Unit.status == "offline", 30),
+            (Unit.status == "maintenance", 10),
+            else_=0,
+        )
+    )
+
+    return (
+        select(
+            Unit.id,
+            Unit.name,
+            Unit.status,
+            reading_count.label("reading_count"),
+            func.avg(SensorReading.value).label("avg_value"),
+            func.max(SensorReading.value).label("max_value"),
+            func.min(SensorReading.value).label("min_value"),
+            performance_score.label("performance_score"),
+        )
+        .select_from(Unit)
+        .outerjoin(Sensor, Sensor.unit_id == Unit.id)
+        .outerjoin(
+            SensorReading,
+            and_(
+                SensorReading.sensor_id == Sensor.id,
+                SensorReading.timestamp >= start_time,
+            ),
+        )
+        .group_by(Unit.id, Unit.name, Unit.status)
+        .subquery()
+    )
+
+
+def _unit_performance_entry(unit_data):
+    """Format a scored unit row for the performance response."""
+    return {
+        "unit_id": unit_data.id,
+        "unit_name": unit_data.name,
+        "status": unit_data.status.value if unit_data.status else None,
+        "reading_count": unit_data.reading_count or 0,
+        "avg_value": (
+            round(float(unit_data.avg_value), 2) if unit_data.avg_value else 0
+        ),
+        "max_value": (
+            round(float(unit_data.max_value), 2) if unit_data.max_value else 0
+        ),
+        "min_value": (
+            round(float(unit_data.min_value), 2) if unit_data.min_value else 0
+        ),
+        "performance_score": max(0, unit_data.performance_score),
+    }
+
+
 @analytics_bp.route("/analytics/performance/units", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(PerformanceQuerySchema, location="query")
+@use_args(PerformanceQuerySchema(), location="query")
+@use_read_replica
 def get_units_performance(args):
     """Get performance analysis across all units.
 
@@ -286,100 +411,62 @@ def get_units_performance(args):
         in: query
         type: integer
         default: 24
+      - name: limit
+        in: query
+        type: integer
+      - name: offset
+        in: query
+        type: integer
+        default: 0
     responses:
       200:
-        description: Units performance analysis
+        description: Units performance analysis, ranked by performance score
 
     """
     try:
-        # Extract validated parameter
+        # Extract validated parameters
         hours = args["hours"]
+        limit = args.get("limit")
+        offset = args["offset"]
         start_time = utc_now() - timedelta(hours=hours)
 
-        # Performance metrics per unit
-        performance_data = (
-            db.session.query(
-                Unit.id,
-                Unit.name,
-                Unit.status,
-                func.count(SensorReading.id).label("reading_count"),
-                func.avg(SensorReading.value).label("avg_value"),
-                func.max(SensorReading.value).label("max_value"),
-                func.min(SensorReading.value).label("min_value"),
-            )
-            .outerjoin(Sensor)
-            .outerjoin(
-                SensorReading,
-                and_(
-                    SensorReading.sensor_id == Sensor.id,
-                    SensorReading.timestamp >= start_time,
-                ),
-            )
-            .group_by(Unit.id, Unit.name, Unit.status)
-            .all()
-        )
-
-        units_performance = []
-        for unit_data in performance_data:
-            performance_score = 100  # Start with perfect score
-
-            # Reduce score based on inactivity
-            if unit_data.reading_count == 0:
-                performance_score -= 50
-            elif unit_data.reading_count < hours:  # Less than 1 reading per hour
-                performance_score -= 20
-
-            # Status-based scoring
-            if unit_data.status == "offline":
-                performance_score -= 30
-            elif unit_data.status == "maintenance":
-                performance_score -= 10
-
-            units_performance.append(
-                {
-                    "unit_id": unit_data.id,
-                    "unit_name": unit_data.name,
-                    "status": unit_data.status,
-                    "reading_count": unit_data.reading_count or 0,
-                    "avg_value": (
-                        round(float(unit_data.avg_value), 2)
-                        if unit_data.avg_value
-                        else 0
-                    ),
-                    "max_value": (
-                        round(float(unit_data.max_value), 2)
-                        if unit_data.max_value
-                        else 0
-                    ),
-                    "min_value": (
-                        round(float(unit_data.min_value), 2)
-                        if unit_data.min_value
-                        else 0
-                    ),
-                    "performance_score": max(0, performance_score),
-                },
-            )
-
-        # Sort by performance score descending
-        units_performance.sort(key=lambda x: x["performance_score"], reverse=True)
+        scored = _scored_units_subquery(hours, start_time)
+        ranking = (scored.c.performance_score.desc(), scored.c.id)
+
+        page = db.session.execute(
+            select(scored).order_by(*ranking).offset(offset).limit(limit),
+        ).all()
+        total_units, avg_performance = db.session.execute(
+            select(func.count(), func.avg(scored.c.performance_score)),
+        ).one()
+
+        # Best/worst come straight from the page unless it is a partial slice
+        if page and offset == 0 and len(page) == total_units:
+            best, worst = page[0], page[-1]
+        else:
+            best = db.session.execute(
+                select(scored).order_by(*ranking).limit(1),
+            ).first()
+            worst = db.session.execute(
+                select(scored)
+                .order_by(scored.c.performance_score.asc(), scored.c.id.desc())
+                .limit(1),
+            ).first()
 
         return jsonify(
             {
                 "period_hours": hours,
-                "units": units_performance,
+                "units": [_unit_performance_entry(row) for row in page],
                 "summary": {
-                    "total_units": len(units_performance),
+                    "total_units": total_units,
                     "avg_performance": (
-                        sum(u["performance_score"] for u in units_performance)
-                        / len(units_performance)
-                        if units_performance
-                        else 0
+                        float(avg_performance) if avg_performance is not None else 0
                     ),
                     "best_performing": (
-                        units_performance[0] if units_performance else None
+                        _unit_performance_entry(best) if best else None
                     ),
                     "worst_performing": (
-                        units_performance[-1] if units_performance else None
+                        _unit_performance_entry(worst) if worst else None
                     ),
                 },
             },
@@ -392,10 +479,53 @@ def get_units_performance(args):
         )
 
 
+def _use_materialized_views():
+    """Whether analytics may read the PostgreSQL materialized views."""
+    return (
+        current_app.config.get("ANALYTICS_USE_MATERIALIZED_VIEWS", False)
+        and db.engine.dialect.name == "postgresql"
+    )
+
+
+def _query_critical_readings(start_time):
+    """Count readings exceeding alert thresholds per day and sensor type."""
+    # For this demo, we'll simulate alert data since we don't have an alerts table yet
+    # In a real implementation, you would query actual alert records
+
+    # Simulate alert patterns based on sensor readings exceeding thresholds
+    return (
+        db.session.query(
+            func.count().label("count"),
+            func.date(SensorReading.timestamp).label("date"),
+            Sensor.sensor_type,
+        )
+        .join(Sensor)
+        .filter(
+            and_(
+                SensorReading.timestamp >= start_time,
+                or_(
+                    and_(
+                        Sensor.sensor_type == "temperature",
+                        SensorReading.value > 80,
+                    ),
+                    and_(
+                        Sensor.sensor_type == "pressure",
+                        SensorReading.value > 100,
+                    ),
+                    and_(Sensor.sensor_type == "flow", SensorReading.value < 10),
+                ),
+            ),
+        )
+        .group_by(func.date(SensorReading.timestamp), Sensor.sensor_type)
+        .all()
+    )
+
+
 @analytics_bp.route("/analytics/alerts/patterns", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(AlertPatternsQuerySchema, location="query")
+@use_args(AlertPatternsQuerySchema(), location="query")
+@use_read_replica
 def get_alert_patterns(args):
     """Analyze alert patterns and frequencies.
 
@@ -423,47 +553,36 @@ def get_alert_patterns(args):
         days = args["days"]
         start_time = utc_now() - timedelta(days=days)
 
-        # For this demo, we'll simulate alert data since we don't have an alerts table yet
-        # In a real implementation, you would query actual alert records
-
-        # Simulate alert patterns based on sensor readings exceeding thresholds
-        critical_readings = (
-            db.session.query(
-                func.count().label("count"),
-                func.date(SensorReading.timestamp).label("date"),
-                Sensor.sensor_type,
-            )
-            .join(Sensor)
-            .filter(
-                and_(
-                    SensorReading.timestamp >= start_time,
-                    or_(
-                        and_(
-                            Sensor.sensor_type == "temperature",
-                            SensorReading.value > 80,
-                        ),
-                        and_(
-                            Sensor.sensor_type == "pressure",
-                            SensorReading.value > 100,
-                        ),
-                        and_(Sensor.sensor_type == "flow", SensorReading.value < 10),
-                    ),
-                ),
-            )
-            .group_by(func.date(SensorReading.timestamp), Sensor.sensor_type)
-            .all()
-        )
-
         patterns = {}
-        for reading in critical_readings:
-            date_str = (
-                reading.date.isoformat()
-                if reading.date
-                else utc_now().date().isoformat()
-            )
-            if date_str not in patterns:
-                patterns[date_str] = {}
-            patterns[date_str][reading.sensor_type] = reading.count
+        if _use_materialized_views():
+            # Pre-aggregated per day/sensor type by migration 010. The dense
+            # day series gives quiet days a row (sensor_type NULL) so they show
+            # up in daily_patterns with no counts instead of being missing.
+            daily_rows = db.session.execute(
+                text(
+                    "SELECT to_char(d.day, 'YYYY-MM-DD') AS date, v.sensor_type, "
+                    "coalesce(v.reading_count, 0) AS count "
+                    "FROM generate_series(CAST(:start_date AS date), current_date, "
+                    "interval '1 day') AS d(day) "
+                    "LEFT JOIN daily_critical_readings v ON v.day = d.day::date "
+                    "ORDER BY d.day",
+                ),
+                {"start_date": start_time.date()},
+            ).all()
+            for row in daily_rows:
+                day_patterns = patterns.setdefault(row.date, {})
+                if row.sensor_type is not None:
+                    day_patterns[row.sensor_type] = row.count
+        else:
+            for reading in _query_critical_readings(start_time):
+                date_str = (
+                    reading.date.isoformat()
+                    if reading.date
+                    else utc_now().date().isoformat()
+                )
+                if date_str not in patterns:
+                    patterns[date_str] = {}
+                patterns[date_str][reading.sensor_type] = reading.count
 
         # Calculate trends
         total_alerts = sum(sum(day_data.values()) for day_data in patterns.values())
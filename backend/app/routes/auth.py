@@ -2,7 +2,7 @@
 
 import logging
 import secrets
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import create_access_token, jwt_required
@@ -13,10 +13,10 @@ from webargs.flaskparser import use_args
 from app import db
 from app.exceptions import ValidationException
 from app.middleware.audit import AuditEventType, AuditLogger
-from app.middleware.authorization import permission_required
+from app.middleware.authorization import load_auth_user, permission_required
 from app.middleware.rate_limit import auth_rate_limit, standard_rate_limit
 from app.middleware.request_id import track_request_id
-from app.models import Role, User
+from app.models import Role, User, check_dummy_password
 from app.utils.company_identifier import CompanyIdentifier
 from app.utils.error_handler import SecurityAwareErrorHandler
 from app.utils.helpers import get_current_user_id, get_role_permissions
@@ -25,7 +25,6 @@ from app.utils.schemas import (
     LoginSchema,
     PasswordChangeSchema,
     PasswordResetSchema,
-    TokenSchema,
     UserCreateSchema,
     UserSchema,
     UserSelfRegisterSchema,
@@ -33,6 +32,15 @@ from app.utils.schemas import (
 
 auth_bp = Blueprint("auth", __name__)
 
+# Schemas are stateless, so build them once instead of on every request
+_user_create_schema = UserCreateSchema()
+_user_self_register_schema = UserSelfRegisterSchema()
+_login_schema = LoginSchema()
+_password_change_schema = PasswordChangeSchema()
+_forgot_password_schema = ForgotPasswordSchema()
+_password_reset_schema = PasswordResetSchema()
+_user_schema = UserSchema()
+
 
 # ============================================================
 # TEST ROUTE - To verify auth blueprint is working
@@ -48,7 +56,7 @@ def ping():
 @standard_rate_limit
 @jwt_required()
 @permission_required("write_users")
-@use_args(UserCreateSchema, location="json")
+@use_args(_user_create_schema, location="json")
 def register(data):
     """Register a new user.
     ---
@@ -74,7 +82,7 @@ def register(data):
       - JWT: []
     """
     # Check if role exists
-    role = Role.query.get(data["role_id"])
+    role = db.session.get(Role, data["role_id"])
     if not role:
         return SecurityAwareErrorHandler.handle_service_error(
             Exception("Role not found"),
@@ -110,28 +118,24 @@ def register(data):
     )
     user.set_password(data["password"])
 
+    from app.routes.auth_helpers import (  # noqa: PLC0415 - Avoid circular import between auth modules
+        commit_without_expiring,
+        user_integrity_error_message,
+    )
+
     try:
         db.session.add(user)
-        db.session.commit()
-
-        # Refresh to get database-generated timestamp
-        db.session.refresh(user)
+        commit_without_expiring()
 
-        user_schema = UserSchema()
         return SecurityAwareErrorHandler.create_success_response(
-            user_schema.dump(user),
+            _user_schema.dump(user),
             "User created successfully",
             201,
         )
 
     except IntegrityError as e:
         db.session.rollback()
-        if "username" in str(e.orig):
-            error_msg = "Username already exists"
-        elif "email" in str(e.orig):
-            error_msg = "Email already exists"
-        else:
-            error_msg = "Database constraint violation"
+        error_msg = user_integrity_error_message(e)
 
         return SecurityAwareErrorHandler.handle_service_error(
             e,
@@ -144,7 +148,7 @@ def register(data):
 @auth_bp.route("/auth/self-register", methods=["POST"])
 @track_request_id
 @standard_rate_limit
-@use_args(UserSelfRegisterSchema, location="json")
+@use_args(_user_self_register_schema, location="json")
 def self_register(data):
     """Public self-registration endpoint for new users.
     Creates users in 'pending' status awaiting admin approval.
@@ -201,12 +205,14 @@ def self_register(data):
     )
     user.set_password(data["password"])
 
+    from app.routes.auth_helpers import (  # noqa: PLC0415 - Avoid circular import between auth modules
+        commit_without_expiring,
+        user_integrity_error_message,
+    )
+
     try:
         db.session.add(user)
-        db.session.commit()
-
-        # Refresh to get database-generated timestamp
-        db.session.refresh(user)
+        commit_without_expiring()
 
         return SecurityAwareErrorHandler.create_success_response(
             {
@@ -221,12 +227,7 @@ def self_register(data):
 
     except IntegrityError as e:
         db.session.rollback()
-        if "username" in str(e.orig):
-            error_msg = "Username already exists"
-        elif "email" in str(e.orig):
-            error_msg = "Email already exists"
-        else:
-            error_msg = "Database constraint violation"
+        error_msg = user_integrity_error_message(e)
 
         return SecurityAwareErrorHandler.handle_service_error(
             e,
@@ -239,7 +240,7 @@ def self_register(data):
 @auth_bp.route("/auth/login", methods=["POST"])
 @track_request_id
 @auth_rate_limit
-@use_args(LoginSchema, location="json")
+@use_args(_login_schema, location="json")
 def login(data):
     """Authenticate user and return JWT tokens.
     ---
@@ -254,7 +255,16 @@ def login(data):
       200:
         description: Login successful
         schema:
-          $ref: '#/definitions/TokenSchema'
+          type: object
+          properties:
+            access_token:
+              type: string
+            refresh_token:
+              type: string
+            expires_in:
+              type: integer
+            user:
+              $ref: '#/definitions/UserSchema'
       400:
         description: Validation error
       401:
@@ -263,6 +273,7 @@ def login(data):
         description: Rate limit exceeded
     """
     from app.routes.auth_helpers import (  # noqa: PLC0415 - Avoid circular import between auth modules
+        LOGIN_TOKEN_EXPIRES_SECONDS,
         audit_successful_login,
         check_user_can_login,
         create_jwt_tokens,
@@ -288,8 +299,12 @@ def login(data):
         if error:
             return error
 
-        # Verify password and user status
-        if not user or not user.check_password(data["password"]):
+        # Verify password and user status. Unknown users still pay for a
+        # password verification so timing does not reveal valid usernames.
+        if not user:
+            check_dummy_password(data["password"])
+            return handle_invalid_credentials(data.get("username", "unknown"))
+        if not user.check_password(data["password"]):
             return handle_invalid_credentials(data.get("username", "unknown"))
 
         # Check if user can login (active and approved)
@@ -323,23 +338,18 @@ def login(data):
                 current_app.logger.error("JWT_ACCESS_TOKEN_EXPIRES not configured")
                 raise ValidationException("JWT configuration incomplete")
 
-            token_schema = TokenSchema()
+            # expires_in matches the lifetime chosen by create_jwt_tokens
+            expires_in_seconds = LOGIN_TOKEN_EXPIRES_SECONDS[bool(keep_me_signed_in)]
 
-            # Calculate expires_in based on keep_me_signed_in
-            if keep_me_signed_in:
-                expires_in_seconds = timedelta(days=30).total_seconds()
-            else:
-                expires_in_seconds = timedelta(hours=24).total_seconds()
-
-            response_data = {
+            # The token fields are already plain values, so only the user
+            # needs serializing
+            serialized_data = {
                 "access_token": access_token,
                 "refresh_token": refresh_token,
                 "expires_in": expires_in_seconds,
-                "user": user,
+                "user": _user_schema.dump(user),
             }
 
-            serialized_data = token_schema.dump(response_data)
-
             # Validate serialized data
             if not serialized_data.get("access_token") or not serialized_data.get(
                 "user",
@@ -460,7 +470,7 @@ def refresh():
 
         # Query user with database error handling
         try:
-            user = User.query.get(user_id)
+            user = load_auth_user(user_id)
         except Exception as db_error:
             current_app.logger.exception(
                 "Database error during refresh query",
@@ -576,8 +586,8 @@ def refresh():
                     "data": {
                         "access_token": access_token,
                         "expires_in": current_app.config[
-                            "JWT_ACCESS_TOKEN_EXPIRES"
-                        ].total_seconds(),
+                            "JWT_ACCESS_TOKEN_EXPIRES_SECONDS"
+                        ],
                     },
                 },
             ),
@@ -628,7 +638,7 @@ def get_current_user():
             401,
         )
 
-    user = User.query.get(user_id)
+    user = load_auth_user(user_id)
 
     if not user or not user.is_active:
         return SecurityAwareErrorHandler.handle_service_error(
@@ -638,8 +648,7 @@ def get_current_user():
             401,
         )
 
-    user_schema = UserSchema()
-    return jsonify(user_schema.dump(user)), 200
+    return jsonify(_user_schema.dump(user)), 200
 
 
 @auth_bp.route("/auth/logout", methods=["POST"])
@@ -662,7 +671,7 @@ def logout():
 
 @auth_bp.route("/auth/change-password", methods=["POST"])
 @jwt_required()
-@use_args(PasswordChangeSchema, location="json")
+@use_args(_password_change_schema, location="json")
 def change_password(data):
     """Change user password.
     ---
@@ -695,7 +704,7 @@ def change_password(data):
                 401,
             )
 
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
 
         if not user or not user.is_active:
             return SecurityAwareErrorHandler.handle_service_error(
@@ -739,7 +748,7 @@ def change_password(data):
 @auth_bp.route("/auth/forgot-password", methods=["POST"])
 @track_request_id
 @auth_rate_limit
-@use_args(ForgotPasswordSchema, location="json")
+@use_args(_forgot_password_schema, location="json")
 def forgot_password(data):
     """Request password reset token.
     ---
@@ -852,7 +861,7 @@ def forgot_password(data):
 @auth_bp.route("/auth/reset-password", methods=["POST"])
 @track_request_id
 @auth_rate_limit
-@use_args(PasswordResetSchema, location="json")
+@use_args(_password_reset_schema, location="json")
 def reset_password(data):
     """Reset password using token.
     ---
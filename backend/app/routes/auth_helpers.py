@@ -6,12 +6,38 @@ from typing import Any
 
 from flask import current_app, request
 from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.exceptions import ValidationException
-from app.models import User
+from app.models import Role, User
 from app.utils.error_handler import SecurityAwareErrorHandler
 
+# Access token lifetimes issued by /auth/login
+KEEP_SIGNED_IN_TOKEN_EXPIRES = timedelta(days=30)
+DEFAULT_LOGIN_TOKEN_EXPIRES = timedelta(hours=24)
+LOGIN_TOKEN_EXPIRES_SECONDS = {
+    True: KEEP_SIGNED_IN_TOKEN_EXPIRES.total_seconds(),
+    False: DEFAULT_LOGIN_TOKEN_EXPIRES.total_seconds(),
+}
+
+# PostgreSQL's default names for the UNIQUE constraints on users
+USER_CONSTRAINT_MESSAGES = {
+    "users_username_key": "Username already exists",
+    "users_email_key": "Email already exists",
+}
+
+# Login reads the role (validation, role claim) and the login response nests
+# the role's permissions, so fetch them with the user in one statement. Built
+# once so every login reuses the same statement and hits the compiled-statement
+# cache.
+_LOGIN_USER_STMT = (
+    select(User)
+    .options(joinedload(User.role).joinedload(Role.permissions))
+    .where(User.username == bindparam("username"))
+)
+
 
 def validate_login_credentials(data: dict[str, Any]) -> tuple[Any, int] | None:
     """Validate login credentials presence.
@@ -46,7 +72,11 @@ def fetch_user(username: str) -> tuple[Any | None, tuple[Any, int] | None]:
         Tuple of (user, error_response)
     """
     try:
-        user = User.query.filter_by(username=username).first()
+        user = (
+            db.session.execute(_LOGIN_USER_STMT, {"username": username})
+            .unique()
+            .scalar_one_or_none()
+        )
         return user, None
     except Exception as db_error:
         current_app.logger.exception(
@@ -178,6 +208,48 @@ def validate_user_role(user: Any) -> tuple[Any, int] | None:
     return None
 
 
+def commit_without_expiring() -> None:
+    """Commit the session but keep loaded instances' attributes.
+
+    Columns written by the auth routes are all populated in Python (defaults
+    use ``utc_now``), so the in-memory state already matches the committed
+    rows. Skipping the post-commit expiry avoids reloading them on next access.
+    """
+    session = db.session()
+    expire_on_commit = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = expire_on_commit
+
+
+def user_integrity_error_message(error: Exception) -> str:
+    """Describe a unique-constraint violation raised while saving a user.
+
+    psycopg exposes the violated constraint on ``orig.diag``; other drivers
+    only give a message, so fall back to matching the column name in it.
+
+    Args:
+        error: IntegrityError raised by the flush/commit
+
+    Returns:
+        User-facing error message
+    """
+    orig = getattr(error, "orig", None)
+    diag = getattr(orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    if constraint in USER_CONSTRAINT_MESSAGES:
+        return USER_CONSTRAINT_MESSAGES[constraint]
+
+    detail = str(orig)
+    if "username" in detail:
+        return "Username already exists"
+    if "email" in detail:
+        return "Email already exists"
+    return "Database constraint violation"
+
+
 def update_last_login(user: Any) -> None:
     """Update user's last login timestamp.
 
@@ -186,8 +258,7 @@ def update_last_login(user: Any) -> None:
     """
     try:
         user.last_login = datetime.now(timezone.utc)
-        db.session.commit()
-        db.session.refresh(user)
+        commit_without_expiring()
         current_app.logger.debug(
             f"Updated last_login for user {user.username}",
             extra={"event": "last_login_updated", "username": user.username},
@@ -253,9 +324,9 @@ def create_jwt_tokens(
         # Set expiry based on keep_me_signed_in
         # 30 days if keep_me_signed_in is True, 24 hours otherwise
         if keep_me_signed_in:
-            expires_delta = timedelta(days=30)
+            expires_delta = KEEP_SIGNED_IN_TOKEN_EXPIRES
         else:
-            expires_delta = timedelta(hours=24)
+            expires_delta = DEFAULT_LOGIN_TOKEN_EXPIRES
 
         access_token = create_access_token(
             identity=user_id_str,
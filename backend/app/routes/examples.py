@@ -6,7 +6,6 @@ from webargs.flaskparser import use_args
 
 from app.middleware.rate_limit import rate_limit, standard_rate_limit
 from app.middleware.request_id import track_request_id
-from app.middleware.validation import validate_query_params
 
 # Note: collect_metrics is deprecated - kept for backward compatibility but not used
 from app.utils.error_handler import SecurityAwareErrorHandler
@@ -22,6 +21,16 @@ class ExampleRequestSchema(Schema):
     tags = fields.List(fields.Str(), load_default=[])  # FIXED: Changed 'missing' to 'load_default'
 
 
+class ExampleQuerySchema(Schema):
+    """Query parameters accepted by the comprehensive example."""
+
+    include_meta = fields.Bool(load_default=False)
+    format = fields.Str(load_default="json", validate=validate.OneOf(["json", "xml"]))
+
+
+_example_request_schema = ExampleRequestSchema()
+_example_query_schema = ExampleQuerySchema()
+
 # Create blueprint
 example_bp = Blueprint("example", __name__, url_prefix="/api/v1/examples")
 
@@ -29,12 +38,9 @@ example_bp = Blueprint("example", __name__, url_prefix="/api/v1/examples")
 @example_bp.route("/comprehensive", methods=["POST"])
 @track_request_id
 @standard_rate_limit  # 100 requests per minute per IP
-@use_args(ExampleRequestSchema, location="json")
-@validate_query_params(
-    include_meta=lambda x: x.lower() in ["true", "false"],
-    format=lambda x: x in ["json", "xml"],
-)
-def comprehensive_example(validated_data):
+@use_args(_example_request_schema, location="json")
+@use_args(_example_query_schema, location="query")
+def comprehensive_example(validated_data, query_params):
     """Comprehensive example showing all PR2 middleware features.
 
     This endpoint demonstrates:
@@ -45,9 +51,8 @@ def comprehensive_example(validated_data):
     - Metrics collection (automatic via middleware)
     - Standardized error envelope responses
     """
-    # Get query parameters
-    include_meta = request.args.get("include_meta", "false").lower() == "true"
-    format_type = request.args.get("format", "json")
+    include_meta = query_params["include_meta"]
+    format_type = query_params["format"]
 
     # Process the request
     result = {
@@ -127,7 +132,7 @@ def metrics_demo():
 @example_bp.route("/validation-demo", methods=["POST"])
 @track_request_id
 @standard_rate_limit
-@use_args(ExampleRequestSchema, location="json")
+@use_args(_example_request_schema, location="json")
 def validation_demo(validated_data):
     """Example showing comprehensive input validation."""
     # The data has already been validated by middleware
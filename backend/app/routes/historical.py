@@ -1,10 +1,32 @@
 """Historical data analysis routes for Phase 3 SCADA integration."""
 
-from datetime import timedelta
-
-from flask import Blueprint, current_app, jsonify
+import csv
+import hashlib
+import io
+from datetime import timedelta, timezone
+from threading import RLock
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from cachetools import TTLCache
+from flask import Blueprint, current_app, jsonify, request, stream_with_context
 from flask_jwt_extended import jwt_required
-from sqlalchemy import and_, func, literal
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    Numeric,
+    and_,
+    cast,
+    column,
+    event,
+    func,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 from webargs.flaskparser import use_args
 
 from app.middleware.authorization import permission_required
@@ -15,22 +37,355 @@ from app.models import (
     db,
     utc_now,
 )
+from app.utils.compression import compress_response
 from app.utils.error_handler import SecurityAwareErrorHandler
 from app.utils.schemas import (
     CompareUnitsSchema,
     ExportDataQuerySchema,
     HistoricalDataQuerySchema,
     StatisticsQuerySchema,
+    format_keyset_cursor,
 )
 
 # Create historical data blueprint
 historical_bp = Blueprint("historical", __name__)
+historical_bp.after_request(compress_response)
+
+# PostgreSQL SQLSTATE for a statement cancelled by statement_timeout
+QUERY_CANCELED_SQLSTATE = "57014"
+
+# Dashboards poll these endpoints with identical arguments, so serve repeats
+# from a short-lived shared copy of the response body. Requests without an
+# explicit end_date may therefore lag new readings by up to the TTL.
+HISTORICAL_CACHE_TTL_SECONDS = 60.0
+_historical_cache = TTLCache(maxsize=256, ttl=HISTORICAL_CACHE_TTL_SECONDS)
+_historical_cache_lock = RLock()
+
+# Browser cache lifetime for windows that ended more than CLOSED_WINDOW_AGE ago
+CLOSED_WINDOW_AGE = timedelta(hours=1)
+CLOSED_WINDOW_MAX_AGE_SECONDS = 3600
+
+# Unit id -> name for the existence checks at the top of each route. Only
+# found units are cached; unit updates and deletes evict them.
+UNIT_NAME_CACHE_TTL_SECONDS = 60.0
+_unit_name_cache = TTLCache(maxsize=1024, ttl=UNIT_NAME_CACHE_TTL_SECONDS)
+
+# Rows fetched per round trip (and written per chunk) when streaming CSV exports
+EXPORT_FETCH_BATCH_SIZE = 1000
+EXPORT_CSV_HEADER = ("timestamp", "sensor_type", "sensor_name", "unit", "value")
+
+
+def clear_historical_cache():
+    """Drop cached historical responses (used by tests and admin tooling)."""
+    with _historical_cache_lock:
+        _historical_cache.clear()
+        _unit_name_cache.clear()
+
+
+def _unit_names(unit_ids):
+    """Map each existing unit in ``unit_ids`` to its name."""
+    with _historical_cache_lock:
+        names = {
+            unit_id: _unit_name_cache[unit_id]
+            for unit_id in unit_ids
+            if unit_id in _unit_name_cache
+        }
+    missing = [unit_id for unit_id in unit_ids if unit_id not in names]
+    if missing:
+        found = dict(
+            db.session.execute(
+                select(Unit.id, Unit.name).where(Unit.id.in_(missing)),
+            ).all(),
+        )
+        with _historical_cache_lock:
+            _unit_name_cache.update(found)
+        names.update(found)
+    return names
+
+
+@event.listens_for(Unit, "after_update")
+@event.listens_for(Unit, "after_delete")
+def _evict_unit_name(mapper, connection, target):
+    with _historical_cache_lock:
+        _unit_name_cache.pop(target.id, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _evict_on_bulk_unit_change(orm_execute_state):
+    # Query.update()/delete() bypass mapper events
+    if (
+        orm_execute_state.is_update or orm_execute_state.is_delete
+    ) and orm_execute_state.bind_mapper is Unit.__mapper__:
+        with _historical_cache_lock:
+            _unit_name_cache.clear()
+
+
+def _limit_statement_time():
+    """Cap how long any later query of this request may run on PostgreSQL.
+
+    Routes call this just before their first heavy query, so rejected
+    requests, cache hits and 304 revalidations skip the round trip. The
+    setting is transaction-local, so the pooled connection gets its default
+    back when the request's transaction ends.
+    """
+    timeout_ms = current_app.config.get("HISTORICAL_STATEMENT_TIMEOUT_MS", 0)
+    if timeout_ms and db.engine.dialect.name == "postgresql":
+        db.session.execute(
+            text("SELECT set_config('statement_timeout', :timeout, true)"),
+            {"timeout": f"{int(timeout_ms)}ms"},
+        )
+
+
+def _is_statement_timeout(error):
+    """Whether ``error`` is PostgreSQL cancelling a query for running too long."""
+    if not isinstance(error, OperationalError):
+        return False
+    orig = error.orig
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    return sqlstate == QUERY_CANCELED_SQLSTATE
+
+
+def _error_response(error, context):
+    """Map a route failure to a response; query timeouts become 504."""
+    if _is_statement_timeout(error):
+        return (
+            jsonify(
+                {
+                    "error": "Query timed out; narrow the date range "
+                    "or use an hourly/daily/weekly aggregation",
+                },
+            ),
+            504,
+        )
+    return SecurityAwareErrorHandler.handle_error(error, context)
+
+
+def _cache_key(endpoint, args, *parts):
+    """Build a hashable cache key from the endpoint and its validated args."""
+    normalized = tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in args.items()
+        ),
+    )
+    return (endpoint, *parts, normalized)
+
+
+def _client_max_age(args):
+    """Seconds clients may reuse a response for the requested window.
+
+    Readings only arrive for the present, so a window that closed over an
+    hour ago no longer changes and can be kept much longer than a live one.
+    """
+    end_date = args.get("end_date")
+    if end_date is None:
+        return int(HISTORICAL_CACHE_TTL_SECONDS)
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    if end_date < utc_now() - CLOSED_WINDOW_AGE:
+        return CLOSED_WINDOW_MAX_AGE_SECONDS
+    return int(HISTORICAL_CACHE_TTL_SECONDS)
+
+
+def _json_response(cached, max_age):
+    """Build a conditional JSON response from a cached ``(body, etag)`` pair."""
+    body, etag = cached
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+def _cached_response(cache_key, max_age=int(HISTORICAL_CACHE_TTL_SECONDS)):
+    """Return a JSON response for a cached body, or None on a miss.
+
+    A matching If-None-Match turns the hit into a 304 without any queries.
+    """
+    with _historical_cache_lock:
+        cached = _historical_cache.get(cache_key)
+    if cached is None:
+        return None
+    return _json_response(cached, max_age)
+
+
+def _cache_response(cache_key, payload, max_age=int(HISTORICAL_CACHE_TTL_SECONDS)):
+    """Serialize ``payload``, cache the body and return it as a response."""
+    body = jsonify(payload).get_data()
+    cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+    with _historical_cache_lock:
+        _historical_cache[cache_key] = cached
+    return _json_response(cached, max_age)
+
+
+def _readings_query(unit_id, start_time, end_time, sensor_types, cursor):
+    """Raw readings of a unit in a time window, newest first.
+
+    Rows are ``(timestamp, value, sensor_type, name, unit, id)``. The id
+    tiebreak in the ordering makes keyset paging from ``cursor`` exact.
+    Callers add their own limit.
+    """
+    query = (
+        db.session.query(
+            SensorReading.timestamp,
+            SensorReading.value,
+            Sensor.sensor_type,
+            Sensor.name,
+            Sensor.unit_of_measurement.label("unit"),
+            SensorReading.id,
+        )
+        .select_from(SensorReading)
+        .join(Sensor, Sensor.id == SensorReading.sensor_id)
+        .filter(
+            and_(
+                Sensor.unit_id == unit_id,
+                SensorReading.timestamp >= start_time,
+                SensorReading.timestamp <= end_time,
+            ),
+        )
+    )
+    if sensor_types:
+        query = query.filter(Sensor.sensor_type.in_(sensor_types))
+    if cursor is not None:
+        query = query.filter(tuple_(SensorReading.timestamp, SensorReading.id) < cursor)
+    return query.order_by(SensorReading.timestamp.desc(), SensorReading.id.desc())
+
+
+def _next_cursor(readings, limit):
+    """Cursor for the page after ``readings``, or None on the last page."""
+    if limit is None or len(readings) < limit:
+        return None
+    last = readings[-1]
+    return format_keyset_cursor(last.timestamp, last.id)
+
+
+class _BucketAggregates(NamedTuple):
+    """Columns and predicates for a bucketed avg/min/max/count query."""
+
+    source: Any
+    sensor_id: Any
+    time_bucket: Any
+    avg_value: Any
+    min_value: Any
+    max_value: Any
+    count: Any
+    in_range: Any
+
+
+# Time-bucket expression builders keyed by (dialect, aggregation); each takes
+# the timestamp column. SQLite (tests) formats buckets as strings.
+_BUCKET_BUILDERS = MappingProxyType(
+    {
+        ("postgresql", "hourly"): lambda col: func.date_trunc("hour", col),
+        ("postgresql", "daily"): lambda col: func.date_trunc("day", col),
+        ("postgresql", "weekly"): lambda col: func.date_trunc("week", col),
+        ("sqlite", "hourly"): lambda col: func.strftime("%Y-%m-%dT%H:00:00", col),
+        ("sqlite", "daily"): lambda col: func.strftime("%Y-%m-%dT00:00:00", col),
+        ("sqlite", "weekly"): lambda col: func.strftime("%Y-%W", col),
+    },
+)
+
+# TimescaleDB continuous aggregates from migration 013, per aggregation level
+_ROLLUP_VIEWS = {
+    "hourly": "sensor_readings_hourly",
+    "daily": "sensor_readings_daily",
+    "weekly": "sensor_readings_weekly",
+}
+_ROLLUP_TRUNC_UNITS = {"hourly": "hour", "daily": "day", "weekly": "week"}
+
+
+def _use_rollup_views():
+    """Whether bucketed queries may read the continuous aggregates."""
+    return (
+        current_app.config.get("ANALYTICS_USE_MATERIALIZED_VIEWS", False)
+        and db.engine.dialect.name == "postgresql"
+    )
+
+
+def _raw_aggregates(time_bucket, start_time, end_time):
+    """Aggregate sensor_readings directly."""
+    return _BucketAggregates(
+        source=SensorReading,
+        sensor_id=SensorReading.sensor_id,
+        time_bucket=time_bucket,
+        avg_value=func.avg(SensorReading.value),
+        min_value=func.min(SensorReading.value),
+        max_value=func.max(SensorReading.value),
+        count=func.count(),
+        in_range=and_(
+            SensorReading.timestamp >= start_time,
+            SensorReading.timestamp <= end_time,
+        ),
+    )
+
+
+def _rollup_aggregates(aggregation, start_time, end_time):
+    """Combine the precomputed per-sensor buckets for ``aggregation``.
+
+    Averages are re-weighted by sample count so several sensors in one bucket
+    give the same result as aggregating their raw readings. Whole buckets are
+    read, so the first one covers readings from its start rather than from
+    ``start_time`` exactly.
+    """
+    rollup = table(
+        _ROLLUP_VIEWS[aggregation],
+        column("bucket"),
+        column("sensor_id"),
+        column("value_sum"),
+        column("value_min"),
+        column("value_max"),
+        column("sample_count"),
+    )
+    first_bucket = func.date_trunc(_ROLLUP_TRUNC_UNITS[aggregation], start_time)
+    return _BucketAggregates(
+        source=rollup,
+        sensor_id=rollup.c.sensor_id,
+        time_bucket=rollup.c.bucket,
+        avg_value=cast(
+            func.sum(rollup.c.value_sum) / func.sum(rollup.c.sample_count),
+            Float,
+        ),
+        min_value=func.min(rollup.c.value_min),
+        max_value=func.max(rollup.c.value_max),
+        count=cast(func.sum(rollup.c.sample_count), BigInteger),
+        in_range=and_(rollup.c.bucket >= first_bucket, rollup.c.bucket <= end_time),
+    )
+
+
+def _round2(expr):
+    """Round a float aggregate to 2 decimal places in SQL."""
+    if db.engine.dialect.name == "sqlite":
+        return func.round(expr, 2)
+    # PostgreSQL only rounds numeric; cast back so the driver returns a float
+    return cast(func.round(cast(expr, Numeric), 2), Float)
+
+
+def _stream_csv_rows(readings):
+    """Yield CSV text for ``readings`` one batch of rows at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_CSV_HEADER)
+    for count, reading in enumerate(readings, 1):
+        writer.writerow(
+            (
+                reading.timestamp.isoformat(),
+                reading.sensor_type,
+                reading.name,
+                reading.unit,
+                reading.value,
+            ),
+        )
+        if count % EXPORT_FETCH_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
 
 
 @historical_bp.route("/historical/data/<unit_id>", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(HistoricalDataQuerySchema, location="query")
+@use_args(HistoricalDataQuerySchema(), location="query")
 def get_historical_data(args, unit_id):
     """Get historical data for a unit with flexible time ranges and aggregation.
 
@@ -71,6 +426,10 @@ def get_historical_data(args, unit_id):
         in: query
         type: integer
         default: 1000
+      - name: cursor
+        in: query
+        type: string
+        description: next_cursor from the previous page (raw aggregation only)
     responses:
       200:
         description: Historical data with optional aggregation
@@ -81,10 +440,17 @@ def get_historical_data(args, unit_id):
 
     """
     try:
-        # Validate unit exists
-        unit = Unit.query.get(unit_id)
-        if not unit:
+        cache_key = _cache_key("data", args, unit_id)
+        max_age = _client_max_age(args)
+        cached = _cached_response(cache_key, max_age)
+        if cached is not None:
+            return cached
+
+        # Validate unit exists; only its name is used, so skip loading the row
+        unit_name = _unit_names([unit_id]).get(unit_id)
+        if unit_name is None:
             return jsonify({"error": "Unit not found"}), 404
+        _limit_statement_time()
 
         # Extract validated parameters from args
         start_date = args.get("start_date")
@@ -97,94 +463,67 @@ def get_historical_data(args, unit_id):
         end_time = end_date if end_date else utc_now()
         start_time = start_date if start_date else (end_time - timedelta(days=7))
 
-        # Build base query
-        query = (
-            db.session.query(
-                SensorReading.timestamp,
-                SensorReading.value,
-                Sensor.sensor_type,
-                Sensor.name,
-                Sensor.unit_of_measurement.label("unit"),
-            )
-            .select_from(SensorReading)
-            .join(Sensor, Sensor.id == SensorReading.sensor_id)
-            .filter(
-                and_(
-                    Sensor.unit_id == unit_id,
-                    SensorReading.timestamp >= start_time,
-                    SensorReading.timestamp <= end_time,
-                ),
-            )
-        )
-
-        # Filter by sensor types if specified
-        if sensor_types:
-            sensor_type_list = [s.strip() for s in sensor_types.split(",")]
-            query = query.filter(Sensor.sensor_type.in_(sensor_type_list))
-
         # Apply aggregation
         if aggregation == "raw":
-            readings = query.order_by(SensorReading.timestamp.desc()).limit(limit).all()
-            data = []
-            for reading in readings:
-                data.append(
-                    {
-                        "timestamp": reading.timestamp.isoformat(),
-                        "value": float(reading.value),
-                        "sensor_type": reading.sensor_type,
-                        "sensor_name": reading.name,
-                        "unit": reading.unit,
-                    },
+            readings = (
+                _readings_query(
+                    unit_id,
+                    start_time,
+                    end_time,
+                    sensor_types,
+                    args.get("cursor"),
                 )
+                .limit(limit)
+                .all()
+            )
+            next_cursor = _next_cursor(readings, limit)
+            # Unpack rows positionally (column order of _readings_query)
+            data = [
+                {
+                    "timestamp": timestamp.isoformat(),
+                    "value": float(value),
+                    "sensor_type": sensor_type,
+                    "sensor_name": name,
+                    "unit": unit,
+                }
+                for timestamp, value, sensor_type, name, unit, _ in readings
+            ]
         else:
             # Aggregated data
-            dialect_name = db.engine.dialect.name
-            if aggregation == "hourly":
-                time_format = (
-                    func.strftime("%Y-%m-%dT%H:00:00", SensorReading.timestamp)
-                    if dialect_name == "sqlite"
-                    else func.date_trunc("hour", SensorReading.timestamp)
-                )
-            elif aggregation == "daily":
-                time_format = (
-                    func.strftime("%Y-%m-%dT00:00:00", SensorReading.timestamp)
-                    if dialect_name == "sqlite"
-                    else func.date_trunc("day", SensorReading.timestamp)
-                )
-            elif aggregation == "weekly":
-                time_format = (
-                    func.strftime("%Y-%W", SensorReading.timestamp)
-                    if dialect_name == "sqlite"
-                    else func.date_trunc("week", SensorReading.timestamp)
-                )
-            else:
+            next_cursor = None
+            try:
+                bucket = _BUCKET_BUILDERS[(db.engine.dialect.name, aggregation)]
+            except KeyError:
                 return jsonify({"error": "Invalid aggregation type"}), 400
 
+            agg = (
+                _rollup_aggregates(aggregation, start_time, end_time)
+                if _use_rollup_views()
+                else _raw_aggregates(
+                    bucket(SensorReading.timestamp),
+                    start_time,
+                    end_time,
+                )
+            )
+            time_format = agg.time_bucket
             aggregated_data = (
                 db.session.query(
                     time_format.label("time_bucket"),
                     Sensor.sensor_type,
                     Sensor.name,
-                    func.avg(SensorReading.value).label("avg_value"),
-                    func.min(SensorReading.value).label("min_value"),
-                    func.max(SensorReading.value).label("max_value"),
-                    func.count(SensorReading.value).label("count"),
-                )
-                .select_from(SensorReading)
-                .join(Sensor, Sensor.id == SensorReading.sensor_id)
-                .filter(
-                    and_(
-                        Sensor.unit_id == unit_id,
-                        SensorReading.timestamp >= start_time,
-                        SensorReading.timestamp <= end_time,
-                    ),
+                    _round2(agg.avg_value).label("avg_value"),
+                    _round2(agg.min_value).label("min_value"),
+                    _round2(agg.max_value).label("max_value"),
+                    agg.count.label("count"),
                 )
+                .select_from(agg.source)
+                .join(Sensor, Sensor.id == agg.sensor_id)
+                .filter(and_(Sensor.unit_id == unit_id, agg.in_range))
             )
 
             if sensor_types:
-                sensor_type_list = [s.strip() for s in sensor_types.split(",")]
                 aggregated_data = aggregated_data.filter(
-                    Sensor.sensor_type.in_(sensor_type_list),
+                    Sensor.sensor_type.in_(sensor_types),
                 )
 
             aggregated_data = (
@@ -194,39 +533,49 @@ def get_historical_data(args, unit_id):
                 .all()
             )
 
-            data = []
-            for reading in aggregated_data:
-                data.append(
-                    {
-                        "timestamp": (
-                            reading.time_bucket.isoformat()
-                            if hasattr(reading.time_bucket, "isoformat")
-                            else str(reading.time_bucket)
-                        ),
-                        "sensor_type": reading.sensor_type,
-                        "sensor_name": reading.name,
-                        "avg_value": round(float(reading.avg_value), 2),
-                        "min_value": round(float(reading.min_value), 2),
-                        "max_value": round(float(reading.max_value), 2),
-                        "sample_count": reading.count,
-                    },
-                )
+            data = [
+                {
+                    "timestamp": (
+                        time_bucket.isoformat()
+                        if hasattr(time_bucket, "isoformat")
+                        else str(time_bucket)
+                    ),
+                    "sensor_type": sensor_type,
+                    "sensor_name": name,
+                    "avg_value": avg_value,
+                    "min_value": min_value,
+                    "max_value": max_value,
+                    "sample_count": count,
+                }
+                for (
+                    time_bucket,
+                    sensor_type,
+                    name,
+                    avg_value,
+                    min_value,
+                    max_value,
+                    count,
+                ) in aggregated_data
+            ]
 
-        return jsonify(
+        return _cache_response(
+            cache_key,
             {
                 "unit_id": unit_id,
-                "unit_name": unit.name,
+                "unit_name": unit_name,
                 "start_date": start_time.isoformat(),
                 "end_date": end_time.isoformat(),
                 "aggregation": aggregation,
                 "total_records": len(data),
-                "sensor_types_filter": sensor_types,
+                "sensor_types_filter": ",".join(sensor_types) if sensor_types else None,
                 "data": data,
+                "next_cursor": next_cursor,
             },
+            max_age,
         )
 
     except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
+        return _error_response(
             e,
             "Failed to get historical data",
         )
@@ -235,7 +584,7 @@ def get_historical_data(args, unit_id):
 @historical_bp.route("/historical/compare/units", methods=["POST"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(CompareUnitsSchema, location="json")
+@use_args(CompareUnitsSchema(), location="json")
 def compare_units_historical(args):
     """Compare historical data between multiple units.
 
@@ -281,6 +630,12 @@ def compare_units_historical(args):
 
     """
     try:
+        cache_key = _cache_key("compare", args)
+        max_age = _client_max_age(args)
+        cached = _cached_response(cache_key, max_age)
+        if cached is not None:
+            return cached
+
         # Extract validated parameters
         unit_ids = args["unit_ids"]
         sensor_type = args["sensor_type"]
@@ -289,57 +644,46 @@ def compare_units_historical(args):
         end_date = args.get("end_date")
 
         # Validate units exist
-        units = Unit.query.filter(Unit.id.in_(unit_ids)).all()
-        if len(units) != len(unit_ids):
+        unit_names = _unit_names(unit_ids)
+        if len(unit_names) != len(unit_ids):
             return jsonify({"error": "One or more units not found"}), 404
+        _limit_statement_time()
 
         # Parse time range (dates are already datetime objects from schema)
         end_time = end_date if end_date else utc_now()
         start_time = start_date if start_date else (end_time - timedelta(days=30))
 
-        # Set aggregation format
-        dialect_name = db.engine.dialect.name
-        if aggregation == "hourly":
-            time_format = (
-                func.strftime("%Y-%m-%dT%H:00:00", SensorReading.timestamp)
-                if dialect_name == "sqlite"
-                else func.date_trunc("hour", SensorReading.timestamp)
-            )
-        elif aggregation == "daily":
-            time_format = (
-                func.strftime("%Y-%m-%dT00:00:00", SensorReading.timestamp)
-                if dialect_name == "sqlite"
-                else func.date_trunc("day", SensorReading.timestamp)
-            )
-        elif aggregation == "weekly":
-            time_format = (
-                func.strftime("%Y-%W", SensorReading.timestamp)
-                if dialect_name == "sqlite"
-                else func.date_trunc("week", SensorReading.timestamp)
-            )
-        else:
+        try:
+            bucket = _BUCKET_BUILDERS[(db.engine.dialect.name, aggregation)]
+        except KeyError:
             return jsonify({"error": "Invalid aggregation type"}), 400
 
+        agg = (
+            _rollup_aggregates(aggregation, start_time, end_time)
+            if _use_rollup_views()
+            else _raw_aggregates(bucket(SensorReading.timestamp), start_time, end_time)
+        )
+        time_format = agg.time_bucket
+
         # Get comparison data
         comparison_data = (
             db.session.query(
                 time_format.label("time_bucket"),
                 Sensor.unit_id,
                 Unit.name.label("unit_name"),
-                func.avg(SensorReading.value).label("avg_value"),
-                func.min(SensorReading.value).label("min_value"),
-                func.max(SensorReading.value).label("max_value"),
-                func.count(SensorReading.value).label("count"),
+                _round2(agg.avg_value).label("avg_value"),
+                _round2(agg.min_value).label("min_value"),
+                _round2(agg.max_value).label("max_value"),
+                agg.count.label("count"),
             )
-            .select_from(SensorReading)
-            .join(Sensor, Sensor.id == SensorReading.sensor_id)
+            .select_from(agg.source)
+            .join(Sensor, Sensor.id == agg.sensor_id)
             .join(Unit)
             .filter(
                 and_(
                     Sensor.unit_id.in_(unit_ids),
                     Sensor.sensor_type == sensor_type,
-                    SensorReading.timestamp >= start_time,
-                    SensorReading.timestamp <= end_time,
+                    agg.in_range,
                 ),
             )
             .group_by(time_format, Sensor.unit_id, Unit.name)
@@ -347,54 +691,85 @@ def compare_units_historical(args):
             .all()
         )
 
-        # Organize data by time bucket
-        time_series = {}
-        unit_names = {unit.id: unit.name for unit in units}
+        # Rows arrive ordered by bucket, so each bucket's units are contiguous
+        # and the series can be built as a list in a single pass
+        time_series = []
+        last_bucket = units = None
+
+        for (
+            time_bucket,
+            record_unit_id,
+            unit_name,
+            avg_value,
+            min_value,
+            max_value,
+            count,
+        ) in comparison_data:
+            if units is None or time_bucket != last_bucket:
+                last_bucket = time_bucket
+                units = {}
+                time_series.append(
+                    {
+                        "timestamp": (
+                            time_bucket.isoformat()
+                            if hasattr(time_bucket, "isoformat")
+                            else str(time_bucket)
+                        ),
+                        "units": units,
+                    },
+                )
 
-        for record in comparison_data:
-            time_key = (
-                record.time_bucket.isoformat()
-                if hasattr(record.time_bucket, "isoformat")
-                else str(record.time_bucket)
-            )
-            if time_key not in time_series:
-                time_series[time_key] = {"timestamp": time_key, "units": {}}
-
-            time_series[time_key]["units"][record.unit_id] = {
-                "unit_name": record.unit_name,
-                "avg_value": round(float(record.avg_value), 2),
-                "min_value": round(float(record.min_value), 2),
-                "max_value": round(float(record.max_value), 2),
-                "sample_count": record.count,
+            units[record_unit_id] = {
+                "unit_name": unit_name,
+                "avg_value": avg_value,
+                "min_value": min_value,
+                "max_value": max_value,
+                "sample_count": count,
             }
 
-        # Calculate summary statistics per unit
-        unit_summaries = {}
-        for unit_id in unit_ids:
-            unit_values = [
-                record.avg_value
-                for record in comparison_data
-                if record.unit_id == unit_id
-            ]
+        # Summary statistics per unit over all of its readings in the window,
+        # one row per unit with data
+        summary_rows = (
+            db.session.query(
+                Sensor.unit_id,
+                _round2(agg.avg_value),
+                _round2(agg.min_value),
+                _round2(agg.max_value),
+                func.count(time_format.distinct()),
+            )
+            .select_from(agg.source)
+            .join(Sensor, Sensor.id == agg.sensor_id)
+            .filter(
+                and_(
+                    Sensor.unit_id.in_(unit_ids),
+                    Sensor.sensor_type == sensor_type,
+                    agg.in_range,
+                ),
+            )
+            .group_by(Sensor.unit_id)
+            .all()
+        )
 
-            if unit_values:
-                unit_summaries[unit_id] = {
-                    "unit_name": unit_names[unit_id],
-                    "overall_avg": round(sum(unit_values) / len(unit_values), 2),
-                    "overall_min": round(min(unit_values), 2),
-                    "overall_max": round(max(unit_values), 2),
-                    "data_points": len(unit_values),
-                }
-            else:
-                unit_summaries[unit_id] = {
-                    "unit_name": unit_names[unit_id],
-                    "overall_avg": 0,
-                    "overall_min": 0,
-                    "overall_max": 0,
-                    "data_points": 0,
-                }
+        unit_summaries = {
+            unit_id: {
+                "unit_name": unit_names[unit_id],
+                "overall_avg": 0,
+                "overall_min": 0,
+                "overall_max": 0,
+                "data_points": 0,
+            }
+            for unit_id in unit_ids
+        }
+        for unit_id, overall_avg, overall_min, overall_max, data_points in summary_rows:
+            unit_summaries[unit_id].update(
+                overall_avg=overall_avg,
+                overall_min=overall_min,
+                overall_max=overall_max,
+                data_points=data_points,
+            )
 
-        return jsonify(
+        return _cache_response(
+            cache_key,
             {
                 "comparison": {
                     "unit_ids": unit_ids,
@@ -402,14 +777,15 @@ def compare_units_historical(args):
                     "aggregation": aggregation,
                     "start_date": start_time.isoformat(),
                     "end_date": end_time.isoformat(),
-                    "time_series": list(time_series.values()),
+                    "time_series": time_series,
                     "unit_summaries": unit_summaries,
                 },
             },
+            max_age,
         )
 
     except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
+        return _error_response(
             e,
             "Failed to compare units historical data",
         )
@@ -418,7 +794,7 @@ def compare_units_historical(args):
 @historical_bp.route("/historical/export/<unit_id>", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(ExportDataQuerySchema, location="query")
+@use_args(ExportDataQuerySchema(), location="query")
 def export_historical_data(args, unit_id):
     """Export historical data for a unit in various formats.
 
@@ -453,6 +829,14 @@ def export_historical_data(args, unit_id):
         in: query
         type: string
         description: Comma-separated list of sensor types
+      - name: limit
+        in: query
+        type: integer
+        description: Maximum readings per page (default exports the whole range)
+      - name: cursor
+        in: query
+        type: string
+        description: next_cursor from the previous page
     responses:
       200:
         description: Exported data
@@ -463,10 +847,11 @@ def export_historical_data(args, unit_id):
 
     """
     try:
-        # Validate unit exists
-        unit = Unit.query.get(unit_id)
-        if not unit:
+        # Validate unit exists; only its name is used, so skip loading the row
+        unit_name = _unit_names([unit_id]).get(unit_id)
+        if unit_name is None:
             return jsonify({"error": "Unit not found"}), 404
+        _limit_statement_time()
 
         # Extract validated parameters
         export_format = args["format"]
@@ -478,83 +863,59 @@ def export_historical_data(args, unit_id):
         end_time = end_date if end_date else utc_now()
         start_time = start_date if start_date else (end_time - timedelta(days=30))
 
-        # Build query
-        query = (
-            db.session.query(
-                SensorReading.timestamp,
-                SensorReading.value,
-                Sensor.sensor_type,
-                Sensor.name,
-                Sensor.unit_of_measurement.label("unit"),
-            )
-            .select_from(SensorReading)
-            .join(Sensor, Sensor.id == SensorReading.sensor_id)
-            .filter(
-                and_(
-                    Sensor.unit_id == unit_id,
-                    SensorReading.timestamp >= start_time,
-                    SensorReading.timestamp <= end_time,
-                ),
-            )
+        query = _readings_query(
+            unit_id,
+            start_time,
+            end_time,
+            sensor_types,
+            args.get("cursor"),
         )
-
-        if sensor_types:
-            sensor_type_list = [s.strip() for s in sensor_types.split(",")]
-            query = query.filter(Sensor.sensor_type.in_(sensor_type_list))
-
-        readings = query.order_by(SensorReading.timestamp.desc()).all()
+        limit = args.get("limit")
+        if limit is not None:
+            query = query.limit(limit)
 
         if export_format == "csv":
-            # Prepare CSV data
-            csv_lines = ["timestamp,sensor_type,sensor_name,unit,value"]
-
-            for reading in readings:
-                csv_lines.append(
-                    f"{reading.timestamp.isoformat()},"
-                    f"{reading.sensor_type},"
-                    f"{reading.name},"
-                    f"{reading.unit},"
-                    f"{reading.value}",
-                )
-
-            csv_content = "\\n".join(csv_lines)
-
-            response = current_app.response_class(
-                csv_content,
+            # Stream rows in batches (server-side cursor where supported) so
+            # memory stays bounded and the first bytes go out immediately
+            return current_app.response_class(
+                stream_with_context(
+                    _stream_csv_rows(query.yield_per(EXPORT_FETCH_BATCH_SIZE)),
+                ),
                 mimetype="text/csv",
                 headers={
                     "Content-Disposition": f"attachment; filename=unit_{unit_id}_historical_data.csv",
                 },
             )
-            return response
+
+        readings = query.all()
 
         # JSON format
-        data = []
-        for reading in readings:
-            data.append(
-                {
-                    "timestamp": reading.timestamp.isoformat(),
-                    "value": float(reading.value),
-                    "sensor_type": reading.sensor_type,
-                    "sensor_name": reading.name,
-                    "unit": reading.unit,
-                },
-            )
+        data = [
+            {
+                "timestamp": timestamp.isoformat(),
+                "value": float(value),
+                "sensor_type": sensor_type,
+                "sensor_name": name,
+                "unit": unit,
+            }
+            for timestamp, value, sensor_type, name, unit, _ in readings
+        ]
 
         return jsonify(
             {
                 "unit_id": unit_id,
-                "unit_name": unit.name,
+                "unit_name": unit_name,
                 "export_format": export_format,
                 "start_date": start_time.isoformat(),
                 "end_date": end_time.isoformat(),
                 "total_records": len(data),
                 "data": data,
+                "next_cursor": _next_cursor(readings, limit),
             },
         )
 
     except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
+        return _error_response(
             e,
             "Failed to export historical data",
         )
@@ -563,7 +924,7 @@ def export_historical_data(args, unit_id):
 @historical_bp.route("/historical/statistics/<unit_id>", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
-@use_args(StatisticsQuerySchema, location="query")
+@use_args(StatisticsQuerySchema(), location="query")
 def get_historical_statistics(args, unit_id):
     """Get statistical analysis of historical data for a unit.
 
@@ -598,10 +959,16 @@ def get_historical_statistics(args, unit_id):
 
     """
     try:
-        # Validate unit exists
-        unit = Unit.query.get(unit_id)
-        if not unit:
+        cache_key = _cache_key("statistics", args, unit_id)
+        cached = _cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        # Validate unit exists; only its name is used, so skip loading the row
+        unit_name = _unit_names([unit_id]).get(unit_id)
+        if unit_name is None:
             return jsonify({"error": "Unit not found"}), 404
+        _limit_statement_time()
 
         # Extract validated parameters
         days = args["days"]
@@ -609,21 +976,21 @@ def get_historical_statistics(args, unit_id):
 
         start_time = utc_now() - timedelta(days=days)
 
-        # Base query
-        stddev_expr = (
-            func.stddev(SensorReading.value)
-            if db.engine.dialect.name != "sqlite"
-            else literal(None)
-        )
+        # Base query; SQLite gets stddev_samp from app.utils.sqlite_functions
+        stddev_expr = func.stddev_samp(SensorReading.value)
 
+        # Rounded (and the range derived) in SQL, so rows map straight to JSON
         query = (
             db.session.query(
                 Sensor.sensor_type,
-                func.count(SensorReading.value).label("total_readings"),
-                func.avg(SensorReading.value).label("avg_value"),
-                func.min(SensorReading.value).label("min_value"),
-                func.max(SensorReading.value).label("max_value"),
-                stddev_expr.label("std_dev"),
+                func.count().label("total_readings"),
+                _round2(func.avg(SensorReading.value)).label("avg_value"),
+                _round2(func.min(SensorReading.value)).label("min_value"),
+                _round2(func.max(SensorReading.value)).label("max_value"),
+                _round2(stddev_expr).label("std_dev"),
+                _round2(
+                    func.max(SensorReading.value) - func.min(SensorReading.value),
+                ).label("value_range"),
             )
             .select_from(SensorReading)
             .join(Sensor, Sensor.id == SensorReading.sensor_id)
@@ -637,27 +1004,31 @@ def get_historical_statistics(args, unit_id):
 
         stats = query.group_by(Sensor.sensor_type).all()
 
-        statistics = {}
-        for stat in stats:
-            statistics[stat.sensor_type] = {
-                "total_readings": stat.total_readings,
-                "average": round(float(stat.avg_value), 2) if stat.avg_value else 0,
-                "minimum": round(float(stat.min_value), 2) if stat.min_value else 0,
-                "maximum": round(float(stat.max_value), 2) if stat.max_value else 0,
-                "standard_deviation": (
-                    round(float(stat.std_dev), 2) if stat.std_dev else 0
-                ),
-                "range": (
-                    round(float(stat.max_value - stat.min_value), 2)
-                    if stat.max_value and stat.min_value
-                    else 0
-                ),
+        statistics = {
+            stat_type: {
+                "total_readings": total_readings,
+                "average": avg_value or 0,
+                "minimum": min_value or 0,
+                "maximum": max_value or 0,
+                "standard_deviation": std_dev or 0,
+                "range": value_range or 0,
             }
-
-        return jsonify(
+            for (
+                stat_type,
+                total_readings,
+                avg_value,
+                min_value,
+                max_value,
+                std_dev,
+                value_range,
+            ) in stats
+        }
+
+        return _cache_response(
+            cache_key,
             {
                 "unit_id": unit_id,
-                "unit_name": unit.name,
+                "unit_name": unit_name,
                 "analysis_period_days": days,
                 "sensor_type_filter": sensor_type,
                 "statistics": statistics,
@@ -666,7 +1037,7 @@ def get_historical_statistics(args, unit_id):
         )
 
     except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
+        return _error_response(
             e,
             "Failed to get historical statistics",
         )
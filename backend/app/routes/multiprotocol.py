@@ -1,14 +1,19 @@
 """Multi-protocol management routes (normalized status in PR1a)."""
 
+import json
 import logging
+import time
+from datetime import datetime, timezone
+from threading import Lock
+from types import MappingProxyType
 
 from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
 from app.middleware.authorization import permission_required
-from app.models import utc_now  # Use centralized timezone-aware datetime function
 from app.protocols.registry import collect_protocol_status, get_protocols_list
-from app.utils.error_handler import SecurityAwareErrorHandler
+from app.utils.error_handler import SecurityAwareErrorHandler, safe_endpoint
+from app.utils.url_converters import is_valid_device_id
 
 # PR1a: Enhanced logging for protocol status monitoring
 logger = logging.getLogger(__name__)
@@ -16,8 +21,194 @@ logger = logging.getLogger(__name__)
 # PR1a: API version for /protocols/status endpoint
 PROTOCOLS_API_VERSION = "1.1.0"
 
+# availability_level values counted in the status summary, in response order
+AVAILABILITY_LEVELS = ("fully_available", "available", "degraded", "unavailable")
+
+# Fields the add-device endpoints require in the request body
+MODBUS_REQUIRED_FIELDS = frozenset(("device_id", "unit_id", "host"))
+DNP3_REQUIRED_FIELDS = frozenset(
+    ("device_id", "master_address", "outstation_address", "host"),
+)
+
+# Values used for optional add-device fields the request body leaves out
+MODBUS_DEVICE_DEFAULTS = {"port": 502, "device_type": "tcp", "timeout": 5.0}
+DNP3_DEVICE_DEFAULTS = {"port": 20000, "link_timeout": 5.0, "app_timeout": 5.0}
+
 multiprotocol_bp = Blueprint("multiprotocol", __name__)
 
+# Dashboards poll the status endpoints every few seconds, so concurrent polls
+# share one serialized snapshot for a short window instead of each querying
+# every protocol service.
+PROTOCOL_STATUS_CACHE_TTL_SECONDS = 1.0
+# key -> (monotonic expiry, serialized body); plain dict reads are atomic
+_status_cache = {}
+# key -> lock held while that key's snapshot is rebuilt
+_status_build_locks = {}
+
+
+def clear_protocol_status_cache():
+    """Drop cached status snapshots (used by tests and admin tooling)."""
+    _status_cache.clear()
+
+
+def _cached_status_response(key, build):
+    """Serve the snapshot cached under ``key``, building it with ``build()``.
+
+    Fresh snapshots are read without locking. Rebuilds are single-flight per
+    key: concurrent pollers of one endpoint wait for a single rebuild and share
+    its result, while other keys are served or rebuilt independently.
+    """
+    entry = _status_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        with _status_build_locks.setdefault(key, Lock()):
+            # Another poller may have rebuilt it while this one waited
+            entry = _status_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                body = jsonify(build()).get_data()
+                entry = (time.monotonic() + PROTOCOL_STATUS_CACHE_TTL_SECONDS, body)
+                _status_cache[key] = entry
+    return current_app.response_class(entry[1], mimetype="application/json")
+
+
+# Response timestamps only need to be as fresh as the status snapshots, so the
+# formatted string is reused for up to this long.
+TIMESTAMP_RESOLUTION_SECONDS = 0.1
+_timestamp_cache = (0.0, "")
+
+
+def _now_iso():
+    """Return the current UTC time as ISO-8601, refreshed at most every 100 ms."""
+    global _timestamp_cache
+    now = time.time()
+    cached_at, formatted = _timestamp_cache
+    if now - cached_at >= TIMESTAMP_RESOLUTION_SECONDS:
+        formatted = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
+def _missing_fields_response(missing):
+    """400 response naming every missing required field."""
+    return (
+        jsonify({"error": f"Missing required fields: {', '.join(sorted(missing))}"}),
+        400,
+    )
+
+
+def _error_body(message):
+    """Serialize a fixed error payload the way ``jsonify`` would."""
+    return json.dumps({"error": message}, separators=(",", ":")).encode() + b"\n"
+
+
+# Service-unavailable bodies never change, so they are encoded once at import
+# instead of on every rejected request (e.g. health checks against a node with
+# a protocol disabled).
+_SERVICE_UNAVAILABLE_BODIES = MappingProxyType(
+    {
+        "modbus_service": _error_body("Modbus service not available"),
+        "dnp3_service": _error_body("DNP3 service not available"),
+    },
+)
+
+
+def _service_unavailable(name):
+    """503 response for a protocol service missing from the app."""
+    return current_app.response_class(
+        _SERVICE_UNAVAILABLE_BODIES[name],
+        status=503,
+        mimetype="application/json",
+    )
+
+
+def _invalid_device_id_response():
+    """400 response for a device id the device routes could not address."""
+    return (
+        jsonify(
+            {
+                "error": "device_id must be 1-64 letters, digits, '_', '.' or '-'",
+            },
+        ),
+        400,
+    )
+
+
+def _device_action_response(succeeded, device_id, message, error, status=200):
+    """Response for a device action: ``message`` on success, else a 500."""
+    if succeeded:
+        return jsonify({"message": message, "device_id": device_id}), status
+    return jsonify({"error": error}), 500
+
+
+def _get_service(name):
+    """Return the protocol service attached to the app as ``name``, or None.
+
+    Resolves the ``current_app`` proxy once instead of on every check and call.
+    """
+    return getattr(current_app._get_current_object(), name, None)
+
+
+def _build_protocols_status():
+    """Collect protocol statuses and build the /protocols/status payload."""
+    statuses = collect_protocol_status()
+
+    # One pass over the statuses for every summary figure
+    active_count = 0
+    recovering_count = 0
+    total_health_score = 0
+    # PR1a: Count protocols by availability level
+    availability_summary = dict.fromkeys(AVAILABILITY_LEVELS, 0)
+    names = []
+    by_name = {}
+    for s in statuses:
+        name = s["name"]
+        names.append(name)
+        by_name[name] = s
+
+        # PR1a: Active means connected, ready and with a fresh heartbeat
+        if (
+            s.get("connected")
+            and s.get("status") == "ready"
+            and not s.get("is_heartbeat_stale", True)
+        ):
+            active_count += 1
+
+        level = s.get("availability_level")
+        if level in availability_summary:
+            availability_summary[level] += 1
+
+        # PR1a: Count protocols in recovery state
+        if s.get("is_recovering", False):
+            recovering_count += 1
+
+        total_health_score += s.get("health_score", 0)
+
+    # PR1a: Calculate overall health score
+    overall_health_score = total_health_score / len(statuses) if statuses else 0.0
+
+    response_data = {
+        "timestamp": _now_iso(),
+        "version": PROTOCOLS_API_VERSION,  # PR1a: Version header
+        "summary": {
+            "total_protocols": len(statuses),
+            "active_protocols": active_count,
+            "supported_protocols": names,
+            "protocols_list": get_protocols_list(),  # PR1a: Protocols list field
+            # PR1a: Enhanced summary fields
+            "availability_summary": availability_summary,
+            "recovering_protocols": recovering_count,
+            "health_score": round(overall_health_score, 1),
+        },
+        "protocols": by_name,
+    }
+
+    # PR1a: Log status summary for monitoring
+    logger.debug(
+        f"Protocol status summary - Active: {active_count}/{len(statuses)}, "
+        f"Health Score: {response_data['summary']['health_score']}%",
+    )
+
+    return response_data
+
 
 @multiprotocol_bp.route("/protocols/status", methods=["GET"])
 @jwt_required()
@@ -48,66 +239,7 @@ def get_protocols_status():
         user_identity = get_jwt_identity()
         logger.info(f"Protocol status requested by user: {user_identity}")
 
-        statuses = collect_protocol_status()
-
-        # PR1a: Enhanced active protocol counting with heartbeat staleness check
-        active_count = sum(
-            1
-            for s in statuses
-            if s.get("connected")
-            and s.get("status") == "ready"
-            and not s.get("is_heartbeat_stale", True)
-        )
-
-        # PR1a: Count protocols by availability level
-        availability_summary = {
-            "fully_available": sum(
-                1 for s in statuses if s.get("availability_level") == "fully_available"
-            ),
-            "available": sum(
-                1 for s in statuses if s.get("availability_level") == "available"
-            ),
-            "degraded": sum(
-                1 for s in statuses if s.get("availability_level") == "degraded"
-            ),
-            "unavailable": sum(
-                1 for s in statuses if s.get("availability_level") == "unavailable"
-            ),
-        }
-
-        # PR1a: Count protocols in recovery state
-        recovering_count = sum(1 for s in statuses if s.get("is_recovering", False))
-
-        # PR1a: Calculate overall health score
-        if statuses:
-            health_scores = [s.get("health_score", 0) for s in statuses]
-            overall_health_score = sum(health_scores) / len(health_scores)
-        else:
-            overall_health_score = 0.0
-
-        response_data = {
-            "timestamp": utc_now().isoformat(),
-            "version": PROTOCOLS_API_VERSION,  # PR1a: Version header
-            "summary": {
-                "total_protocols": len(statuses),
-                "active_protocols": active_count,
-                "supported_protocols": [s["name"] for s in statuses],
-                "protocols_list": get_protocols_list(),  # PR1a: Protocols list field
-                # PR1a: Enhanced summary fields
-                "availability_summary": availability_summary,
-                "recovering_protocols": recovering_count,
-                "health_score": round(overall_health_score, 1),
-            },
-            "protocols": {s["name"]: s for s in statuses},
-        }
-
-        # PR1a: Log status summary for monitoring
-        logger.debug(
-            f"Protocol status summary - Active: {active_count}/{len(statuses)}, "
-            f"Health Score: {response_data['summary']['health_score']}%",
-        )
-
-        return jsonify(response_data)
+        return _cached_status_response("protocols", _build_protocols_status)
 
     except Exception as e:
         # PR1a: Enhanced error logging with user context
@@ -127,6 +259,7 @@ def get_protocols_status():
 @multiprotocol_bp.route("/protocols/modbus/devices", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to list Modbus devices")
 def list_modbus_devices():
     """List all Modbus devices and their status.
 
@@ -146,20 +279,16 @@ def list_modbus_devices():
         }
 
     """
-    try:
-        if not hasattr(current_app, "modbus_service"):
-            return jsonify({"error": "Modbus service not available"}), 503
-        return jsonify(current_app.modbus_service.get_device_status())
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to list Modbus devices",
-        )
+    modbus = _get_service("modbus_service")
+    if modbus is None:
+        return _service_unavailable("modbus_service")
+    return jsonify(modbus.get_device_status())
 
 
 @multiprotocol_bp.route("/protocols/modbus/devices", methods=["POST"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to add Modbus device")
 def add_modbus_device():
     """Add a new Modbus TCP device to the system.
 
@@ -185,303 +314,290 @@ def add_modbus_device():
         }
 
     """
-    try:
-        if not hasattr(current_app, "modbus_service"):
-            return jsonify({"error": "Modbus service not available"}), 503
-        data = request.get_json() or {}
-        for f in ["device_id", "unit_id", "host"]:
-            if f not in data:
-                return jsonify({"error": f"Missing required field: {f}"}), 400
-        success = current_app.modbus_service.add_device(
-            device_id=data["device_id"],
-            unit_id=data["unit_id"],
-            host=data["host"],
-            port=data.get("port", 502),
-            device_type=data.get("device_type", "tcp"),
-            timeout=data.get("timeout", 5.0),
-        )
-        if success:
-            return (
-                jsonify(
-                    {
-                        "message": f"Modbus device {data['device_id']} added successfully",
-                        "device_id": data["device_id"],
-                    },
-                ),
-                201,
-            )
-        return jsonify({"error": "Failed to add Modbus device"}), 500
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(e, "Failed to add Modbus device")
+    modbus = _get_service("modbus_service")
+    if modbus is None:
+        return _service_unavailable("modbus_service")
+    data = request.get_json() or {}
+    missing = MODBUS_REQUIRED_FIELDS.difference(data)
+    if missing:
+        return _missing_fields_response(missing)
+    if not is_valid_device_id(data["device_id"]):
+        return _invalid_device_id_response()
+    params = MODBUS_DEVICE_DEFAULTS | data
+    success = modbus.add_device(
+        device_id=params["device_id"],
+        unit_id=params["unit_id"],
+        host=params["host"],
+        port=params["port"],
+        device_type=params["device_type"],
+        timeout=params["timeout"],
+    )
+    return _device_action_response(
+        success,
+        data["device_id"],
+        f"Modbus device {data['device_id']} added successfully",
+        "Failed to add Modbus device",
+        201,
+    )
 
 
 @multiprotocol_bp.route(
-    "/protocols/modbus/devices/<device_id>/connect",
+    "/protocols/modbus/devices/<device_id:device_id>/connect",
     methods=["POST"],
 )
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to connect to Modbus device")
 def connect_modbus_device(device_id):
-    try:
-        if not hasattr(current_app, "modbus_service"):
-            return jsonify({"error": "Modbus service not available"}), 503
-        if current_app.modbus_service.connect_device(device_id):
-            return jsonify(
-                {
-                    "message": f"Connected to Modbus device {device_id}",
-                    "device_id": device_id,
-                },
-            )
-        return jsonify({"error": "Failed to connect to Modbus device"}), 500
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to connect to Modbus device",
-        )
-
-
-@multiprotocol_bp.route("/protocols/modbus/devices/<device_id>/data", methods=["GET"])
+    modbus = _get_service("modbus_service")
+    if modbus is None:
+        return _service_unavailable("modbus_service")
+    return _device_action_response(
+        modbus.connect_device(device_id),
+        device_id,
+        f"Connected to Modbus device {device_id}",
+        "Failed to connect to Modbus device",
+    )
+
+
+@multiprotocol_bp.route("/protocols/modbus/devices/<device_id:device_id>/data", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to read Modbus device data")
 def read_modbus_device_data(device_id):
-    try:
-        if not hasattr(current_app, "modbus_service"):
-            return jsonify({"error": "Modbus service not available"}), 503
-        return jsonify(current_app.modbus_service.read_device_data(device_id))
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to read Modbus device data",
-        )
+    modbus = _get_service("modbus_service")
+    if modbus is None:
+        return _service_unavailable("modbus_service")
+    return jsonify(modbus.read_device_data(device_id))
 
 
 @multiprotocol_bp.route("/protocols/dnp3/devices", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to list DNP3 devices")
 def list_dnp3_devices():
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
-        return jsonify(current_app.dnp3_service.get_device_status())
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(e, "Failed to list DNP3 devices")
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
+    return jsonify(dnp3.get_device_status())
 
 
 @multiprotocol_bp.route("/protocols/dnp3/devices", methods=["POST"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to add DNP3 device")
 def add_dnp3_device():
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
-        data = request.get_json() or {}
-        for f in ["device_id", "master_address", "outstation_address", "host"]:
-            if f not in data:
-                return jsonify({"error": f"Missing required field: {f}"}), 400
-        success = current_app.dnp3_service.add_device(
-            device_id=data["device_id"],
-            master_address=data["master_address"],
-            outstation_address=data["outstation_address"],
-            host=data["host"],
-            port=data.get("port", 20000),
-            link_timeout=data.get("link_timeout", 5.0),
-            app_timeout=data.get("app_timeout", 5.0),
-        )
-        if success:
-            return (
-                jsonify(
-                    {
-                        "message": f"DNP3 device {data['device_id']} added successfully",
-                        "device_id": data["device_id"],
-                    },
-                ),
-                201,
-            )
-        return jsonify({"error": "Failed to add DNP3 device"}), 500
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(e, "Failed to add DNP3 device")
-
-
-@multiprotocol_bp.route("/protocols/dnp3/devices/<device_id>/connect", methods=["POST"])
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
+    data = request.get_json() or {}
+    missing = DNP3_REQUIRED_FIELDS.difference(data)
+    if missing:
+        return _missing_fields_response(missing)
+    if not is_valid_device_id(data["device_id"]):
+        return _invalid_device_id_response()
+    params = DNP3_DEVICE_DEFAULTS | data
+    success = dnp3.add_device(
+        device_id=params["device_id"],
+        master_address=params["master_address"],
+        outstation_address=params["outstation_address"],
+        host=params["host"],
+        port=params["port"],
+        link_timeout=params["link_timeout"],
+        app_timeout=params["app_timeout"],
+    )
+    return _device_action_response(
+        success,
+        data["device_id"],
+        f"DNP3 device {data['device_id']} added successfully",
+        "Failed to add DNP3 device",
+        201,
+    )
+
+
+@multiprotocol_bp.route("/protocols/dnp3/devices/<device_id:device_id>/connect", methods=["POST"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to connect to DNP3 device")
 def connect_dnp3_device(device_id):
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
-        if current_app.dnp3_service.connect_device(device_id):
-            return jsonify(
-                {
-                    "message": f"Connected to DNP3 device {device_id}",
-                    "device_id": device_id,
-                },
-            )
-        return jsonify({"error": "Failed to connect to DNP3 device"}), 500
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to connect to DNP3 device",
-        )
-
-
-@multiprotocol_bp.route("/protocols/dnp3/devices/<device_id>/data", methods=["GET"])
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
+    return _device_action_response(
+        dnp3.connect_device(device_id),
+        device_id,
+        f"Connected to DNP3 device {device_id}",
+        "Failed to connect to DNP3 device",
+    )
+
+
+@multiprotocol_bp.route("/protocols/dnp3/devices/<device_id:device_id>/data", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to read DNP3 device data")
 def read_dnp3_device_data(device_id):
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
-        return jsonify(current_app.dnp3_service.read_device_data(device_id))
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to read DNP3 device data",
-        )
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
+    return jsonify(dnp3.read_device_data(device_id))
 
 
 @multiprotocol_bp.route(
-    "/protocols/dnp3/devices/<device_id>/integrity-poll",
+    "/protocols/dnp3/devices/<device_id:device_id>/integrity-poll",
     methods=["POST"],
 )
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to perform DNP3 integrity poll")
 def perform_dnp3_integrity_poll(device_id):
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
-        if current_app.dnp3_service.perform_integrity_poll(device_id):
-            return jsonify(
-                {
-                    "message": f"Integrity poll completed for DNP3 device {device_id}",
-                    "device_id": device_id,
-                },
-            )
-        return jsonify({"error": "Failed to perform integrity poll"}), 500
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to perform DNP3 integrity poll",
-        )
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
+    return _device_action_response(
+        dnp3.perform_integrity_poll(device_id),
+        device_id,
+        f"Integrity poll completed for DNP3 device {device_id}",
+        "Failed to perform integrity poll",
+    )
+
+
+def _build_unified_status():
+    """Query every protocol service and build the unified devices payload."""
+    app = current_app._get_current_object()
+    modbus = getattr(app, "modbus_service", None)
+    dnp3 = getattr(app, "dnp3_service", None)
+    mqtt = getattr(app, "mqtt_client", None)
+    opcua = getattr(app, "opcua_client", None)
+
+    unified_status = {"timestamp": _now_iso(), "devices": {}}
+    if modbus is not None:
+        mstat = modbus.get_device_status()
+        for did, info in mstat.get("devices", {}).items():
+            unified_status["devices"][did] = {
+                "protocol": "modbus",
+                "status": "connected" if info.get("connected") else "disconnected",
+                "details": info,
+            }
+    if dnp3 is not None:
+        dstat = dnp3.get_device_status()
+        for did, info in dstat.get("devices", {}).items():
+            unified_status["devices"][did] = {
+                "protocol": "dnp3",
+                "status": "connected" if info.get("connected") else "disconnected",
+                "details": info,
+            }
+    if mqtt is not None:
+        mq = mqtt.get_status()
+        unified_status["devices"]["mqtt_client"] = {
+            "protocol": "mqtt",
+            "status": "connected" if mq.get("connected") else "disconnected",
+            "details": mq,
+        }
+    if opcua is not None:
+        op = opcua.get_status()
+        unified_status["devices"]["opcua_client"] = {
+            "protocol": "opcua",
+            "status": "connected" if op.get("connected") else "disconnected",
+            "details": op,
+        }
+    # One pass over the final device map (ids reported by two protocols
+    # keep only the last entry, so counting at insertion would overcount)
+    total = len(unified_status["devices"])
+    connected = 0
+    summary = {}
+    for dev in unified_status["devices"].values():
+        counts = summary.get(dev["protocol"])
+        if counts is None:
+            counts = summary[dev["protocol"]] = {"total": 0, "connected": 0}
+        counts["total"] += 1
+        if dev["status"] == "connected":
+            counts["connected"] += 1
+            connected += 1
+    unified_status["summary"] = {
+        "total_devices": total,
+        "connected_devices": connected,
+        "connection_rate": (connected / total * 100) if total else 0,
+        "protocols": summary,
+    }
+    return unified_status
 
 
 @multiprotocol_bp.route("/protocols/unified/devices", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to get unified devices status")
 def get_unified_devices_status():
-    try:
-        unified_status = {"timestamp": utc_now().isoformat(), "devices": {}}
-        if hasattr(current_app, "modbus_service"):
-            mstat = current_app.modbus_service.get_device_status()
-            for did, info in mstat.get("devices", {}).items():
-                unified_status["devices"][did] = {
-                    "protocol": "modbus",
-                    "status": "connected" if info.get("connected") else "disconnected",
-                    "details": info,
-                }
-        if hasattr(current_app, "dnp3_service"):
-            dstat = current_app.dnp3_service.get_device_status()
-            for did, info in dstat.get("devices", {}).items():
-                unified_status["devices"][did] = {
-                    "protocol": "dnp3",
-                    "status": "connected" if info.get("connected") else "disconnected",
-                    "details": info,
-                }
-        if hasattr(current_app, "mqtt_client"):
-            mq = current_app.mqtt_client.get_status()
-            unified_status["devices"]["mqtt_client"] = {
-                "protocol": "mqtt",
-                "status": "connected" if mq.get("connected") else "disconnected",
-                "details": mq,
-            }
-        if hasattr(current_app, "opcua_client"):
-            op = current_app.opcua_client.get_status()
-            unified_status["devices"]["opcua_client"] = {
-                "protocol": "opcua",
-                "status": "connected" if op.get("connected") else "disconnected",
-                "details": op,
-            }
-        total = len(unified_status["devices"])
-        connected = sum(
-            1 for d in unified_status["devices"].values() if d["status"] == "connected"
-        )
-        summary = {}
-        for dev in unified_status["devices"].values():
-            proto = dev["protocol"]
-            summary.setdefault(proto, {"total": 0, "connected": 0})
-            summary[proto]["total"] += 1
-            if dev["status"] == "connected":
-                summary[proto]["connected"] += 1
-        unified_status["summary"] = {
-            "total_devices": total,
-            "connected_devices": connected,
-            "connection_rate": (connected / total * 100) if total else 0,
-            "protocols": summary,
-        }
-        return jsonify(unified_status)
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to get unified devices status",
-        )
+    return _cached_status_response("unified", _build_unified_status)
+
+
+def _modbus_to_dnp3(point):
+    """Map a processed Modbus register reading to a DNP3 analog input."""
+    return {
+        "index": point.get("address", 0),
+        "data_type": "analog_input",
+        "value": point["processed_value"],
+        "quality": "good",
+        "timestamp": point.get("timestamp"),
+    }
+
+
+def _dnp3_to_modbus(point):
+    """Map a DNP3 point to a Modbus holding register reading."""
+    return {
+        "address": point.get("index", 0),
+        "register_type": "holding_register",
+        "processed_value": point["value"],
+        "timestamp": point.get("timestamp"),
+    }
+
+
+# (source, target) -> (converter, key a source point must carry to convert)
+PROTOCOL_CONVERTERS = {
+    ("modbus", "dnp3"): (_modbus_to_dnp3, "processed_value"),
+    ("dnp3", "modbus"): (_dnp3_to_modbus, "value"),
+}
 
 
 @multiprotocol_bp.route("/protocols/convert/data", methods=["POST"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to convert protocol data")
 def convert_protocol_data():
-    try:
-        data = request.get_json() or {}
-        source_protocol = data.get("source_protocol")
-        target_protocol = data.get("target_protocol")
-        source_data = data.get("data")
-        mapping_config = data.get("mapping_config", {})
-        if not all([source_protocol, target_protocol, source_data]):
-            return jsonify({"error": "Missing required fields"}), 400
-        converted_data = {}
-        if source_protocol == "modbus" and target_protocol == "dnp3":
-            for k, v in source_data.items():
-                if isinstance(v, dict) and "processed_value" in v:
-                    converted_data[k] = {
-                        "index": v.get("address", 0),
-                        "data_type": "analog_input",
-                        "value": v["processed_value"],
-                        "quality": "good",
-                        "timestamp": v.get("timestamp"),
-                    }
-        elif source_protocol == "dnp3" and target_protocol == "modbus":
-            for k, v in source_data.items():
-                if isinstance(v, dict) and "value" in v:
-                    converted_data[k] = {
-                        "address": v.get("index", 0),
-                        "register_type": "holding_register",
-                        "processed_value": v["value"],
-                        "timestamp": v.get("timestamp"),
-                    }
-        elif source_protocol == target_protocol:
-            converted_data = source_data
-        else:
-            return (
-                jsonify(
-                    {
-                        "error": f"Conversion from {source_protocol} to {target_protocol} not supported",
-                    },
-                ),
-                400,
-            )
-        return jsonify(
-            {
-                "source_protocol": source_protocol,
-                "target_protocol": target_protocol,
-                "conversion_timestamp": utc_now().isoformat(),
-                "converted_data": converted_data,
-                "mapping_applied": bool(mapping_config),
-            },
-        )
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to convert protocol data",
+    data = request.get_json() or {}
+    source_protocol = data.get("source_protocol")
+    target_protocol = data.get("target_protocol")
+    source_data = data.get("data")
+    mapping_config = data.get("mapping_config", {})
+    if not all([source_protocol, target_protocol, source_data]):
+        return jsonify({"error": "Missing required fields"}), 400
+    converter = PROTOCOL_CONVERTERS.get((source_protocol, target_protocol))
+    if converter is not None:
+        convert, value_key = converter
+        converted_data = {
+            k: convert(v)
+            for k, v in source_data.items()
+            if isinstance(v, dict) and value_key in v
+        }
+    elif source_protocol == target_protocol:
+        converted_data = source_data
+    else:
+        return (
+            jsonify(
+                {
+                    "error": f"Conversion from {source_protocol} to {target_protocol} not supported",
+                },
+            ),
+            400,
         )
+    return jsonify(
+        {
+            "source_protocol": source_protocol,
+            "target_protocol": target_protocol,
+            "conversion_timestamp": _now_iso(),
+            "converted_data": converted_data,
+            "mapping_applied": bool(mapping_config),
+        },
+    )
 
 
 # DNP3 Performance Monitoring Endpoints
@@ -490,120 +606,100 @@ def convert_protocol_data():
 @multiprotocol_bp.route("/protocols/dnp3/performance/metrics", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to get DNP3 performance metrics")
 def get_dnp3_performance_metrics():
     """Get detailed DNP3 performance metrics."""
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
 
-        metrics = current_app.dnp3_service.get_performance_metrics()
-        return jsonify(metrics)
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to get DNP3 performance metrics",
-        )
+    metrics = dnp3.get_performance_metrics()
+    return jsonify(metrics)
 
 
 @multiprotocol_bp.route("/protocols/dnp3/performance/summary", methods=["GET"])
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to get DNP3 performance summary")
 def get_dnp3_performance_summary():
     """Get DNP3 performance summary."""
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
 
-        summary = current_app.dnp3_service.get_performance_summary()
-        return jsonify(summary)
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to get DNP3 performance summary",
-        )
+    summary = dnp3.get_performance_summary()
+    return jsonify(summary)
 
 
 @multiprotocol_bp.route(
-    "/protocols/dnp3/devices/<device_id>/performance",
+    "/protocols/dnp3/devices/<device_id:device_id>/performance",
     methods=["GET"],
 )
 @jwt_required()
 @permission_required("read_units")
+@safe_endpoint("Failed to get performance stats for DNP3 device {device_id}")
 def get_dnp3_device_performance(device_id):
     """Get performance statistics for a specific DNP3 device."""
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
 
-        stats = current_app.dnp3_service.get_device_performance_stats(device_id)
-        if "error" in stats:
-            return jsonify(stats), 404
-        return jsonify(stats)
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            f"Failed to get performance stats for DNP3 device {device_id}",
-        )
+    stats = dnp3.get_device_performance_stats(device_id)
+    if "error" in stats:
+        return jsonify(stats), 404
+    return jsonify(stats)
 
 
 @multiprotocol_bp.route("/protocols/dnp3/performance/config", methods=["POST"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to configure DNP3 performance")
 def configure_dnp3_performance():
     """Configure DNP3 performance optimization settings."""
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
 
-        data = request.get_json() or {}
+    data = request.get_json() or {}
 
-        # Validate input types
-        caching = data.get("enable_caching", True)
-        bulk_operations = data.get("enable_bulk_operations", True)
+    # Validate input types
+    caching = data.get("enable_caching", True)
+    bulk_operations = data.get("enable_bulk_operations", True)
 
-        if not isinstance(caching, bool):
-            return jsonify({"error": "enable_caching must be a boolean"}), 400
-        if not isinstance(bulk_operations, bool):
-            return jsonify({"error": "enable_bulk_operations must be a boolean"}), 400
+    if not isinstance(caching, bool):
+        return jsonify({"error": "enable_caching must be a boolean"}), 400
+    if not isinstance(bulk_operations, bool):
+        return jsonify({"error": "enable_bulk_operations must be a boolean"}), 400
 
-        current_app.dnp3_service.enable_performance_optimizations(
-            caching=caching,
-            bulk_operations=bulk_operations,
-        )
+    dnp3.enable_performance_optimizations(
+        caching=caching,
+        bulk_operations=bulk_operations,
+    )
 
-        return jsonify(
-            {
-                "message": "DNP3 performance configuration updated",
-                "caching_enabled": caching,
-                "bulk_operations_enabled": bulk_operations,
-                "timestamp": utc_now().isoformat(),
-            },
-        )
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to configure DNP3 performance",
-        )
+    return jsonify(
+        {
+            "message": "DNP3 performance configuration updated",
+            "caching_enabled": caching,
+            "bulk_operations_enabled": bulk_operations,
+            "timestamp": _now_iso(),
+        },
+    )
 
 
 @multiprotocol_bp.route("/protocols/dnp3/performance/metrics", methods=["DELETE"])
 @jwt_required()
 @permission_required("admin_panel")
+@safe_endpoint("Failed to clear DNP3 performance metrics")
 def clear_dnp3_performance_metrics():
     """Clear DNP3 performance metrics (useful for testing)."""
-    try:
-        if not hasattr(current_app, "dnp3_service"):
-            return jsonify({"error": "DNP3 service not available"}), 503
+    dnp3 = _get_service("dnp3_service")
+    if dnp3 is None:
+        return _service_unavailable("dnp3_service")
 
-        current_app.dnp3_service.clear_performance_metrics()
-        return jsonify(
-            {
-                "message": "DNP3 performance metrics cleared",
-                "timestamp": utc_now().isoformat(),
-            },
-        )
-    except Exception as e:
-        return SecurityAwareErrorHandler.handle_error(
-            e,
-            "Failed to clear DNP3 performance metrics",
-        )
+    dnp3.clear_performance_metrics()
+    return jsonify(
+        {
+            "message": "DNP3 performance metrics cleared",
+            "timestamp": _now_iso(),
+        },
+    )
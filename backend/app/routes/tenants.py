@@ -85,6 +85,13 @@ class TenantUpdateSchema(Schema):
     max_units = fields.Int(allow_none=True)
 
 
+# Schemas are stateless, so build them once instead of on every request
+_tenant_schema = TenantSchema()
+_tenants_schema = TenantSchema(many=True)
+_tenant_create_schema = TenantCreateSchema()
+_tenant_update_schema = TenantUpdateSchema()
+
+
 @tenants_bp.route("/tenants", methods=["GET"])
 @jwt_required()
 @permission_required("admin_panel")
@@ -132,11 +139,9 @@ def get_tenants():
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
     # Serialize results
-    tenant_schema = TenantSchema(many=True)
-
     return jsonify(
         {
-            "data": tenant_schema.dump(pagination.items),
+            "data": _tenants_schema.dump(pagination.items),
             "page": page,
             "per_page": per_page,
             "total": pagination.total,
@@ -175,8 +180,7 @@ def get_tenant(tenant_id):
     unit_count = Unit.query.filter_by(tenant_id=tenant_id).count()
 
     # Serialize tenant
-    tenant_schema = TenantSchema()
-    tenant_data = tenant_schema.dump(tenant)
+    tenant_data = _tenant_schema.dump(tenant)
 
     # Add statistics
     tenant_data["stats"] = {
@@ -213,9 +217,8 @@ def create_tenant():
       - JWT: []
     """
     # Validate request data
-    schema = TenantCreateSchema()
     try:
-        data = schema.load(request.json)
+        data = _tenant_create_schema.load(request.json)
     except ValidationError as err:
         return jsonify({"error": "Validation error", "details": err.messages}), 400
 
@@ -227,8 +230,7 @@ def create_tenant():
         db.session.commit()
 
         # Serialize and return
-        tenant_schema = TenantSchema()
-        return jsonify({"data": tenant_schema.dump(tenant)}), 201
+        return jsonify({"data": _tenant_schema.dump(tenant)}), 201
 
     except IntegrityError as e:
         db.session.rollback()
@@ -273,9 +275,8 @@ def update_tenant(tenant_id):
     tenant = Tenant.query.get_or_404(tenant_id)
 
     # Validate request data
-    schema = TenantUpdateSchema()
     try:
-        data = schema.load(request.json, partial=True)
+        data = _tenant_update_schema.load(request.json, partial=True)
     except ValidationError as err:
         return jsonify({"error": "Validation error", "details": err.messages}), 400
 
@@ -289,8 +290,7 @@ def update_tenant(tenant_id):
         db.session.commit()
 
         # Serialize and return
-        tenant_schema = TenantSchema()
-        return jsonify({"data": tenant_schema.dump(tenant)})
+        return jsonify({"data": _tenant_schema.dump(tenant)})
 
     except IntegrityError as e:
         db.session.rollback()
@@ -403,8 +403,7 @@ def get_current_tenant():
     tenant = Tenant.query.get_or_404(tenant_id)
 
     # Serialize and return
-    tenant_schema = TenantSchema()
-    return jsonify({"data": tenant_schema.dump(tenant)})
+    return jsonify({"data": _tenant_schema.dump(tenant)})
 
 
 @tenants_bp.route("/tenants/switch", methods=["POST"])
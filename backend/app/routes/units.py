@@ -24,6 +24,19 @@ from app.utils.schemas import (
 from app.utils.validation import validate_json_request
 
 units_bp = Blueprint("units", __name__)
+
+# Schemas are stateless, so build them once instead of on every request
+_unit_schema = UnitSchema()
+_units_schema = UnitSchema(many=True)
+_unit_create_schema = UnitCreateSchema()
+_unit_update_schema = UnitUpdateSchema()
+_unit_status_update_schema = UnitUpdateSchema(
+    only=("status", "health_status", "has_alert", "has_alarm"),
+)
+_sensor_schema = SensorSchema()
+_sensors_schema = SensorSchema(many=True)
+_sensor_create_schema = SensorCreateSchema()
+_readings_schema = SensorReadingSchema(many=True)
 logger = logging.getLogger(__name__)
 
 
@@ -105,12 +118,10 @@ def get_units():
     # Apply pagination
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
-    units_schema = UnitSchema(many=True)
-
     return (
         jsonify(
             {
-                "data": units_schema.dump(pagination.items),
+                "data": _units_schema.dump(pagination.items),
                 "page": page,
                 "per_page": per_page,
                 "total": pagination.total,
@@ -147,8 +158,7 @@ def get_unit(unit_id):
       - JWT: []
     """
     unit = Unit.query.get_or_404(unit_id)
-    unit_schema = UnitSchema()
-    return jsonify(unit_schema.dump(unit)), 200
+    return jsonify(_unit_schema.dump(unit)), 200
 
 
 @units_bp.route("/units", methods=["POST"])
@@ -183,10 +193,9 @@ def create_unit():
     security:
       - JWT: []
     """
-    schema = UnitCreateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _unit_create_schema.load(request.json)
     except ValidationError as err:
         logger.warning(f"Validation failed in create_unit: {err.messages}")
         return jsonify({"error": "Validation error", "details": err.messages}), 400
@@ -209,8 +218,7 @@ def create_unit():
         # Refresh to get database-generated timestamp
         db.session.refresh(unit)
 
-        unit_schema = UnitSchema()
-        return jsonify(unit_schema.dump(unit)), 201
+        return jsonify(_unit_schema.dump(unit)), 201
 
     except IntegrityError as e:
         db.session.rollback()
@@ -256,10 +264,9 @@ def update_unit(unit_id):
       - JWT: []
     """
     unit = Unit.query.get_or_404(unit_id)
-    schema = UnitUpdateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _unit_update_schema.load(request.json)
     except ValidationError as err:
         logger.warning(f"Validation failed in update_unit: {err.messages}")
         return jsonify({"error": "Validation error", "details": err.messages}), 400
@@ -275,8 +282,7 @@ def update_unit(unit_id):
         # Refresh to get database-generated timestamp
         db.session.refresh(unit)
 
-        unit_schema = UnitSchema()
-        return jsonify(unit_schema.dump(unit)), 200
+        return jsonify(_unit_schema.dump(unit)), 200
 
     except IntegrityError:
         db.session.rollback()
@@ -340,8 +346,7 @@ def get_unit_sensors(unit_id):
       - JWT: []
     """
     unit = Unit.query.get_or_404(unit_id)
-    sensors_schema = SensorSchema(many=True)
-    return jsonify(sensors_schema.dump(unit.sensors)), 200
+    return jsonify(_sensors_schema.dump(unit.sensors)), 200
 
 
 @units_bp.route("/units/<string:unit_id>/sensors", methods=["POST"])
@@ -377,10 +382,9 @@ def create_unit_sensor(unit_id):
     """
     # Validate that the unit exists
     Unit.query.get_or_404(unit_id)
-    schema = SensorCreateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _sensor_create_schema.load(request.json)
     except ValidationError as err:
         logger.warning(f"Validation failed in create_unit_sensor: {err.messages}")
         return jsonify({"error": "Validation error", "details": err.messages}), 400
@@ -395,8 +399,7 @@ def create_unit_sensor(unit_id):
     # Refresh to get database-generated timestamp
     db.session.refresh(sensor)
 
-    sensor_schema = SensorSchema()
-    return jsonify(sensor_schema.dump(sensor)), 201
+    return jsonify(_sensor_schema.dump(sensor)), 201
 
 
 @units_bp.route("/units/<string:unit_id>/readings", methods=["GET"])
@@ -461,8 +464,7 @@ def get_unit_readings(unit_id):
 
     readings = query.order_by(SensorReading.timestamp.desc()).limit(1000).all()
 
-    readings_schema = SensorReadingSchema(many=True)
-    return jsonify(readings_schema.dump(readings)), 200
+    return jsonify(_readings_schema.dump(readings)), 200
 
 
 @units_bp.route("/units/<string:unit_id>/status", methods=["PATCH"])
@@ -508,9 +510,7 @@ def update_unit_status(unit_id):
     """
     unit = Unit.query.get_or_404(unit_id)
     try:
-        data = UnitUpdateSchema(
-            only=("status", "health_status", "has_alert", "has_alarm"),
-        ).load(request.json)
+        data = _unit_status_update_schema.load(request.json)
     except ValidationError as err:
         return jsonify({"error": "Validation error", "messages": err.messages}), 400
 
@@ -560,8 +560,7 @@ def update_unit_status(unit_id):
     # Refresh to get database-generated timestamp
     db.session.refresh(unit)
 
-    unit_schema = UnitSchema()
-    return jsonify(unit_schema.dump(unit)), 200
+    return jsonify(_unit_schema.dump(unit)), 200
 
 
 @units_bp.route("/units/stats", methods=["GET"])
@@ -17,6 +17,12 @@ from app.utils.schemas import RoleSchema, UserSchema, UserUpdateSchema
 
 users_bp = Blueprint("users", __name__)
 
+# Schemas are stateless, so build them once instead of on every request
+_user_schema = UserSchema()
+_users_schema = UserSchema(many=True)
+_user_update_schema = UserUpdateSchema()
+_roles_schema = RoleSchema(many=True)
+
 
 @users_bp.route("/users", methods=["GET"])
 @jwt_required()
@@ -95,12 +101,10 @@ def get_users():
     # Apply pagination
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
-    users_schema = UserSchema(many=True)
-
     return (
         jsonify(
             {
-                "data": users_schema.dump(pagination.items),
+                "data": _users_schema.dump(pagination.items),
                 "page": page,
                 "per_page": per_page,
                 "total": pagination.total,
@@ -137,8 +141,7 @@ def get_user(user_id):
       - JWT: []
     """
     user = User.query.get_or_404(user_id)
-    user_schema = UserSchema()
-    return jsonify(user_schema.dump(user)), 200
+    return jsonify(_user_schema.dump(user)), 200
 
 
 @users_bp.route("/users/<int:user_id>", methods=["PUT"])
@@ -185,10 +188,8 @@ def update_user(user_id):
     if not success or current_user_id is None:
         return jsonify({"error": "Invalid token format"}), 401
 
-    schema = UserUpdateSchema()
-
     try:
-        data = schema.load(request.json)
+        data = _user_update_schema.load(request.json)
     except ValidationError as err:
         return jsonify({"error": "Validation error", "details": err.messages}), 400
 
@@ -216,8 +217,7 @@ def update_user(user_id):
         # Refresh to get database-generated timestamp
         db.session.refresh(user)
 
-        user_schema = UserSchema()
-        return jsonify(user_schema.dump(user)), 200
+        return jsonify(_user_schema.dump(user)), 200
 
     except IntegrityError as e:
         db.session.rollback()
@@ -309,8 +309,7 @@ def activate_user(user_id):
     # Refresh to get database-generated timestamp
     db.session.refresh(user)
 
-    user_schema = UserSchema()
-    return jsonify(user_schema.dump(user)), 200
+    return jsonify(_user_schema.dump(user)), 200
 
 
 @users_bp.route("/users/<int:user_id>/deactivate", methods=["PATCH"])
@@ -353,8 +352,7 @@ def deactivate_user(user_id):
     # Refresh to get database-generated timestamp
     db.session.refresh(user)
 
-    user_schema = UserSchema()
-    return jsonify(user_schema.dump(user)), 200
+    return jsonify(_user_schema.dump(user)), 200
 
 
 @users_bp.route("/roles", methods=["GET"])
@@ -377,8 +375,7 @@ def get_roles():
       - JWT: []
     """
     roles = Role.query.all()
-    roles_schema = RoleSchema(many=True)
-    return jsonify(roles_schema.dump(roles)), 200
+    return jsonify(_roles_schema.dump(roles)), 200
 
 
 @users_bp.route("/users/stats", methods=["GET"])
@@ -682,12 +679,10 @@ def get_pending_users():
     # Apply pagination
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
-    users_schema = UserSchema(many=True)
-
     return (
         jsonify(
             {
-                "data": users_schema.dump(pagination.items),
+                "data": _users_schema.dump(pagination.items),
                 "page": page,
                 "per_page": per_page,
                 "total": pagination.total,
@@ -768,12 +763,11 @@ def approve_user(user_id):
         db.session.commit()
         db.session.refresh(user)
 
-        user_schema = UserSchema()
         return (
             jsonify(
                 {
                     "message": "User approved successfully",
-                    "user": user_schema.dump(user),
+                    "user": _user_schema.dump(user),
                 },
             ),
             200,
@@ -857,12 +851,11 @@ def reject_user(user_id):
         db.session.commit()
         db.session.refresh(user)
 
-        user_schema = UserSchema()
         return (
             jsonify(
                 {
                     "message": "User rejected successfully",
-                    "user": user_schema.dump(user),
+                    "user": _user_schema.dump(user),
                 },
             ),
             200,
@@ -43,6 +43,10 @@ def _init_database():
                 "006_add_emergency_admin_permissions.sql",  # Postgres version (has DO $$)
                 "008_add_user_profile_fields_comprehensive.sql",
                 "009_add_user_approval_columns.sql",
+                "010_add_daily_critical_readings_view.sql",
+                "012_add_covering_sensor_indexes.sql",
+                "013_add_sensor_reading_rollups.sql",
+                "014_add_sensor_reading_brin_index.sql",
             ]
 
             for fname in sql_migration_files:
@@ -267,6 +271,25 @@ def db_session(app):
             db.session.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Clear in-process response caches so cached payloads never leak between tests."""
+    from app.middleware.authorization import invalidate_auth_cache
+    from app.routes.analytics import clear_analytics_cache
+    from app.routes.historical import clear_historical_cache
+    from app.routes.multiprotocol import clear_protocol_status_cache
+
+    clear_analytics_cache()
+    clear_historical_cache()
+    clear_protocol_status_cache()
+    invalidate_auth_cache()
+    yield
+    clear_analytics_cache()
+    clear_historical_cache()
+    clear_protocol_status_cache()
+    invalidate_auth_cache()
+
+
 @pytest.fixture
 def reset_service_manager():
     """Reset service_manager state before and after test."""
@@ -8,15 +8,28 @@ from flask import json
 from app.models import Unit, Sensor, SensorReading, db
 
 
+def _dashboard_stats_row(**values):
+    """Build the single row returned by the combined dashboard statement."""
+    from types import SimpleNamespace
+
+    return SimpleNamespace(**values)
+
+
 def test_get_dashboard_summary_empty(client, admin_token):
     """Test dashboard summary with an empty database."""
     headers = {"Authorization": f"Bearer {admin_token}"}
     
-    with patch("app.models.db.session.query") as mock_query:
-        query_mock = mock_query.return_value
-        query_mock.scalar.side_effect = [0, 0]
-        query_mock.filter.return_value.scalar.side_effect = [0, 0, 0, 0]
-        query_mock.filter.return_value.join.return_value.scalar.side_effect = [None, None]
+    with patch("app.models.db.session.execute") as mock_execute:
+        mock_execute.return_value.one.return_value = _dashboard_stats_row(
+            total_units=0,
+            active_units=0,
+            total_sensors=0,
+            recent_readings=0,
+            current_week_readings=0,
+            previous_week_readings=0,
+            avg_temperature=None,
+            max_temperature=None,
+        )
         
         response = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
         assert response.status_code == 200
@@ -35,11 +48,17 @@ def test_get_dashboard_summary_with_data(client, admin_token):
     """Test dashboard summary with filled dataset."""
     headers = {"Authorization": f"Bearer {admin_token}"}
     
-    with patch("app.models.db.session.query") as mock_query:
-        query_mock = mock_query.return_value
-        query_mock.scalar.side_effect = [10, 30]
-        query_mock.filter.return_value.scalar.side_effect = [8, 240, 1500, 1000]
-        query_mock.filter.return_value.join.return_value.scalar.side_effect = [45.2, 85.0]
+    with patch("app.models.db.session.execute") as mock_execute:
+        mock_execute.return_value.one.return_value = _dashboard_stats_row(
+            total_units=10,
+            active_units=8,
+            total_sensors=30,
+            recent_readings=240,
+            current_week_readings=1500,
+            previous_week_readings=1000,
+            avg_temperature=45.2,
+            max_temperature=85.0,
+        )
         
         response = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
         assert response.status_code == 200
@@ -57,20 +76,27 @@ def test_get_unit_trends_not_found(client, admin_token):
     """Test get_unit_trends when unit does not exist."""
     headers = {"Authorization": f"Bearer {admin_token}"}
     
-    with patch("app.models.Unit.query") as mock_unit_query:
-        mock_unit_query.get.return_value = None
-        response = client.get("/api/v1/analytics/trends/NON_EXIST_UNIT", headers=headers)
-        assert response.status_code == 404
-        assert "Unit not found" in response.get_json()["error"]
+    response = client.get("/api/v1/analytics/trends/NON_EXIST_UNIT", headers=headers)
+    assert response.status_code == 404
+    assert "Unit not found" in response.get_json()["error"]
+
+
+def test_get_unit_trends_existing_unit_without_readings(client, admin_token):
+    """A known unit with no readings in range returns empty trends, not 404."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    with patch("app.models.db.session.query") as mock_query:
+        mock_query.return_value.join.return_value.filter.return_value.order_by.return_value.yield_per.return_value.__iter__.return_value = iter([])
+        response = client.get("/api/v1/analytics/trends/TEST001", headers=headers)
+
+    assert response.status_code == 200
+    assert response.get_json()["trends"] == {}
 
 
 def test_get_unit_trends_success(client, admin_token):
     """Test get_unit_trends calculations and grouping."""
     headers = {"Authorization": f"Bearer {admin_token}"}
     
-    mock_unit = MagicMock()
-    mock_unit.id = "UNIT001"
-    
     # Mock database return records
     class MockReadingRecord:
         def __init__(self, timestamp, value, sensor_type, name):
@@ -87,13 +113,15 @@ def test_get_unit_trends_success(client, admin_token):
         MockReadingRecord(now - timedelta(hours=2), 101.5, "pressure", "Press 1"),
     ]
 
-    with patch("app.models.Unit.query") as mock_unit_query, \
-         patch("app.models.db.session.query") as mock_query:
-        
-        mock_unit_query.get.return_value = mock_unit
+    with patch("app.models.db.session.query") as mock_query:
         
-        # Configure the chain query: join, filter, filter, order_by, all
-        mock_query.return_value.join.return_value.filter.return_value.order_by.return_value.all.return_value = records
+        # Configure the chain query: join, filter, order_by, yield_per (iterated)
+        mock_query.return_value.join.return_value.filter.return_value.order_by.return_value.yield_per.return_value.__iter__.return_value = iter(records)
+        # Statistics aggregate: join, filter, group_by, all
+        mock_query.return_value.join.return_value.filter.return_value.group_by.return_value.all.return_value = [
+            MagicMock(sensor_type="temperature", min=20.0, max=30.0, avg=25.0, count=3),
+            MagicMock(sensor_type="pressure", min=101.5, max=101.5, avg=101.5, count=1),
+        ]
         
         # Test default trends (days=7)
         response = client.get("/api/v1/analytics/trends/UNIT001", headers=headers)
@@ -102,6 +130,12 @@ def test_get_unit_trends_success(client, admin_token):
         assert data["unit_id"] == "UNIT001"
         assert "temperature" in data["trends"]
         assert "pressure" in data["trends"]
+        assert data["trends"]["temperature"]["values"] == [20.0, 30.0, 25.0]
+        assert data["trends"]["temperature"]["timestamps"] == [
+            (r.timestamp - datetime(1970, 1, 1, tzinfo=timezone.utc))
+            // timedelta(milliseconds=1)
+            for r in records[:3]
+        ]
         
         # Statistics for temperature: min=20, max=30, avg=25, count=3
         temp_stats = data["trends"]["temperature"]["statistics"]
@@ -111,45 +145,91 @@ def test_get_unit_trends_success(client, admin_token):
         assert temp_stats["count"] == 3
 
 
-def test_get_units_performance(client, admin_token):
+def _add_performance_units(db_session):
+    """Create U1 (online, 30 readings), U2 (offline, none), U3 (maintenance, 10)."""
+    from app.models import UnitStatusEnum
+
+    now = datetime.now(timezone.utc)
+    for uid, status, count in (
+        ("U1", UnitStatusEnum.ONLINE, 30),
+        ("U2", UnitStatusEnum.OFFLINE, 0),
+        ("U3", UnitStatusEnum.MAINTENANCE, 10),
+    ):
+        db_session.add(
+            Unit(
+                id=uid,
+                name=f"Unit {uid[1:]}",
+                serial_number=f"{uid}-PERF",
+                install_date=now,
+                status=status,
+            ),
+        )
+        db_session.flush()
+        if not count:
+            continue
+        sensor = Sensor(unit_id=uid, name=f"{uid} temp", sensor_type="temperature")
+        db_session.add(sensor)
+        db_session.flush()
+        db_session.add_all(
+            SensorReading(
+                sensor_id=sensor.id,
+                timestamp=now - timedelta(minutes=i + 1),
+                value=20.0 + i,
+            )
+            for i in range(count)
+        )
+    db_session.flush()
+
+
+def test_get_units_performance(client, admin_token, db_session):
     """Test get_units_performance score calculations and status scoring."""
     headers = {"Authorization": f"Bearer {admin_token}"}
-    
-    # Mock performance data per unit
-    class MockPerformanceData:
-        def __init__(self, uid, name, status, count, avg, mx, mn):
-            self.id = uid
-            self.name = name
-            self.status = status
-            self.reading_count = count
-            self.avg_value = avg
-            self.max_value = mx
-            self.min_value = mn
+    _add_performance_units(db_session)
 
-    mock_records = [
-        # online, 100 readings -> perfect score 100
-        MockPerformanceData("U1", "Unit 1", "online", 50, 23.5, 30.0, 15.0),
-        # offline, 0 readings -> score 100 - 50 (no readings) - 30 (offline) = 20
-        MockPerformanceData("U2", "Unit 2", "offline", 0, None, None, None),
-        # maintenance, 10 readings -> score 100 - 20 (low count) - 10 (maintenance) = 70
-        MockPerformanceData("U3", "Unit 3", "maintenance", 10, 50.0, 60.0, 40.0),
-    ]
+    response = client.get("/api/v1/analytics/performance/units?hours=24", headers=headers)
+    assert response.status_code == 200
+    data = response.get_json()
 
-    with patch("app.models.db.session.query") as mock_query:
-        # Mock outerjoin, outerjoin, group_by, all
-        mock_query.return_value.outerjoin.return_value.outerjoin.return_value.group_by.return_value.all.return_value = mock_records
-        
-        response = client.get("/api/v1/analytics/performance/units?hours=24", headers=headers)
-        assert response.status_code == 200
-        data = response.get_json()
-        
-        assert data["summary"]["total_units"] == 3
-        # Scores are: U1=100, U3=70, U2=20. Average is 63.3
-        assert data["summary"]["avg_performance"] == pytest.approx(63.3, 0.1)
-        assert data["units"][0]["unit_id"] == "U1"
-        assert data["units"][0]["performance_score"] == 100
-        assert data["units"][2]["unit_id"] == "U2"
-        assert data["units"][2]["performance_score"] == 20
+    scores = {u["unit_id"]: u["performance_score"] for u in data["units"]}
+    # online with >= 1 reading/hour -> 100
+    assert scores["U1"] == 100
+    # offline, 0 readings -> 100 - 50 (no readings) - 30 (offline) = 20
+    assert scores["U2"] == 20
+    # maintenance, 10 readings -> 100 - 20 (low count) - 10 (maintenance) = 70
+    assert scores["U3"] == 70
+
+    # Ranked by score descending, summary over every unit
+    ranked = [u["performance_score"] for u in data["units"]]
+    assert ranked == sorted(ranked, reverse=True)
+    assert data["summary"]["total_units"] == len(data["units"])
+    assert data["summary"]["avg_performance"] == pytest.approx(
+        sum(ranked) / len(ranked),
+    )
+    assert data["summary"]["best_performing"] == data["units"][0]
+    assert data["summary"]["worst_performing"]["unit_id"] == "U2"
+    u1 = next(u for u in data["units"] if u["unit_id"] == "U1")
+    assert u1["status"] == "online"
+    assert u1["reading_count"] == 30
+    assert u1["min_value"] == 20.0
+    assert u1["max_value"] == 49.0
+
+
+def test_get_units_performance_paginated(client, admin_token, db_session):
+    """limit/offset slice the ranked units while the summary covers all units."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    _add_performance_units(db_session)
+
+    full = client.get(
+        "/api/v1/analytics/performance/units?hours=24",
+        headers=headers,
+    ).get_json()
+    page = client.get(
+        "/api/v1/analytics/performance/units?hours=24&limit=1&offset=1",
+        headers=headers,
+    ).get_json()
+
+    assert page["units"] == full["units"][1:2]
+    assert page["summary"] == full["summary"]
 
 
 def test_get_alert_patterns_empty(client, admin_token):
@@ -197,3 +277,33 @@ def test_get_alert_patterns_success(client, admin_token):
         assert data["most_problematic_sensor"] == "temperature"
         assert data["sensor_type_breakdown"]["temperature"] == 5
         assert data["sensor_type_breakdown"]["pressure"] == 3
+
+
+def test_get_alert_patterns_reads_materialized_view(client, admin_token):
+    """Alert patterns come from daily_critical_readings when the view is enabled."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    view_rows = [
+        MagicMock(count=0, date="2024-01-01", sensor_type=None),
+        MagicMock(count=4, date="2024-01-02", sensor_type="flow"),
+    ]
+
+    with patch(
+        "app.routes.analytics._use_materialized_views", return_value=True
+    ), patch("app.models.db.session.execute") as mock_execute, patch(
+        "app.models.db.session.query"
+    ) as mock_query:
+        mock_execute.return_value.all.return_value = view_rows
+
+        response = client.get("/api/v1/analytics/alerts/patterns?days=10", headers=headers)
+        assert response.status_code == 200
+        data = response.get_json()
+
+        sql = str(mock_execute.call_args[0][0])
+        assert "daily_critical_readings" in sql
+        assert "generate_series" in sql
+        mock_query.assert_not_called()
+        assert data["total_potential_alerts"] == 4
+        # Days without critical readings are present with no counts
+        assert data["daily_patterns"] == {"2024-01-01": {}, "2024-01-02": {"flow": 4}}
+        assert data["most_problematic_sensor"] == "flow"
@@ -1,5 +1,6 @@
 """Test suite for audit logging middleware (PR3)."""
 
+import logging
 from unittest.mock import patch
 
 import pytest
@@ -12,6 +13,8 @@ from app.middleware.audit import (
     audit_login_success,
     audit_operation,
     audit_permission_check,
+    disable_async_audit_logging,
+    enable_async_audit_logging,
 )
 from app.models import Role, RoleEnum, User
 
@@ -36,6 +39,25 @@ class TestAuditLogger:
             assert "AUDIT: login_success" in message
             assert "testuser" in message
 
+    def test_log_event_skips_disabled_levels(self):
+        """Test records below the audit logger's level are not built."""
+        with (
+            patch("app.middleware.audit.logger") as mock_logger,
+            patch("app.middleware.audit.redact_sensitive_data") as mock_redact,
+        ):
+            mock_logger.isEnabledFor.return_value = False
+            AuditLogger.log_authorization_event(
+                permission="read_units",
+                granted=True,
+                user_id=1,
+                username="admin",
+                details={"user_role": "admin"},
+            )
+
+            mock_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+            mock_redact.assert_not_called()
+            assert not mock_logger.info.called
+
     def test_log_authentication_event_success(self):
         """Test logging successful authentication events."""
         with patch("app.middleware.audit.logger") as mock_logger:
@@ -266,6 +288,40 @@ class TestAuditMiddleware:
                 # Note: This test may not trigger the audit due to endpoint filtering
                 # In a real scenario, we'd test with an actual API endpoint
 
+    def test_async_audit_logging_keeps_request_id(self, app):
+        """Test queued audit records reach the root handlers with their request ID."""
+        records = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        capture = Capture()
+        root_logger = logging.getLogger()
+        root_logger.addHandler(capture)
+        enable_async_audit_logging()
+        try:
+            with app.test_request_context("/api/v1/units"):
+                from flask import g
+
+                g.request_id = "req-async-audit"
+                AuditLogger.log_event(
+                    event_type=AuditEventType.READ,
+                    user_id=1,
+                    username="admin",
+                    resource="units",
+                    action="list",
+                )
+        finally:
+            # Stopping the listener flushes everything still queued
+            disable_async_audit_logging()
+            root_logger.removeHandler(capture)
+
+        audit_records = [r for r in records if hasattr(r, "audit")]
+        assert len(audit_records) == 1
+        assert audit_records[0].request_id == "req-async-audit"
+        assert logging.getLogger("app.middleware.audit").propagate is True
+
 
 class TestAuditEventTypes:
     """Test audit event type definitions."""
@@ -44,6 +44,101 @@ class TestAuthentication:
         assert "user" in data
         assert data["user"]["username"] == "admin"
 
+    def test_login_token_carries_role_but_no_permission_claims(self, client):
+        """Access tokens embed the role; permissions are always read server-side."""
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": "admin", "password": "admin123"},
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        token = unwrap_response(response)["access_token"]
+        claims = jwt.decode(token, options={"verify_signature": False})
+
+        admin = User.query.filter_by(username="admin").first()
+        assert claims["role"] == admin.role.name.value
+        assert "perms" not in claims
+
+    def test_login_selects_user_role_and_permissions_once(self, client):
+        """Login fetches the user, role and permissions in a single SELECT."""
+        from sqlalchemy import event
+
+        from app import db
+
+        selects = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                "/api/v1/auth/login",
+                json={"username": "admin", "password": "admin123"},
+                headers={"Content-Type": "application/json"},
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(selects) == 1
+
+    def test_login_upgrades_legacy_password_hash(self, client, db_session):
+        """A pbkdf2:sha256 hash still logs in and is rehashed with Argon2id."""
+        from werkzeug.security import generate_password_hash
+
+        admin = User.query.filter_by(username="admin").first()
+        admin.password_hash = generate_password_hash("admin123", method="pbkdf2:sha256")
+        db_session.commit()
+
+        try:
+            response = client.post(
+                "/api/v1/auth/login",
+                json={"username": "admin", "password": "admin123"},
+                headers={"Content-Type": "application/json"},
+            )
+
+            assert response.status_code == 200
+            admin = User.query.filter_by(username="admin").first()
+            assert admin.password_hash.startswith("$argon2id$")
+            assert admin.check_password("admin123") is True
+            assert admin.check_password("wrong-password") is False
+        finally:
+            admin.set_password("admin123")
+            db_session.commit()
+
+    def test_check_password_rehashes_on_cost_change(self, app):
+        """Argon2 hashes made with old cost settings are upgraded on verify."""
+        user = User(username="rehash", email="rehash@example.com")
+        user.set_password("secret-pass")
+        old_hash = user.password_hash
+        assert "t=1" in old_hash
+
+        app.config["ARGON2_TIME_COST"] = 2
+        try:
+            assert user.check_password("secret-pass") is True
+            assert user.password_hash != old_hash
+            assert "t=2" in user.password_hash
+            assert user.check_password("secret-pass") is True
+        finally:
+            app.config["ARGON2_TIME_COST"] = 1
+
+    def test_update_last_login_keeps_user_loaded(self, app, db_session):
+        """Recording last_login commits without expiring the user instance."""
+        from sqlalchemy import inspect
+
+        from app.routes.auth_helpers import update_last_login
+
+        with app.test_request_context():
+            admin = User.query.filter_by(username="admin").first()
+            update_last_login(admin)
+
+            assert admin.last_login is not None
+            assert not inspect(admin).expired_attributes
+            assert db_session().expire_on_commit is True
+
     def test_login_invalid_credentials(self, client):
         """Test login with invalid credentials."""
         response = client.post(
@@ -56,6 +151,25 @@ class TestAuthentication:
         data = unwrap_response(response)
         assert "error" in data
 
+    def test_login_unknown_user_runs_dummy_verification(self, client):
+        """Unknown usernames still spend a password verification."""
+        from unittest.mock import patch
+
+        from app.models import check_dummy_password
+
+        with patch(
+            "app.routes.auth.check_dummy_password", wraps=check_dummy_password
+        ) as spy:
+            response = client.post(
+                "/api/v1/auth/login",
+                json={"username": "no_such_user", "password": "whatever123"},
+                headers={"Content-Type": "application/json"},
+            )
+
+        assert response.status_code == 401
+        spy.assert_called_once_with("whatever123")
+        assert check_dummy_password("whatever123") is False
+
     def test_login_missing_fields(self, client):
         """Test login with missing fields."""
         response = client.post(
@@ -142,6 +256,8 @@ class TestAuthentication:
         assert response.status_code == 200
         data = unwrap_response(response)
         assert "access_token" in data
+        expected_expiry = client.application.config["JWT_ACCESS_TOKEN_EXPIRES"]
+        assert data["expires_in"] == expected_expiry.total_seconds()
 
     def test_change_password(self, client):
         """Test password change."""
@@ -682,6 +798,22 @@ class TestUserRegistration:
         error_text = str(data).lower()
         assert "already exists" in error_text or "duplicate" in error_text
 
+    def test_integrity_error_message_uses_constraint_name(self):
+        """Test the violated constraint name is used when the driver has it."""
+        from types import SimpleNamespace
+
+        from sqlalchemy.exc import IntegrityError
+
+        from app.routes.auth_helpers import user_integrity_error_message
+
+        orig = SimpleNamespace(diag=SimpleNamespace(constraint_name="users_email_key"))
+        error = IntegrityError("INSERT INTO users ...", {}, orig)
+        assert user_integrity_error_message(error) == "Email already exists"
+
+        orig = Exception("UNIQUE constraint failed: users.username")
+        error = IntegrityError("INSERT INTO users ...", {}, orig)
+        assert user_integrity_error_message(error) == "Username already exists"
+
 
 class TestSecurityEnhancements:
     """Test security enhancements and attack prevention."""
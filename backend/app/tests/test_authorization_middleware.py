@@ -50,10 +50,10 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
-            mock_query.get.return_value = None
+            mock_get.return_value = None
             res = dummy_endpoint()
             assert res[1] == 401
 
@@ -61,12 +61,12 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
             mock_user = MagicMock()
             mock_user.is_active = False
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             res = dummy_endpoint()
             assert res[1] == 401
 
@@ -74,7 +74,7 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
             mock_user = MagicMock()
@@ -82,7 +82,7 @@ def test_permission_required_decorator(app):
             mock_user.is_active = True
             mock_user.permissions = ["admin_all"]
             mock_user.role.name.value = "admin"
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             # If successful, returns the return value of dummy_endpoint, which is a Flask response
@@ -92,7 +92,7 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
             mock_user = MagicMock()
@@ -102,7 +102,7 @@ def test_permission_required_decorator(app):
             # Normal check should fail because has_permission is False
             mock_user.has_permission.return_value = False
             mock_user.role.name.value = "admin"
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             assert res[1] == 403
@@ -111,7 +111,7 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
             mock_user = MagicMock()
@@ -119,7 +119,7 @@ def test_permission_required_decorator(app):
             mock_user.is_active = True
             mock_user.has_permission.return_value = False
             mock_user.role.name.value = "operator"
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             assert res[1] == 403
@@ -128,7 +128,7 @@ def test_permission_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query, \
+             patch("app.middleware.authorization.db.session.get") as mock_get, \
              patch("app.middleware.authorization.audit_permission_check") as mock_audit:
             
             mock_user = MagicMock()
@@ -136,7 +136,7 @@ def test_permission_required_decorator(app):
             mock_user.is_active = True
             mock_user.has_permission.return_value = True
             mock_user.role.name.value = "operator"
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             assert res.status_code == 200
@@ -162,13 +162,13 @@ def test_role_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query:
+             patch("app.middleware.authorization.db.session.get") as mock_get:
             
             mock_user = MagicMock()
             mock_user.username = "viewer"
             mock_user.is_active = True
             mock_user.role.name.value = "viewer" # viewer is not in admin/operator
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             assert res[1] == 403
@@ -177,13 +177,173 @@ def test_role_required_decorator(app):
     with app.test_request_context():
         with patch("app.middleware.authorization.verify_jwt_in_request"), \
              patch("app.middleware.authorization.get_current_user_id", return_value=(10, True)), \
-             patch("app.models.User.query") as mock_query:
+             patch("app.middleware.authorization.db.session.get") as mock_get:
             
             mock_user = MagicMock()
             mock_user.username = "operator"
             mock_user.is_active = True
             mock_user.role.name.value = "operator"
-            mock_query.get.return_value = mock_user
+            mock_get.return_value = mock_user
             
             res = dummy_endpoint()
             assert res.status_code == 200
+
+
+def test_permission_required_denies_permission_revoked_after_login(
+    client,
+    viewer_token,
+):
+    """A still-valid access token cannot outlive a revoked permission."""
+    from app.models import User
+
+    # The permission is revoked in the database after the token was issued
+    with patch.object(User, "has_permission", return_value=False):
+        response = client.get(
+            "/api/v1/analytics/dashboard/summary",
+            headers={"Authorization": f"Bearer {viewer_token}"},
+        )
+
+    assert response.status_code == 403
+
+
+def test_permission_required_allows_direct_permission_outside_enum(app, db_session):
+    """Direct user permissions that are not PermissionEnum values still grant."""
+    from app.models import User
+
+    @permission_required("export_reports")
+    def endpoint():
+        return jsonify({"success": True})
+
+    viewer = db_session.query(User).filter_by(username="viewer").first()
+    original = viewer.permissions
+    viewer.permissions = ["export_reports"]
+    db_session.commit()
+    try:
+        with app.test_request_context(), patch(
+            "app.middleware.authorization.verify_jwt_in_request",
+        ), patch(
+            "app.middleware.authorization.get_current_user_id",
+            return_value=(viewer.id, True),
+        ):
+            response = endpoint()
+    finally:
+        viewer.permissions = original
+        db_session.commit()
+
+    assert response.status_code == 200
+
+
+@pytest.fixture
+def auth_cache_enabled(app):
+    app.config["AUTH_USER_CACHE_ENABLED"] = True
+    yield
+    app.config["AUTH_USER_CACHE_ENABLED"] = False
+
+
+def test_auth_user_snapshot_is_cached(app, client, db_session, viewer_token, auth_cache_enabled):
+    """Repeated requests reuse the cached snapshot instead of reloading the user."""
+    from app.middleware import authorization
+
+    headers = {"Authorization": f"Bearer {viewer_token}"}
+    with patch.object(
+        authorization,
+        "_snapshot_user",
+        wraps=authorization._snapshot_user,
+    ) as spy:
+        assert client.get("/api/v1/units", headers=headers).status_code == 200
+        assert client.get("/api/v1/units", headers=headers).status_code == 200
+
+    assert spy.call_count == 1
+
+
+def test_auth_cache_evicted_on_user_update(app, client, db_session, viewer_token, auth_cache_enabled):
+    """Deactivating a user through the ORM takes effect immediately."""
+    from app.models import User
+
+    headers = {"Authorization": f"Bearer {viewer_token}"}
+    assert client.get("/api/v1/units", headers=headers).status_code == 200
+
+    viewer = db_session.query(User).filter_by(username="viewer").first()
+    viewer.is_active = False
+    db_session.commit()
+    try:
+        assert client.get("/api/v1/units", headers=headers).status_code == 401
+    finally:
+        viewer.is_active = True
+        db_session.commit()
+
+
+def test_auth_cache_evicted_on_bulk_update(app, client, db_session, viewer_token, auth_cache_enabled):
+    """Query.update() bypasses mapper events but still clears the cache."""
+    from app.models import User
+
+    headers = {"Authorization": f"Bearer {viewer_token}"}
+    assert client.get("/api/v1/units", headers=headers).status_code == 200
+
+    User.query.filter_by(username="viewer").update({"is_active": False})
+    db_session.commit()
+    try:
+        assert client.get("/api/v1/units", headers=headers).status_code == 401
+    finally:
+        User.query.filter_by(username="viewer").update({"is_active": True})
+        db_session.commit()
+
+
+def test_load_auth_user_preloads_role_permissions(app, db_session):
+    """The role and its permissions arrive with the user, not lazily."""
+    from app.middleware.authorization import load_auth_user
+    from app.models import User
+
+    admin_id = db_session.query(User).filter_by(username="admin").first().id
+    db_session.expunge_all()
+
+    user = load_auth_user(admin_id)
+
+    assert "role" in user.__dict__
+    assert "permissions" in user.role.__dict__
+    assert user.has_permission("read_units") is True
+
+
+def test_auth_user_loaded_once_per_request(app, client, viewer_token):
+    """Tenant middleware and permission_required share one user lookup."""
+    from sqlalchemy import event
+
+    from app import db
+
+    user_selects = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM users" in statement:
+            user_selects.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/api/v1/units", headers={"Authorization": f"Bearer {viewer_token}"}
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert len(user_selects) == 1
+    assert "_auth_user" not in g
+
+
+def test_stacked_checks_share_request_snapshot(app, db_session, admin_token):
+    """Stacked permission checks in one request build the snapshot once."""
+    from app.middleware import authorization
+
+    @permission_required("read_units")
+    @permission_required("read_users")
+    def view():
+        return "ok"
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    with patch.object(
+        authorization,
+        "_snapshot_user",
+        wraps=authorization._snapshot_user,
+    ) as spy, app.test_request_context(headers=headers):
+        assert view() == "ok"
+
+    assert spy.call_count == 1
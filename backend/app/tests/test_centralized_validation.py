@@ -134,7 +134,11 @@ class TestCentralizedValidation:
         # Valid data
         result = schema.load({"format": "csv", "sensor_types": "temperature,pressure"})
         assert result["format"] == "csv"
-        assert result["sensor_types"] == "temperature,pressure"
+        assert result["sensor_types"] == ["temperature", "pressure"]
+
+        # Whitespace around each sensor type is ignored
+        result = schema.load({"sensor_types": " temperature , pressure"})
+        assert result["sensor_types"] == ["temperature", "pressure"]
 
         # Default format
         result = schema.load({})
@@ -145,6 +149,30 @@ class TestCentralizedValidation:
             schema.load({"format": "xml"})
         assert "format" in exc_info.value.messages
 
+    def test_historical_window_length_is_bounded(self):
+        """Test raw and aggregated historical windows have maximum lengths."""
+        from app.utils.schemas import ExportDataQuerySchema, HistoricalDataQuerySchema
+
+        schema = HistoricalDataQuerySchema()
+        window = {
+            "start_date": "2024-01-01T00:00:00",
+            "end_date": "2024-07-01T00:00:00",
+        }
+
+        # 182 days is too wide for raw readings but fine once aggregated
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load({**window, "aggregation": "raw"})
+        assert "start_date" in exc_info.value.messages
+        assert schema.load({**window, "aggregation": "daily"})["aggregation"] == "daily"
+
+        with pytest.raises(ValidationError) as exc_info:
+            ExportDataQuerySchema().load(window)
+        assert "start_date" in exc_info.value.messages
+
+        # Without end_date the window runs until now
+        with pytest.raises(ValidationError):
+            schema.load({"start_date": "2000-01-01T00:00:00", "aggregation": "weekly"})
+
 
 class TestSecurityAwareErrorHandler:
     """Test SecurityAwareErrorHandler methods."""
@@ -11,6 +11,7 @@ from app.utils.helpers import (
     get_role_permissions,
     paginate_query,
     validate_json_request,
+    epoch_millis,
     format_timestamp,
     parse_timestamp,
     calculate_time_range,
@@ -117,6 +118,14 @@ def test_format_timestamp():
     assert format_timestamp(None) is None
 
 
+def test_epoch_millis():
+    aware = datetime(2024, 1, 1, 0, 0, 1, 500000, tzinfo=timezone.utc)
+    assert epoch_millis(aware) == 1704067201500
+    # Naive datetimes are treated as UTC
+    assert epoch_millis(aware.replace(tzinfo=None)) == 1704067201500
+    assert epoch_millis(aware.astimezone(timezone(timedelta(hours=2)))) == 1704067201500
+
+
 def test_parse_timestamp():
     """Test parsing ISO string timestamp to timezone-aware datetime."""
     # Timezone-aware ISO string
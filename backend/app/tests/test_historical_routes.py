@@ -79,6 +79,10 @@ def seed_historical_data(app):
         db.session.commit()
         yield
 
+        # Commits escape the per-test rollback, so drop the seeded readings
+        SensorReading.query.delete()
+        db.session.commit()
+
 
 def test_get_historical_data_raw(client, admin_token, seed_historical_data):
     """Test getting historical data raw format with authorization."""
@@ -162,6 +166,10 @@ def test_compare_units_historical_success(client, admin_token, seed_historical_d
     assert "unit_summaries" in comp
     assert "TEST001" in comp["unit_summaries"]
     assert "TEST002" in comp["unit_summaries"]
+    timestamps = [bucket["timestamp"] for bucket in comp["time_series"]]
+    assert timestamps == sorted(set(timestamps))
+    for bucket in comp["time_series"]:
+        assert set(bucket["units"]) == {"TEST001", "TEST002"}
 
 
 def test_compare_units_not_found(client, admin_token):
@@ -183,6 +191,26 @@ def test_compare_units_not_found(client, admin_token):
     assert response.status_code == 404
 
 
+def test_compare_units_summaries_use_raw_readings(client, admin_token, seed_historical_data):
+    """Test unit summaries aggregate readings rather than bucket averages."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.post(
+        "/api/v1/historical/compare/units",
+        json={
+            "unit_ids": ["TEST001"],
+            "sensor_type": "temperature",
+            "aggregation": "daily",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    summary = response.get_json()["comparison"]["unit_summaries"]["TEST001"]
+    assert summary["overall_avg"] == 24.5
+    assert summary["overall_min"] == 20.0
+    assert summary["overall_max"] == 29.0
+    assert summary["data_points"] == len(response.get_json()["comparison"]["time_series"])
+
+
 def test_export_historical_csv(client, admin_token, seed_historical_data):
     """Test exporting historical data in CSV format."""
     headers = {"Authorization": f"Bearer {admin_token}"}
@@ -197,6 +225,49 @@ def test_export_historical_csv(client, admin_token, seed_historical_data):
     assert "timestamp,sensor_type,sensor_name,unit,value" in csv_data
 
 
+def test_export_historical_csv_writes_one_line_per_reading(
+    client, admin_token, seed_historical_data,
+):
+    """Test the streamed CSV has a real newline-separated row per reading."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    json_response = client.get(
+        "/api/v1/historical/export/TEST001?format=json&sensor_types=temperature",
+        headers=headers,
+    )
+    csv_response = client.get(
+        "/api/v1/historical/export/TEST001?format=csv&sensor_types=temperature",
+        headers=headers,
+    )
+
+    assert csv_response.is_streamed
+    lines = csv_response.data.decode("utf-8").splitlines()
+    assert lines[0] == "timestamp,sensor_type,sensor_name,unit,value"
+    assert len(lines) == json_response.get_json()["total_records"] + 1
+    assert "\\n" not in csv_response.data.decode("utf-8")
+
+
+def test_historical_responses_gzip_when_accepted(client, admin_token, seed_historical_data):
+    """Test JSON and streamed CSV bodies are gzipped for gzip-capable clients."""
+    import gzip
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    url = "/api/v1/historical/data/TEST001?aggregation=raw"
+    plain = client.get(url, headers=headers)
+    compressed = client.get(url, headers={**headers, "Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert gzip.decompress(compressed.data) == plain.data
+
+    csv_url = "/api/v1/historical/export/TEST001?format=csv"
+    plain_csv = client.get(csv_url, headers=headers)
+    compressed_csv = client.get(
+        csv_url, headers={**headers, "Accept-Encoding": "gzip"},
+    )
+    assert compressed_csv.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed_csv.data) == plain_csv.data
+
+
 def test_export_historical_json(client, admin_token, seed_historical_data):
     """Test exporting historical data in JSON format."""
     headers = {"Authorization": f"Bearer {admin_token}"}
@@ -230,6 +301,20 @@ def test_get_historical_statistics_success(client, admin_token, seed_historical_
     assert "standard_deviation" in stats
 
 
+def test_get_historical_statistics_stddev_and_range(client, admin_token, seed_historical_data):
+    """Test sample standard deviation and range are computed in SQL."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get(
+        "/api/v1/historical/statistics/TEST001?days=30&sensor_type=temperature",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    stats = response.get_json()["statistics"]["temperature"]
+    # Readings are 20..29
+    assert stats["standard_deviation"] == 3.03
+    assert stats["range"] == 9.0
+
+
 def test_get_historical_statistics_empty(client, admin_token):
     """Test statistical analysis with no historical data (empty database)."""
     headers = {"Authorization": f"Bearer {admin_token}"}
@@ -244,3 +329,131 @@ def test_get_historical_statistics_empty(client, admin_token):
     assert response.status_code == 200
     data = response.get_json()
     assert data["total_sensor_types"] == 0
+
+
+def test_historical_data_repeat_is_served_from_cache(
+    client, admin_token, seed_historical_data,
+):
+    """Test an identical repeat request does not query sensor_readings again."""
+    from sqlalchemy import event
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    url = "/api/v1/historical/data/TEST001?aggregation=daily"
+    first = client.get(url, headers=headers)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        second = client.get(url, headers=headers)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    assert first.status_code == second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert not any("sensor_readings" in statement for statement in statements)
+
+
+def test_historical_data_conditional_get(client, admin_token, seed_historical_data):
+    """Test a matching If-None-Match is answered with 304 and no body."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    url = "/api/v1/historical/data/TEST001?aggregation=daily"
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+    assert "private" in first.headers["Cache-Control"]
+
+    second = client.get(
+        url, headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_historical_data_closed_window_cached_longer(client, admin_token):
+    """Test windows that ended long ago get a longer client max-age."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get(
+        "/api/v1/historical/data/TEST001?aggregation=daily"
+        "&start_date=2024-01-01T00:00:00&end_date=2024-01-02T00:00:00",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert "max-age=3600" in response.headers["Cache-Control"]
+
+
+def test_historical_data_raw_keyset_pagination(
+    client, admin_token, seed_historical_data,
+):
+    """Test raw pages chained by next_cursor cover every reading exactly once."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    everything = client.get(
+        "/api/v1/historical/data/TEST001?aggregation=raw", headers=headers,
+    ).get_json()
+
+    pages = []
+    url = "/api/v1/historical/data/TEST001?aggregation=raw&limit=3"
+    cursor = None
+    while True:
+        page_url = url if cursor is None else f"{url}&cursor={cursor}"
+        page = client.get(page_url, headers=headers).get_json()
+        pages.extend(page["data"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert everything["next_cursor"] is None
+    assert pages == everything["data"]
+
+
+def test_historical_data_rejects_malformed_cursor(client, admin_token):
+    """Test a cursor that is not <timestamp>|<id> is a validation error."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get(
+        "/api/v1/historical/data/TEST001?aggregation=raw&cursor=yesterday",
+        headers=headers,
+    )
+    assert response.status_code in [400, 422]
+
+
+def test_rollup_aggregates_read_continuous_aggregate(app):
+    """Test bucketed queries target the matching view with weighted averages."""
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    from app.routes.historical import _rollup_aggregates
+
+    agg = _rollup_aggregates(
+        "daily", datetime(2024, 1, 1, 12), datetime(2024, 2, 1),
+    )
+    sql = str(
+        select(agg.time_bucket, agg.avg_value, agg.count)
+        .select_from(agg.source)
+        .where(agg.in_range)
+        .compile(dialect=postgresql.dialect()),
+    )
+
+    assert "FROM sensor_readings_daily" in sql
+    assert "sum(sensor_readings_daily.value_sum) / " in sql
+    assert "date_trunc" in sql
+
+
+def test_unit_name_cache_evicted_on_update(app):
+    """Test cached unit names are dropped when the unit is renamed."""
+    from app.routes.historical import _unit_names
+
+    with app.app_context():
+        unit = db.session.get(Unit, "TEST001")
+        original_name = unit.name
+        assert _unit_names(["TEST001"]) == {"TEST001": original_name}
+
+        unit.name = "Renamed Unit"
+        db.session.commit()
+        try:
+            assert _unit_names(["TEST001"]) == {"TEST001": "Renamed Unit"}
+        finally:
+            unit.name = original_name
+            db.session.commit()
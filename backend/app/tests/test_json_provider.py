@@ -0,0 +1,66 @@
+"""Tests for the orjson-backed Flask JSON provider."""
+
+import math
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_provider import OrjsonProvider, orjson, orjson_available
+
+pytestmark = pytest.mark.skipif(not orjson_available, reason="orjson not installed")
+
+
+def test_app_uses_orjson_provider(app):
+    assert isinstance(app.json, OrjsonProvider)
+
+
+def test_output_matches_default_provider():
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    provider = OrjsonProvider(app)
+    payload = {
+        "b": [1, 2.5, None, True],
+        "a": {"nested": "välue"},
+        "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "amount": Decimal("1.50"),
+    }
+
+    assert provider.loads(provider.dumps(payload)) == default.loads(
+        default.dumps(payload),
+    )
+    assert provider.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+    assert provider.dumps({1: "x"}) == '{"1":"x"}'
+
+
+def test_jsonify_serializes_numpy_arrays():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    with app.app_context():
+        response = jsonify({"values": np.array([1.5, 2.5])})
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"values": [1.5, 2.5]}
+
+
+def test_request_json_is_parsed_by_provider():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    with app.test_request_context(json={"device_id": "d1", "port": 502}), patch(
+        "app.utils.json_provider.orjson.loads",
+        wraps=orjson.loads,
+    ) as loads:
+        assert request.get_json() == {"device_id": "d1", "port": 502}
+
+    loads.assert_called_once()
+
+
+def test_loads_falls_back_for_input_orjson_rejects():
+    provider = OrjsonProvider(Flask(__name__))
+
+    assert math.isinf(provider.loads('{"v": Infinity}')["v"])
+    assert math.isnan(provider.loads(b'{"v": NaN}')["v"])
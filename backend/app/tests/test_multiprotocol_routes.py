@@ -102,6 +102,7 @@ def test_modbus_devices_success_scenarios(client, admin_token):
             json={"device_id": "new_dev"} # Missing unit_id and host
         )
         assert res_add_fail.status_code == 400
+        assert res_add_fail.get_json()["error"] == "Missing required fields: host, unit_id"
 
         # Add device - Success
         res_add_ok = client.post(
@@ -111,6 +112,14 @@ def test_modbus_devices_success_scenarios(client, admin_token):
         )
         assert res_add_ok.status_code == 201
         assert "added successfully" in res_add_ok.get_json()["message"]
+        mock_modbus.add_device.assert_called_once_with(
+            device_id="new_dev",
+            unit_id=2,
+            host="127.0.0.1",
+            port=502,
+            device_type="tcp",
+            timeout=5.0,
+        )
 
         # Add device - Service fail
         mock_modbus.add_device.return_value = False
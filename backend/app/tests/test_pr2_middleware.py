@@ -3,6 +3,7 @@
 import json
 import time
 import uuid
+from unittest.mock import MagicMock
 
 import pytest
 from flask import Flask, g
@@ -95,6 +96,36 @@ class TestRateLimiter:
         assert not is_allowed
         assert info["remaining"] == 0
 
+    def test_redis_rate_limiter_uses_atomic_script(self):
+        """Test Redis limiter checks and records in one script call."""
+        redis_client = MagicMock()
+        script = redis_client.register_script.return_value
+        script.return_value = [1, 2]
+        limiter = RateLimiter(redis_client)
+
+        is_allowed, info = limiter.is_allowed("test_user_redis", 5, 60)
+
+        assert is_allowed
+        assert info["current_requests"] == 3
+        assert info["remaining"] == 2
+        script.assert_called_once()
+        args = script.call_args.kwargs["args"]
+        assert args[1:3] == [60, 5]
+        redis_client.pipeline.assert_not_called()
+
+    def test_redis_rate_limiter_block(self):
+        """Test Redis limiter reports denial without a follow-up call."""
+        redis_client = MagicMock()
+        script = redis_client.register_script.return_value
+        script.return_value = [0, 5]
+        limiter = RateLimiter(redis_client)
+
+        is_allowed, info = limiter.is_allowed("test_user_redis_block", 5, 60)
+
+        assert not is_allowed
+        assert info["remaining"] == 0
+        redis_client.zrem.assert_not_called()
+
     def test_rate_limit_decorator(self, app):
         """Test rate limiting decorator."""
 
@@ -0,0 +1,63 @@
+"""Tests for read-replica session routing."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from flask_sqlalchemy import SQLAlchemy
+
+from app import db
+from app.utils.read_replica import (
+    REPLICA_BIND_KEY,
+    ReplicaRoutingSession,
+    use_read_replica,
+)
+
+
+@pytest.fixture
+def replica_engine(app):
+    """Register a stand-in replica engine next to the primary."""
+    replica = MagicMock(name="replica_engine")
+    with app.app_context():
+        engines = {None: db.engine, REPLICA_BIND_KEY: replica}
+        with patch.object(
+            SQLAlchemy, "engines", new_callable=PropertyMock, return_value=engines
+        ):
+            yield replica
+
+
+def test_db_session_uses_routing_session(app):
+    with app.app_context():
+        assert isinstance(db.session(), ReplicaRoutingSession)
+
+
+def test_reads_go_to_replica_only_inside_decorated_view(app, replica_engine):
+    @use_read_replica
+    def view():
+        return db.session().get_bind()
+
+    with app.test_request_context():
+        assert view() is replica_engine
+        assert db.session().get_bind() is db.engine
+
+
+def test_flushes_stay_on_primary(app, replica_engine):
+    @use_read_replica
+    def view():
+        session = db.session()
+        session._flushing = True
+        try:
+            return session.get_bind()
+        finally:
+            session._flushing = False
+
+    with app.test_request_context():
+        assert view() is db.engine
+
+
+def test_without_replica_bind_reads_stay_on_primary(app):
+    @use_read_replica
+    def view():
+        return db.session().get_bind()
+
+    with app.test_request_context():
+        assert view() is db.engine
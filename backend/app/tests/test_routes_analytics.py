@@ -1,11 +1,16 @@
 """Additional coverage tests for analytics routes."""
 
+import warnings
 from unittest.mock import patch
 
+from sqlalchemy.exc import SAWarning
+
+from app.models import db
+
 
 def test_dashboard_summary_exception_path(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
-    with patch("app.routes.analytics.db.session.query", side_effect=Exception("boom")):
+    with patch("app.routes.analytics.db.session.execute", side_effect=Exception("boom")):
         response = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
 
     assert response.status_code == 500
@@ -34,3 +39,151 @@ def test_alert_patterns_exception_path(client, admin_token):
         response = client.get("/api/v1/analytics/alerts/patterns?days=7", headers=headers)
 
     assert response.status_code == 500
+
+
+def test_dashboard_summary_temperature_stats_from_db(client, admin_token, db_session):
+    from datetime import datetime, timedelta, timezone
+
+    from app.models import Sensor, SensorReading
+
+    sensor = (
+        db_session.query(Sensor)
+        .filter_by(unit_id="TEST001", sensor_type="temperature")
+        .first()
+    )
+    now = datetime.now(timezone.utc)
+    for offset, value in ((1, 20.0), (2, 30.0)):
+        db_session.add(
+            SensorReading(
+                sensor_id=sensor.id,
+                timestamp=now - timedelta(hours=offset),
+                value=value,
+            ),
+        )
+    db_session.flush()
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+
+    assert response.status_code == 200
+    performance = response.get_json()["performance"]
+    assert performance["avg_temperature_24h"] == 25.0
+    assert performance["max_temperature_24h"] == 30.0
+
+
+def test_dashboard_summary_reading_windows_from_db(client, admin_token, db_session):
+    from datetime import datetime, timedelta, timezone
+
+    from app.models import Sensor, SensorReading
+    from app.routes.analytics import clear_analytics_cache
+
+    sensor = (
+        db_session.query(Sensor)
+        .filter_by(unit_id="TEST001", sensor_type="temperature")
+        .first()
+    )
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    before = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+    clear_analytics_cache()
+
+    now = datetime.now(timezone.utc)
+    # 1 reading in the last 24h, 2 more this week, 3 in the previous week
+    for offset in (
+        timedelta(hours=1),
+        timedelta(days=2),
+        timedelta(days=3),
+        timedelta(days=8),
+        timedelta(days=9),
+        timedelta(days=10),
+    ):
+        db_session.add(
+            SensorReading(sensor_id=sensor.id, timestamp=now - offset, value=1.0),
+        )
+    db_session.flush()
+
+    after = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+
+    assert after.status_code == 200
+    delta = {
+        key: after.get_json()[section][key] - before.get_json()[section][key]
+        for section, key in (
+            ("overview", "recent_readings"),
+            ("trends", "current_week_readings"),
+            ("trends", "previous_week_readings"),
+        )
+    }
+    assert delta == {
+        "recent_readings": 1,
+        "current_week_readings": 3,
+        "previous_week_readings": 3,
+    }
+
+
+def test_dashboard_summary_cached_with_etag(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag
+
+    # Cached payload is served without touching the database again
+    with patch("app.routes.analytics.db.session.execute") as mock_execute:
+        second = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+        revalidated = client.get(
+            "/api/v1/analytics/dashboard/summary",
+            headers={**headers, "If-None-Match": etag},
+        )
+    mock_execute.assert_not_called()
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert revalidated.status_code == 304
+
+
+def test_trends_statistics_from_db(client, admin_token, db_session):
+    from datetime import datetime, timedelta, timezone
+
+    from app.models import Sensor, SensorReading
+
+    sensor = (
+        db_session.query(Sensor)
+        .filter_by(unit_id="TEST001", sensor_type="temperature")
+        .first()
+    )
+    now = datetime.now(timezone.utc)
+    for offset, value in ((1, 10.0), (2, 40.0), (3, 25.0)):
+        db_session.add(
+            SensorReading(
+                sensor_id=sensor.id,
+                timestamp=now - timedelta(hours=offset),
+                value=value,
+            ),
+        )
+    db_session.flush()
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get(
+        f"/api/v1/analytics/trends/TEST001?days=1&sensor_type={sensor.sensor_type}",
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    trend = response.get_json()["trends"][sensor.sensor_type]
+    assert len(trend["timestamps"]) == len(trend["values"])
+    assert len(trend["values"]) == trend["statistics"]["count"]
+    assert trend["statistics"]["min"] <= 10.0
+    assert trend["statistics"]["max"] >= 40.0
+    values = trend["values"]
+    assert abs(trend["statistics"]["avg"] - sum(values) / len(values)) < 1e-9
+
+
+def test_dashboard_summary_statement_has_no_cartesian_product(client, admin_token, app):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    with app.app_context():
+        # Force a fresh compile so the FROM linter runs for this statement
+        db.engine.clear_compiled_cache()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        response = client.get("/api/v1/analytics/dashboard/summary", headers=headers)
+
+    assert response.status_code == 200
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+from sqlalchemy.exc import OperationalError
+
 
 def test_compare_units_returns_zero_summary_when_no_data(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
@@ -44,3 +46,35 @@ def test_historical_export_and_statistics_exception_paths(client, admin_token):
             headers=headers,
         )
     assert stats_response.status_code == 500
+
+
+def test_historical_statement_timeout_returns_504(client, admin_token):
+    class QueryCanceledError(Exception):
+        pgcode = "57014"
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    timeout = OperationalError("SELECT ...", {}, QueryCanceledError())
+    with patch("app.routes.historical.db.session.query", side_effect=timeout):
+        response = client.get(
+            "/api/v1/historical/statistics/TEST001?days=30",
+            headers=headers,
+        )
+
+    assert response.status_code == 504
+    assert "narrow the date range" in response.get_json()["error"]
+
+
+def test_statement_timeout_skipped_for_rejected_and_cached(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    url = "/api/v1/historical/statistics/TEST001?days=30"
+
+    with patch("app.routes.historical._limit_statement_time") as limit:
+        assert client.get(url).status_code == 401
+        limit.assert_not_called()
+
+        assert client.get(url, headers=headers).status_code == 200
+        assert limit.call_count == 1
+
+        # Served from the response cache without touching the database
+        assert client.get(url, headers=headers).status_code == 200
+        assert limit.call_count == 1
@@ -1,7 +1,15 @@
 """Additional coverage tests for multiprotocol routes."""
 
+import threading
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+from app.routes.multiprotocol import (
+    _cached_status_response,
+    _now_iso,
+    clear_protocol_status_cache,
+)
+
 
 def test_protocol_status_empty_and_exception(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
@@ -11,6 +19,8 @@ def test_protocol_status_empty_and_exception(client, admin_token):
     assert empty.status_code == 200
     assert empty.get_json()["summary"]["health_score"] == 0.0
 
+    # Drop the cached snapshot so the next request rebuilds it
+    clear_protocol_status_cache()
     with patch(
         "app.routes.multiprotocol.collect_protocol_status",
         side_effect=Exception("boom"),
@@ -19,6 +29,21 @@ def test_protocol_status_empty_and_exception(client, admin_token):
     assert error.status_code == 500
 
 
+def test_protocol_status_polls_share_cached_snapshot(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    with patch(
+        "app.routes.multiprotocol.collect_protocol_status",
+        return_value=[],
+    ) as collect:
+        first = client.get("/api/v1/protocols/status", headers=headers)
+        second = client.get("/api/v1/protocols/status", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert collect.call_count == 1
+
+
 def test_device_endpoint_exception_paths(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
@@ -48,10 +73,9 @@ def test_dnp3_performance_config_and_metrics_branches(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
     # unavailable service
-    assert (
-        client.get("/api/v1/protocols/dnp3/performance/metrics", headers=headers).status_code
-        == 503
-    )
+    unavailable = client.get("/api/v1/protocols/dnp3/performance/metrics", headers=headers)
+    assert unavailable.status_code == 503
+    assert unavailable.get_json() == {"error": "DNP3 service not available"}
 
     dnp3 = MagicMock()
     with patch("flask.current_app.dnp3_service", dnp3, create=True):
@@ -75,3 +99,68 @@ def test_dnp3_performance_config_and_metrics_branches(client, admin_token):
             headers=headers,
         )
         assert clear_error.status_code == 500
+
+
+def test_now_iso_reuses_formatted_timestamp_within_resolution():
+    with patch("app.routes.multiprotocol.time.time", return_value=1_800_000_000.0):
+        first = _now_iso()
+    with patch("app.routes.multiprotocol.time.time", return_value=1_800_000_000.05):
+        assert _now_iso() is first
+    with patch("app.routes.multiprotocol.time.time", return_value=1_800_000_000.2):
+        later = _now_iso()
+
+    assert datetime.fromisoformat(first).utcoffset().total_seconds() == 0
+    assert later != first
+
+
+def test_device_routes_reject_malformed_device_ids(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    modbus = MagicMock()
+    modbus.read_device_data.return_value = {"data": {}}
+
+    with patch("flask.current_app.modbus_service", modbus, create=True):
+        ok = client.get("/api/v1/protocols/modbus/devices/pump_001.a-1/data", headers=headers)
+        too_long = client.get(
+            f"/api/v1/protocols/modbus/devices/{'x' * 65}/data",
+            headers=headers,
+        )
+        bad_chars = client.get("/api/v1/protocols/modbus/devices/pump%20001/data", headers=headers)
+        bad_add = client.post(
+            "/api/v1/protocols/modbus/devices",
+            json={"device_id": "pump 001", "unit_id": 1, "host": "10.0.0.1"},
+            headers=headers,
+        )
+
+    assert ok.status_code == 200
+    modbus.read_device_data.assert_called_once_with("pump_001.a-1")
+    assert too_long.status_code == 404
+    assert bad_chars.status_code == 404
+    assert bad_add.status_code == 400
+    modbus.add_device.assert_not_called()
+
+
+def test_status_rebuild_only_blocks_its_own_key(app):
+    building = threading.Event()
+    release = threading.Event()
+
+    def slow_build():
+        building.set()
+        release.wait(5)
+        return {"devices": {}}
+
+    def rebuild_unified():
+        with app.app_context():
+            _cached_status_response("unified", slow_build)
+
+    worker = threading.Thread(target=rebuild_unified)
+    worker.start()
+    try:
+        assert building.wait(5)
+        # The unified rebuild is still running; protocol status is not held up
+        with app.app_context():
+            response = _cached_status_response("protocols", lambda: {"ok": True})
+        assert response.get_json() == {"ok": True}
+        assert worker.is_alive()
+    finally:
+        release.set()
+        worker.join(5)
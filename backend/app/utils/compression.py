@@ -0,0 +1,62 @@
+"""gzip compression for large API responses.
+
+The backend is served straight from gunicorn, so nothing in front of it
+compresses responses. Blueprints with large JSON/CSV payloads (long runs of
+repeated keys and short numbers that gzip shrinks several-fold) register
+:func:`compress_response` as an ``after_request`` hook.
+"""
+
+import gzip
+import zlib
+
+from flask import request
+
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 5
+COMPRESSIBLE_MIMETYPES = frozenset({"application/json", "text/csv"})
+
+
+def _gzip_chunks(chunks):
+    """Compress a streamed body chunk by chunk into one gzip member."""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(
+            chunk.encode() if isinstance(chunk, str) else chunk,
+        )
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def compress_response(response):
+    """gzip ``response`` when the client accepts it and it is worth compressing.
+
+    Buffered bodies under ``COMPRESS_MIN_SIZE`` are left alone. Streamed
+    bodies are always compressed incrementally since their size is unknown.
+    """
+    if (
+        response.status_code != 200
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_chunks(response.response)
+        response.headers.pop("Content-Length", None)
+    else:
+        body = response.get_data()
+        if len(body) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(body, COMPRESS_LEVEL))
+
+    response.headers["Content-Encoding"] = "gzip"
+    # The encoded bytes differ from the identity body the ETag was taken from
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -1,7 +1,9 @@
 """Centralized error handling utilities for secure API responses."""
 
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import wraps
 from typing import Any, ClassVar
 
 from flask import g, jsonify
@@ -628,3 +630,27 @@ class SecurityAwareErrorHandler:
         except (ImportError, RuntimeError):
             # flask-jwt-extended not available or not initialized, skip JWT error handlers
             pass
+
+
+def safe_endpoint(context: str) -> Callable:
+    """Route any exception from the decorated view to ``handle_error``.
+
+    Replaces a ``try``/``except Exception`` block around the whole view body.
+    ``context`` may name the view's URL parameters, e.g.
+    ``"Failed to read device {device_id}"``.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except Exception as e:
+                return SecurityAwareErrorHandler.handle_error(
+                    e,
+                    context.format(**kwargs) if kwargs else context,
+                )
+
+        return decorated_function
+
+    return decorator
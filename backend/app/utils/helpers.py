@@ -153,6 +153,27 @@ def format_timestamp(dt: datetime) -> str:
     return None
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def epoch_millis(dt: datetime) -> int:
+    """Convert datetime to integer milliseconds since the Unix epoch.
+
+    Naive datetimes are treated as UTC, matching how readings are stored.
+
+    Args:
+        dt: datetime object
+
+    Returns:
+        Milliseconds since 1970-01-01T00:00:00Z
+
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MS
+
+
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO timestamp string to datetime using robust dateutil parser.
 
@@ -0,0 +1,82 @@
+"""orjson-backed JSON provider for Flask.
+
+``jsonify``, ``app.json.dumps`` and ``request.get_json`` go through the
+provider installed on the app, so swapping it in ``create_app`` moves every
+JSON response and request body onto orjson without touching individual
+routes. Output stays compatible with Flask's ``DefaultJSONProvider``: keys are
+sorted, debug mode is indented and dates/Decimals/UUIDs still go through
+Flask's default conversion.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+    orjson_available = False
+
+if orjson_available:
+    # Datetimes are passed through to Flask's default handler so their wire
+    # format (HTTP date) does not change when the provider is swapped.
+    _BASE_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    def _options(self, sort_keys: bool, indent: bool) -> int:
+        option = _BASE_OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumpb(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        option = self._options(
+            kwargs.get("sort_keys", self.sort_keys),
+            bool(kwargs.get("indent")),
+        )
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return self.dumpb(obj, **kwargs).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON, so ``request.get_json()`` parses with orjson too.
+
+        Input orjson rejects but the stdlib accepts (``NaN``/``Infinity``)
+        falls back to the default parser.
+        """
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response without the bytes -> str -> bytes round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(self.sort_keys, indent),
+        )
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    """Install the orjson provider on ``app`` when orjson is importable."""
+    if orjson_available:
+        app.json = OrjsonProvider(app)
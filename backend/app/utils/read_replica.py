@@ -0,0 +1,46 @@
+"""Read-replica routing for read-only endpoints.
+
+When ``DATABASE_REPLICA_URL`` is configured it is registered as the
+``replica`` SQLAlchemy bind. Routes wrapped in :func:`use_read_replica` then
+run their queries against that engine, keeping heavy analytics scans off the
+primary. Without a replica bind everything stays on the primary database.
+"""
+
+from functools import wraps
+
+from flask import current_app
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND_KEY = "replica"
+_READ_ONLY_INFO_KEY = "read_only"
+
+
+class ReplicaRoutingSession(Session):
+    """Session that sends read-only work to the replica bind when one exists."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get(_READ_ONLY_INFO_KEY) and not self._flushing:
+            replica = self._db.engines.get(REPLICA_BIND_KEY)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_read_replica(f):
+    """Route the wrapped view's queries to the read replica.
+
+    Apply it below the authorization decorators so user lookups still read
+    from the primary. Replica reads may lag the primary slightly, so only use
+    it on endpoints that never write and tolerate that staleness.
+    """
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        session = current_app.extensions["sqlalchemy"].session()
+        session.info[_READ_ONLY_INFO_KEY] = True
+        try:
+            return f(*args, **kwargs)
+        finally:
+            session.info.pop(_READ_ONLY_INFO_KEY, None)
+
+    return decorated_function
@@ -1,7 +1,8 @@
 """Data serializers and validation schemas for ThermaCore SCADA API."""
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import ClassVar
 
 from dateutil import parser as dateutil_parser
 from marshmallow import (
@@ -13,6 +14,7 @@ from marshmallow import (
     validates_schema,
 )
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from webargs.fields import DelimitedList
 
 from app.models import (
     HealthStatusEnum,
@@ -73,6 +75,43 @@ class DateTimeField(fields.DateTime):
         return super()._serialize(value, attr, obj, **kwargs)
 
 
+class TrimmedStr(fields.Str):
+    """String field that strips surrounding whitespace when loading."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return super()._deserialize(value, attr, data, **kwargs).strip()
+
+
+def format_keyset_cursor(timestamp, reading_id):
+    """Encode the position of a reading as a keyset pagination cursor."""
+    return f"{timestamp.isoformat()}|{reading_id}"
+
+
+class KeysetCursorField(fields.Field):
+    """Keyset pagination cursor for sensor readings.
+
+    Cursors have the form ``<ISO timestamp>|<reading id>`` and load as a
+    ``(timestamp, id)`` tuple; the id breaks ties between readings that share
+    a timestamp.
+    """
+
+    default_error_messages: ClassVar[dict[str, str]] = {
+        "invalid": "Not a valid cursor.",
+    }
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if value is None:
+            return None
+        return format_keyset_cursor(*value)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            timestamp, reading_id = str(value).rsplit("|", 1)
+            return dateutil_parser.isoparse(timestamp), int(reading_id)
+        except (TypeError, ValueError) as e:
+            raise self.make_error("invalid") from e
+
+
 class EnumField(fields.Field):
     """Custom field for handling enum serialization."""
 
@@ -384,16 +423,6 @@ class ErrorSchema(Schema):
     details = fields.Dict(load_default=None)
 
 
-# Authentication response schemas
-class TokenSchema(Schema):
-    """Schema for authentication token response."""
-
-    access_token = fields.Str()
-    refresh_token = fields.Str()
-    expires_in = fields.Int()
-    user = fields.Nested(UserSchema, exclude=("password_hash",))
-
-
 class PasswordChangeSchema(Schema):
     """Password change request schema."""
 
@@ -414,13 +443,40 @@ class PasswordResetSchema(Schema):
     new_password = fields.Str(required=True, validate=validate.Length(min=6))
 
 
+# Widest start_date..end_date windows the historical endpoints accept
+MAX_RAW_RANGE_DAYS = 90
+MAX_AGGREGATED_RANGE_DAYS = 365
+
+
+def _validate_window_length(data, max_days):
+    """Reject a requested start_date more than ``max_days`` before its end.
+
+    Without an end_date the window runs until now. Windows without a
+    start_date use the route's own (short) default and are not checked.
+    """
+    start_date = data.get("start_date")
+    if start_date is None:
+        return
+    end_date = data.get("end_date") or _utc_now()
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=timezone.utc)
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    if end_date - start_date > timedelta(days=max_days):
+        raise ValidationError(
+            f"Date range must not exceed {max_days} days",
+            field_name="start_date",
+        )
+
+
 # Query parameter validation schemas
 class HistoricalDataQuerySchema(Schema):
     """Schema for historical data query parameters."""
 
     start_date = fields.DateTime(required=False, format="iso")
     end_date = fields.DateTime(required=False, format="iso")
-    sensor_types = fields.Str(required=False)
+    # Comma-separated in the query string, loaded as a list of sensor types
+    sensor_types = DelimitedList(TrimmedStr(), required=False)
     aggregation = fields.Str(
         required=False,
         validate=validate.OneOf(["raw", "hourly", "daily", "weekly"]),
@@ -431,6 +487,8 @@ class HistoricalDataQuerySchema(Schema):
         validate=validate.Range(min=1, max=10000),
         load_default=1000,
     )
+    # Raw aggregation only: continue after the last reading of the previous page
+    cursor = KeysetCursorField(required=False)
 
     @validates_schema
     def validate_date_range(self, data, **kwargs):
@@ -445,6 +503,16 @@ class HistoricalDataQuerySchema(Schema):
                 field_name="start_date",
             )
 
+    @validates_schema
+    def validate_window_length(self, data, **kwargs):
+        """Bound the scanned window; raw readings get a narrower limit."""
+        _validate_window_length(
+            data,
+            MAX_RAW_RANGE_DAYS
+            if data.get("aggregation") == "raw"
+            else MAX_AGGREGATED_RANGE_DAYS,
+        )
+
 
 class StatisticsQuerySchema(Schema):
     """Schema for statistics query parameters."""
@@ -476,6 +544,16 @@ class PerformanceQuerySchema(Schema):
         validate=validate.Range(min=1, max=8760),  # Up to 1 year
         load_default=24,
     )
+    limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=1, max=1000),
+        load_default=None,
+    )
+    offset = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        load_default=0,
+    )
 
 
 class AlertPatternsQuerySchema(Schema):
@@ -514,6 +592,11 @@ class CompareUnitsSchema(Schema):
                 field_name="start_date",
             )
 
+    @validates_schema
+    def validate_window_length(self, data, **kwargs):
+        """Bound the scanned window."""
+        _validate_window_length(data, MAX_AGGREGATED_RANGE_DAYS)
+
 
 class ExportDataQuerySchema(Schema):
     """Schema for export data query parameters."""
@@ -525,7 +608,11 @@ class ExportDataQuerySchema(Schema):
     )
     start_date = fields.DateTime(required=False, format="iso")
     end_date = fields.DateTime(required=False, format="iso")
-    sensor_types = fields.Str(required=False)
+    # Comma-separated in the query string, loaded as a list of sensor types
+    sensor_types = DelimitedList(TrimmedStr(), required=False)
+    # Optional paging; without a limit the whole range is exported
+    limit = fields.Int(required=False, validate=validate.Range(min=1, max=100000))
+    cursor = KeysetCursorField(required=False)
 
     @validates_schema
     def validate_date_range(self, data, **kwargs):
@@ -539,3 +626,8 @@ class ExportDataQuerySchema(Schema):
                 "start_date must be before end_date",
                 field_name="start_date",
             )
+
+    @validates_schema
+    def validate_window_length(self, data, **kwargs):
+        """Bound the exported window of raw readings."""
+        _validate_window_length(data, MAX_RAW_RANGE_DAYS)
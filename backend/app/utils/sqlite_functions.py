@@ -0,0 +1,40 @@
+"""SQL functions SQLite lacks, registered on every new SQLite connection.
+
+Tests and local development run on SQLite, which has no ``stddev_samp``.
+Registering it as an application-defined aggregate lets routes use
+``func.stddev_samp`` on both dialects instead of branching per request.
+"""
+
+import math
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StddevSamp:
+    """Sample standard deviation aggregate using Welford's single-pass update."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def step(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def finalize(self):
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_aggregate("stddev_samp", 1, StddevSamp)
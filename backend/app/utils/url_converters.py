@@ -0,0 +1,29 @@
+"""Custom URL converters registered on the app's URL map.
+
+Routes that take a device identifier use ``<device_id:device_id>`` so ids
+outside the accepted shape are rejected by the router with a 404 before any
+decorator or service call runs.
+"""
+
+import re
+
+from werkzeug.routing import BaseConverter
+
+DEVICE_ID_PATTERN = r"[A-Za-z0-9_.\-]{1,64}"
+DEVICE_ID_RE = re.compile(DEVICE_ID_PATTERN)
+
+
+class DeviceIDConverter(BaseConverter):
+    """Opaque protocol device id: up to 64 letters, digits, ``_``, ``.`` or ``-``."""
+
+    regex = DEVICE_ID_PATTERN
+
+
+def is_valid_device_id(value) -> bool:
+    """Return True if ``value`` is routable through :class:`DeviceIDConverter`."""
+    return isinstance(value, str | int) and bool(DEVICE_ID_RE.fullmatch(str(value)))
+
+
+def init_url_converters(app):
+    """Register the custom converters; must run before blueprints are registered."""
+    app.url_map.converters["device_id"] = DeviceIDConverter
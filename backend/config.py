@@ -24,6 +24,11 @@ class Config:
         "pool_recycle": -1,
         "pool_pre_ping": True,
     }
+    # Optional read replica; read-only analytics routes query it when set
+    _replica_url = os.environ.get("DATABASE_REPLICA_URL")
+    SQLALCHEMY_BINDS: ClassVar[dict[str, str]] = (
+        {"replica": _replica_url} if _replica_url else {}
+    )
 
     # ============================================================
     # EMAIL CONFIGURATION
@@ -69,6 +74,25 @@ class Config:
         os.environ.get("AUTH_RATE_LIMIT", "10"),
     )  # auth requests per minute
 
+    # Authorization - cache per-user role/permission snapshots for a short TTL
+    AUTH_USER_CACHE_ENABLED = (
+        os.environ.get("AUTH_USER_CACHE_ENABLED", "true").lower() == "true"
+    )
+
+    # Audit - hand audit records to a background writer thread so log I/O stays
+    # off the request path (records are written inline if the queue fills up)
+    AUDIT_ASYNC_LOGGING = (
+        os.environ.get("AUDIT_ASYNC_LOGGING", "false").lower() == "true"
+    )
+
+    # Argon2id password hashing cost; tune so one verify fits the login budget.
+    # Existing hashes are upgraded to new parameters on the next successful login.
+    ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST = int(
+        os.environ.get("ARGON2_MEMORY_COST", str(64 * 1024)),
+    )  # KiB
+    ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", "4"))
+
     # Request validation - PR2 Implementation
     MAX_REQUEST_SIZE = int(
         os.environ.get("MAX_REQUEST_SIZE", str(1024 * 1024)),
@@ -77,6 +101,21 @@ class Config:
         os.environ.get("VALIDATE_JSON_REQUESTS", "true").lower() == "true"
     )
 
+    # Analytics/historical - read pre-aggregated PostgreSQL materialized views
+    # (migration 010) and TimescaleDB continuous aggregates (migration 013)
+    # instead of aggregating sensor_readings live. Enable only once the views are
+    # created and a periodic REFRESH / refresh policy is scheduled.
+    ANALYTICS_USE_MATERIALIZED_VIEWS = (
+        os.environ.get("ANALYTICS_USE_MATERIALIZED_VIEWS", "false").lower() == "true"
+    )
+
+    # Historical endpoints - per-query PostgreSQL statement_timeout in ms, so a
+    # runaway range scan fails with 504 instead of holding a pooled connection.
+    # 0 disables the limit.
+    HISTORICAL_STATEMENT_TIMEOUT_MS = int(
+        os.environ.get("HISTORICAL_STATEMENT_TIMEOUT_MS", "10000"),
+    )
+
     # Logging Configuration
     LOG_LEVEL = os.environ.get(
         "LOG_LEVEL",
@@ -387,6 +426,14 @@ class TestingConfig(Config):
     SECRET_KEY = "test-secret-key-not-for-production"
     JWT_SECRET_KEY = "test-jwt-secret-not-for-production"
 
+    # Tests mock user lookups per scenario; cache behaviour is tested explicitly
+    AUTH_USER_CACHE_ENABLED = False
+
+    # Cheap password hashing keeps fixture setup fast
+    ARGON2_TIME_COST = 1
+    ARGON2_MEMORY_COST = 8 * 1024
+    ARGON2_PARALLELISM = 1
+
     # Use PostgreSQL for testing to match production, with SQLite fallback
     # This can be overridden with POSTGRES_TEST_URL environment variable
     _postgres_test_url = os.environ.get(
@@ -0,0 +1,28 @@
+-- Migration 010: Add daily_critical_readings materialized view
+-- Description: Pre-aggregates out-of-range sensor readings per day and sensor type
+-- so /analytics/alerts/patterns reads a small view instead of scanning 30 days of
+-- sensor_readings on every call.
+-- PostgreSQL only (SQLite has no materialized views; the route falls back to the
+-- live aggregate there). Safe to run multiple times (IF NOT EXISTS).
+-- The route only reads this view when ANALYTICS_USE_MATERIALIZED_VIEWS=true.
+
+-- Thresholds must stay in sync with get_alert_patterns() in app/routes/analytics.py
+CREATE MATERIALIZED VIEW IF NOT EXISTS daily_critical_readings AS
+SELECT
+    date(sr.timestamp) AS day,
+    s.sensor_type,
+    count(*) AS reading_count
+FROM sensor_readings sr
+JOIN sensors s ON s.id = sr.sensor_id
+WHERE (s.sensor_type = 'temperature' AND sr.value > 80)
+   OR (s.sensor_type = 'pressure' AND sr.value > 100)
+   OR (s.sensor_type = 'flow' AND sr.value < 10)
+GROUP BY 1, 2;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_critical_readings_day_type
+    ON daily_critical_readings(day, sensor_type);
+
+-- Refresh hourly, e.g. with pg_cron:
+-- SELECT cron.schedule('refresh_daily_critical_readings', '5 * * * *',
+--     'REFRESH MATERIALIZED VIEW CONCURRENTLY daily_critical_readings');
@@ -0,0 +1,23 @@
+-- Migration 012: Add covering composite indexes for time-window sensor queries
+-- Description: Analytics and historical endpoints filter sensor_readings by
+-- sensor (via sensors.unit_id / sensor_type) and a timestamp lower bound.
+-- idx_sensor_readings_timestamp (001) only serves the time predicate; these
+-- composites let per-sensor range scans and the sensors join use an index.
+-- The queries read only sensor_readings.value (plus the sensor_id/timestamp
+-- keys) and sensors.id/name/unit_of_measurement, so INCLUDE-ing those columns
+-- lets PostgreSQL answer them with index-only scans instead of heap fetches.
+-- The DESC timestamp key still serves ORDER BY timestamp DESC LIMIT n without a sort.
+-- Safe to run multiple times (idempotent with IF NOT EXISTS)
+-- Note: requires PostgreSQL 11+. sensor_readings is a TimescaleDB hypertable,
+-- so indexes are created per chunk automatically. On a large live table run
+-- each statement outside a transaction with CREATE INDEX CONCURRENTLY (plain
+-- PostgreSQL) or WITH (timescaledb.transaction_per_chunk) (TimescaleDB) to
+-- avoid blocking writes.
+
+-- Per-sensor time range scans (trends, historical, exports)
+CREATE INDEX IF NOT EXISTS idx_sensor_readings_sensor_ts_covering
+    ON sensor_readings(sensor_id, timestamp DESC) INCLUDE (value);
+
+-- Resolve a unit's sensors (optionally by type) without scanning sensors
+CREATE INDEX IF NOT EXISTS idx_sensors_unit_type_covering
+    ON sensors(unit_id, sensor_type) INCLUDE (id, name, unit_of_measurement);
@@ -0,0 +1,13 @@
+-- Migration 012: Add covering composite indexes for time-window sensor queries (SQLite version)
+-- Description: Composite indexes for per-sensor time range scans and unit/sensor-type
+-- lookups used by the analytics and historical endpoints. SQLite has no INCLUDE
+-- clause, so the read columns are appended as trailing key columns instead.
+-- Safe to run multiple times (idempotent with IF NOT EXISTS)
+
+-- Per-sensor time range scans (trends, historical, exports)
+CREATE INDEX IF NOT EXISTS idx_sensor_readings_sensor_ts_covering
+    ON sensor_readings(sensor_id, timestamp DESC, value);
+
+-- Resolve a unit's sensors (optionally by type) without scanning sensors
+CREATE INDEX IF NOT EXISTS idx_sensors_unit_type_covering
+    ON sensors(unit_id, sensor_type, id, name, unit_of_measurement);
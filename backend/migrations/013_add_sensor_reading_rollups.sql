@@ -0,0 +1,71 @@
+-- Migration 013: Add hourly/daily/weekly sensor_readings continuous aggregates
+-- Description: Pre-aggregates readings per sensor and time bucket so the
+-- bucketed /historical/data and /historical/compare/units queries read a few
+-- thousand rows instead of every raw reading in the window. Each view keeps
+-- sum/min/max/count, so buckets from several sensors can be re-combined with a
+-- count-weighted average.
+-- PostgreSQL + TimescaleDB only (SQLite falls back to the live aggregate).
+-- Safe to run multiple times (IF NOT EXISTS / if_not_exists).
+-- The routes only read these views when ANALYTICS_USE_MATERIALIZED_VIEWS=true.
+-- materialized_only = false keeps the newest, not yet materialized buckets
+-- visible through real-time aggregation.
+-- time_bucket('1 week') starts weeks on Monday, matching date_trunc('week').
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS sensor_readings_hourly
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 hour', timestamp) AS bucket,
+    sensor_id,
+    sum(value) AS value_sum,
+    min(value) AS value_min,
+    max(value) AS value_max,
+    count(*) AS sample_count
+FROM sensor_readings
+GROUP BY bucket, sensor_id
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS sensor_readings_daily
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 day', timestamp) AS bucket,
+    sensor_id,
+    sum(value) AS value_sum,
+    min(value) AS value_min,
+    max(value) AS value_max,
+    count(*) AS sample_count
+FROM sensor_readings
+GROUP BY bucket, sensor_id
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS sensor_readings_weekly
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 week', timestamp) AS bucket,
+    sensor_id,
+    sum(value) AS value_sum,
+    min(value) AS value_min,
+    max(value) AS value_max,
+    count(*) AS sample_count
+FROM sensor_readings
+GROUP BY bucket, sensor_id
+WITH NO DATA;
+
+-- Keep recent buckets refreshed; older history is materialized by the first
+-- refresh, e.g. CALL refresh_continuous_aggregate('sensor_readings_daily', NULL, NULL);
+SELECT add_continuous_aggregate_policy('sensor_readings_hourly',
+    start_offset => INTERVAL '3 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '30 minutes',
+    if_not_exists => TRUE);
+
+SELECT add_continuous_aggregate_policy('sensor_readings_daily',
+    start_offset => INTERVAL '7 days',
+    end_offset => INTERVAL '1 day',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE);
+
+SELECT add_continuous_aggregate_policy('sensor_readings_weekly',
+    start_offset => INTERVAL '4 weeks',
+    end_offset => INTERVAL '1 week',
+    schedule_interval => INTERVAL '1 day',
+    if_not_exists => TRUE);
@@ -0,0 +1,19 @@
+-- Migration 014: Add a BRIN index for wide timestamp ranges on sensor_readings
+-- Description: Telemetry is appended in timestamp order, so a BRIN index on
+-- timestamp stays a few pages per chunk while still letting wide range
+-- filters (exports, multi-day statistics) skip block ranges outside the
+-- window. Per-sensor range scans keep using the covering
+-- (sensor_id, timestamp DESC) INCLUDE (value) index from migration 012, whose
+-- leading sensor_id column also makes idx_sensor_readings_sensor_id (001)
+-- redundant, so that index is dropped to save write amplification.
+-- idx_sensor_readings_timestamp (001) is kept for ORDER BY timestamp DESC LIMIT n.
+-- Safe to run multiple times (idempotent with IF [NOT] EXISTS)
+-- Note: PostgreSQL only; SQLite has no BRIN indexes. On a large live table run
+-- the CREATE outside a transaction with CREATE INDEX CONCURRENTLY (plain
+-- PostgreSQL) or WITH (timescaledb.transaction_per_chunk) (TimescaleDB) to
+-- avoid blocking writes. Check the plans with EXPLAIN (ANALYZE, BUFFERS).
+
+CREATE INDEX IF NOT EXISTS idx_sensor_readings_ts_brin
+    ON sensor_readings USING BRIN (timestamp) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_sensor_readings_sensor_id;